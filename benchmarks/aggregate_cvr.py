@@ -0,0 +1,101 @@
+"""
+Compare the columnar CVR aggregation in CastVoteRecord against the previous row-wise implementation.
+
+Usage: python benchmarks/aggregate_cvr.py [n_ballots ...]
+"""
+
+import decimal
+import random
+import sys
+import time
+import tracemalloc
+
+from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.util import DL2LD, LD2DL
+
+
+def rowwise_aggregate_cvr(cvr_dict):
+    """Aggregation as implemented before the columnar pipeline, kept here as the reference."""
+
+    unique_fields = {"weight"}
+    aggregate_fields = sorted([k for k in cvr_dict if k not in unique_fields])
+
+    cvr_dict["aggregation_id"] = [
+        tuple((k, tuple(d[k])) if k == "ranks" else (k, d[k]) for k in aggregate_fields) for d in DL2LD(cvr_dict)
+    ]
+
+    cvr_ld = DL2LD(cvr_dict)
+
+    disaggregation_info = {d["aggregation_id"]: [] for d in cvr_ld}
+    aggregate_counter = {d["aggregation_id"]: decimal.Decimal(0) for d in cvr_ld}
+
+    for idx, d in enumerate(cvr_ld):
+        disaggregation_info[d["aggregation_id"]].append(
+            {"ballot_order": idx, **{k: v for k, v in d.items() if k in unique_fields}}
+        )
+        aggregate_counter[d["aggregation_id"]] += d["weight"]
+
+    aggregated_cvr_LD = [
+        {**{k: list(v) if k == "ranks" else v for k, v in dict(agg_id).items()}, "weight": aggregate_counter[agg_id]}
+        for agg_id in aggregate_counter.keys()
+    ]
+
+    return LD2DL(aggregated_cvr_LD), disaggregation_info
+
+
+def make_cvr(n_ballots, rank_limit=5, n_precincts=20, seed=0):
+    rng = random.Random(seed)
+    marks = ["A", "B", "C", "D", "E", "F", BallotMarks.SKIPPED, BallotMarks.OVERVOTE]
+    mark_weights = [12, 10, 8, 6, 4, 2, 6, 1]
+    return {
+        "ranks": [rng.choices(marks, mark_weights, k=rank_limit) for _ in range(n_ballots)],
+        "precinct": [f"precinct{rng.randrange(n_precincts)}" for _ in range(n_ballots)],
+        "weight": [decimal.Decimal("1")] * n_ballots,
+    }
+
+
+def measure(func, cvr):
+
+    # time and memory are measured on separate runs since tracing allocations slows the run down
+    start = time.perf_counter()
+    result = func({k: list(v) for k, v in cvr.items()})
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func({k: list(v) for k, v in cvr.items()})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def main(sizes):
+
+    columnar = CastVoteRecord.__new__(CastVoteRecord)._aggregate_cvr
+
+    print(f"{'ballots':>10} {'impl':>9} {'seconds':>9} {'peak MB':>9} {'rows':>8}")
+    for n_ballots in sizes:
+
+        cvr = make_cvr(n_ballots)
+
+        results = {}
+        for name, func in [("row-wise", rowwise_aggregate_cvr), ("columnar", columnar)]:
+            (aggregated, disaggregation), elapsed, peak = measure(func, cvr)
+            results[name] = (aggregated, disaggregation)
+            print(f"{n_ballots:>10} {name:>9} {elapsed:>9.2f} {peak / 2**20:>9.1f} {len(aggregated['weight']):>8}")
+
+        # the columnar path returns the aggregated row of each ballot in place of per-row ballot lists
+        rowwise_aggregated, disaggregation_info = results["row-wise"]
+        rowwise_inverse = [0] * n_ballots
+        for row_idx, row_ballots in enumerate(disaggregation_info.values()):
+            for d in row_ballots:
+                rowwise_inverse[d["ballot_order"]] = row_idx
+
+        columnar_aggregated, columnar_inverse = results["columnar"]
+        if rowwise_aggregated != columnar_aggregated or rowwise_inverse != columnar_inverse.tolist():
+            raise RuntimeError(f"columnar aggregation differs from row-wise aggregation at {n_ballots} ballots")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,60 @@
+"""
+Compare pile based tabulation in RCV against rescanning every ballot each round.
+
+Usage: python benchmarks/tabulate.py [n_ballots ...]
+"""
+
+import random
+import sys
+import time
+
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.variants import SingleWinner
+
+
+class RescanSingleWinner(SingleWinner):
+    _pile_tabulation = False
+
+
+def make_cvr(n_ballots, n_candidates=24, rank_limit=10, seed=0):
+    rng = random.Random(seed)
+    candidates = [f"candidate{idx}" for idx in range(n_candidates)]
+    # skew support so candidates are eliminated one at a time over many rounds
+    candidate_weights = [n_candidates - idx for idx in range(n_candidates)]
+    ranks = []
+    for _ in range(n_ballots):
+        ballot = rng.choices(candidates, candidate_weights, k=rank_limit)
+        if rng.random() < 0.05:
+            ballot[rng.randrange(rank_limit)] = BallotMarks.SKIPPED
+        ranks.append(ballot)
+    return {"ranks": ranks, "weight": [1] * n_ballots}
+
+
+def measure(rcv_class, cvr):
+    random.seed(0)
+    start = time.perf_counter()
+    rcv = rcv_class(parsed_cvr={k: list(v) for k, v in cvr.items()})
+    return rcv, time.perf_counter() - start
+
+
+def main(sizes):
+
+    print(f"{'ballots':>10} {'engine':>8} {'seconds':>9} {'rounds':>7}")
+    for n_ballots in sizes:
+
+        cvr = make_cvr(n_ballots)
+
+        results = {}
+        for name, rcv_class in [("rescan", RescanSingleWinner), ("piles", SingleWinner)]:
+            rcv, elapsed = measure(rcv_class, cvr)
+            results[name] = rcv
+            print(f"{n_ballots:>10} {name:>8} {elapsed:>9.2f} {rcv.n_rounds():>7}")
+
+        rescan, piles = results["rescan"], results["piles"]
+        for round_num in range(1, rescan.n_rounds() + 1):
+            if rescan.get_round_tally_dict(round_num) != piles.get_round_tally_dict(round_num):
+                raise RuntimeError(f"pile tabulation differs from rescan tabulation at {n_ballots} ballots")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 50_000])
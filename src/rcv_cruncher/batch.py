@@ -2,7 +2,7 @@
 Contains functions used to analyze a batch of RCV elections.
 """
 
-from typing import Dict, Type, List
+from typing import Dict, Type, List, Optional
 
 import json
 import os
@@ -19,9 +19,11 @@ import numpy as np
 import tqdm
 
 from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import WriteinMatcher
 from rcv_cruncher.rcv.base import RCV
-from rcv_cruncher.rcv.variants import get_rcv_dict
+from rcv_cruncher.rcv.variants import get_rcv_dict, SingleWinner, Until2
 from rcv_cruncher.parsers import get_parser_dict
+from rcv_cruncher.sweep import write_rule_set_sweep
 
 import rcv_cruncher.util as util
 
@@ -31,11 +33,56 @@ rcv_dict = get_rcv_dict()
 parser_dict = get_parser_dict()
 
 
-def _new_rcv_contest(contest_dict: Dict) -> Type[RCV]:
+def _new_rcv_contest(contest_dict: Dict, shared_contests: Optional[Dict] = None) -> Type[RCV]:
     """
-    Pass in a dictionary and run the constructor function stored within it
+    Pass in a dictionary and run the constructor function stored within it. SingleWinner and Until2 contests listed
+    in `shared_contests` are taken from one Until2 tabulation, see _shared_until2_contests.
     """
-    return contest_dict["rcv_type"](**{k: v for k, v in contest_dict.items() if k != "rcv_type"})
+    contest_args = {k: v for k, v in contest_dict.items() if k != "rcv_type"}
+
+    key = _contest_key(contest_dict)
+    if shared_contests is None or key not in shared_contests:
+        return contest_dict["rcv_type"](**_variant_args(contest_dict["rcv_type"], contest_args))
+
+    until2 = shared_contests[key]
+    if until2 is None:
+        until2 = Until2(**_variant_args(Until2, contest_args))
+        shared_contests[key] = until2
+    else:
+        # second contest of the pair, the tabulation is no longer needed afterwards
+        del shared_contests[key]
+
+    if contest_dict["rcv_type"] is Until2:
+        return until2
+    return SingleWinner(cvr=until2, **_variant_args(SingleWinner, contest_args))
+
+
+def _variant_args(rcv_type: Type[RCV], contest_args: Dict) -> Dict:
+    """
+    Leave out contest settings the variant does not take, e.g. convergence_tolerance for variants other than STVMeek.
+    """
+    return {k: v for k, v in contest_args.items() if util.takes_argument(rcv_type, k)}
+
+
+def _contest_key(contest_dict: Dict) -> str:
+    """
+    Contests with the same key differ only in RCV variant.
+    """
+    return repr(sorted((k, v) for k, v in contest_dict.items() if k != "rcv_type"))
+
+
+def _shared_until2_contests(contest_set: List[Dict]) -> Dict:
+    """
+    Find contests run as both a SingleWinner and an Until2 contest. Both results can come from one Until2 tabulation,
+    see Until2.
+
+    :return: Dictionary with one key per contest pair, see _contest_key, for _new_rcv_contest to hold the shared
+    Until2 contest in.
+    """
+    variants = collections.defaultdict(set)
+    for contest in contest_set:
+        variants[_contest_key(contest)].add(contest["rcv_type"])
+    return {key: None for key, rcv_types in variants.items() if {SingleWinner, Until2} <= rcv_types}
 
 
 def _flatten_rcv_stats(stats: List[pd.DataFrame]) -> pd.DataFrame:
@@ -55,6 +102,8 @@ def _flatten_rcv_stats(stats: List[pd.DataFrame]) -> pd.DataFrame:
         "exclude_writein_marks",
         "treat_combined_writeins_as_exhaustable_duplicates",
         "multi_winner_rounds",
+        "batch_elimination",
+        "convergence_tolerance",
         "n_candidates",
         "rank_limit",
         "restrictive_rank_limit",
@@ -250,6 +299,12 @@ def _read_contest_set(contest_set_path, override_cvr_root_dir=None):
     # convert df to listOdicts, one dict per row
     competitions = contest_set_df.to_dict("records")
 
+    # one write-in matcher is shared by every contest in the run
+    writein_matcher = WriteinMatcher(
+        partial_match_words=run_config["writein_partial_match_words"],
+        anycase_exact_match_words=run_config["writein_anycase_exact_match_words"],
+    )
+
     # add dop, uid, cvr_path_root
     valid_competitions = []
     for comp in competitions:
@@ -278,6 +333,8 @@ def _read_contest_set(contest_set_path, override_cvr_root_dir=None):
         del copy_comp["extra_parser_args"]
         del copy_comp["ignore_contest"]
 
+        copy_comp["writein_matcher"] = writein_matcher
+
         valid_competitions.append(copy_comp)
 
     # store file locations
@@ -524,6 +581,10 @@ class _Steps(abc.ABC):
 
 
 class _CrunchSteps(_Steps):
+    def __init__(self, *args, shared_contests=None):
+        super().__init__(*args)
+        self.shared_contests = shared_contests
+
     def generate_steps(self):
 
         return collections.OrderedDict(
@@ -532,7 +593,7 @@ class _CrunchSteps(_Steps):
                     "init_rcv",
                     {
                         "f": _new_rcv_contest,
-                        "args": [self.contest],
+                        "args": [self.contest, self.shared_contests],
                         "condition": True,
                         "fail_with": [],
                         "depends_on": [],
@@ -782,6 +843,22 @@ class _CrunchSteps(_Steps):
                         "return_key": "split_stats",
                     },
                 ),
+                (
+                    "rule_set_sweep",
+                    {
+                        "f": write_rule_set_sweep,
+                        "args": [
+                            self.state_data["rcv_object"],
+                            self.results_dir,
+                            self.output_config.get("rule_set_sweep_grid"),
+                            self.output_config.get("rule_set_sweep_processes", 1),
+                        ],
+                        "condition": self.output_config.get("rule_set_sweep"),
+                        "depends_on": ["init_rcv"],
+                        "fail_with": [],
+                        "return_key": None,
+                    },
+                ),
             ]
         )
 
@@ -853,6 +930,10 @@ def _crunch_contest_set(contest_set, output_config, path_to_output, fresh_output
         os.remove(error_log_path.parent / (error_log_path.stem + "_EMPTY.csv"))
 
     n_errors = 0
+
+    # contests run as both SingleWinner and Until2 share one tabulation
+    shared_contests = _shared_until2_contests(contest_set)
+
     #########################
     # LOOP TROUGH CONTESTS
 
@@ -864,7 +945,9 @@ def _crunch_contest_set(contest_set, output_config, path_to_output, fresh_output
         if n_errors:
             pbar_desc = f"[{n_errors} ERRORS SO FAR] " + pbar_desc
 
-        steps = _CrunchSteps(contest, output_config, converted_cvr_dir, results_dir, pbar_desc)
+        steps = _CrunchSteps(
+            contest, output_config, converted_cvr_dir, results_dir, pbar_desc, shared_contests=shared_contests
+        )
         steps.update_error_log_writers([error_logger])
         steps.run_steps()
 
@@ -11,10 +11,12 @@ import collections
 import re
 import pathlib
 
+import numpy as np
 import pandas as pd
 
-from rcv_cruncher.util import DL2LD, LD2DL
-from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.util import LazyList
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
+from rcv_cruncher.matrix import BallotMatrix
 from rcv_cruncher.cvr.tables import CastVoteRecord_tables
 from rcv_cruncher.cvr.stats import CastVoteRecord_stats
 
@@ -26,6 +28,9 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
     of the same cast vote record from an election.
     """
 
+    # whether tabulation may merge aggregated rows that share a rank pattern, see _get_rank_groups
+    _group_rank_patterns = True
+
     @staticmethod
     def calc_stats(
         cvr: Type[CastVoteRecord],
@@ -70,7 +75,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         save_dir = pathlib.Path(save_dir)
         save_dir.mkdir(exist_ok=True, parents=True)
 
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
         save_path = save_dir / f"{uid}.csv"
         cvr.get_cvr_table(table_format=table_format).to_csv(save_path, index=False)
 
@@ -97,7 +102,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type save_dir: Union[str, pathlib.Path]
         """
         count_df, percent_df = cvr.get_cumulative_ranking_tables()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "cumulative_ranking"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -126,7 +131,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type save_dir: Union[str, pathlib.Path]
         """
         count_df, percent_df, percent_no_exhaust_df = cvr.get_first_second_tables()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "first_second_choices"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -156,7 +161,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type save_dir: Union[str, pathlib.Path]
         """
         df = cvr.get_rank_usage_table()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "rank_usage"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -184,7 +189,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type save_dir: Union[str, pathlib.Path]
         """
         count_df, percent_df = cvr.get_crossover_tables()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "opponent_crossover"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -213,7 +218,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type save_dir: Union[str, pathlib.Path]
         """
         count_df, percent_df, condorcet_winner = cvr.get_condorcet_tables()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "condorcet"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -249,7 +254,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         """
 
         df = cvr.get_annotated_cvr_table()
-        uid = cvr.get_stats()[0]["unique_id"].item()
+        uid = cvr.unique_id
 
         save_path = pathlib.Path(save_dir) / "annotated_cvr"
         save_path.mkdir(exist_ok=True, parents=True)
@@ -269,13 +274,17 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
         disable_aggregation: bool = False,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
     ) -> None:
         """
         Constructor for CastVoteRecord.
 
         Either **parser_func** and **parser_args** must both be passed or an already parsed CVR must be passed as **parsed_cvr**.
 
-        Constructor parses CVR file, if needed, and computes default ballot statistics.
+        Constructor parses CVR file, if needed. Default ballot statistics are computed on first use, see **eager_stats**.
 
         :param jurisdiction: Name of election jurisdiction, defaults to ""
         :type jurisdiction: str, optional
@@ -299,7 +308,21 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         :type split_fields: Optional[List], optional
         :param disable_aggregation: Advanced option. If True, CVR is not represented interally in aggregated form. If False, CVR remains as parsed. Defaults to False. Internal aggregation of the CVR is meant to speed up tabulation and statistics calculation, but can be incompatible with some RCV variants, such as Cambridge's STV whole ballot transfer variant.
         :type disable_aggregation: bool, optional
+        :param ballot_matrix: Advanced option. If True, the parsed CVR ranks are stored as an integer-coded matrix of unique ranking patterns and ballots are represented by read-only BallotMarks views over that matrix. Reduces memory use on very large CVRs. Defaults to False.
+        :type ballot_matrix: bool, optional
+        :param writein_matcher: Rules used to recognize write-in candidates when combining write-in marks. If None, the default `BallotMarks` write-in match words are used. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
+        :param cvr: An already constructed CastVoteRecord, or RCV object, to share parsed CVR data with. If passed, the parsed, aggregated and default rule set CVR and the CVR statistics are reused read-only from it instead of being built again, and all other constructor arguments except **disable_aggregation**, which must match, are ignored. Useful for tabulating the same CVR with several RCV variants. Defaults to None
+        :type cvr: Optional[CastVoteRecord], optional
+        :param eager_stats: If True, default statistics are computed during construction. If False, they are computed the first time they are needed, by `get_stats` or a table, and kept afterwards. Defaults to False
+        :type eager_stats: bool, optional
         """
+        if cvr is not None:
+            self._share_cvr(cvr, disable_aggregation)
+            if eager_stats:
+                self._get_summary_cvr_stat_table()
+            return
+
         # ID INFO
         self.jurisdiction = jurisdiction
         self.state = state
@@ -311,6 +334,9 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         self.unique_id = self._unique_id()
 
         self._disable_aggregation = disable_aggregation
+        self._ballot_matrix = None
+        self._rank_groups = None
+        self._integer_weights = None
 
         self._id_df = pd.DataFrame(
             {
@@ -332,10 +358,13 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         # - validate cvr
         validated_cvr = self._validate_cvr(parsed_cvr)
 
-        # - aggregate cvr
-        self._disaggregation_info = {}
+        # - aggregate cvr, keeping the aggregated row of each parsed ballot for disaggregation
+        self._ballot_weights = validated_cvr["weight"]
+        self._aggregation_inverse = None
+        self._disaggregation_order = None
+        self._disaggregation_index = None
         if not self._disable_aggregation:
-            cvr, self._disaggregation_info = self._aggregate_cvr(validated_cvr)
+            cvr, self._aggregation_inverse = self._aggregate_cvr(validated_cvr)
         else:
             cvr = validated_cvr
 
@@ -343,8 +372,19 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         candidate_set = set(cvr["ranks"][0]).union(*[set(ranks) for ranks in cvr["ranks"][0:]])
         candidate_set = candidate_set.difference({BallotMarks.OVERVOTE, BallotMarks.SKIPPED})
 
-        # - convert ranks to BallotMarks objects
-        cvr["ballot_marks"] = [BallotMarks(ranks) for ranks in cvr["ranks"]]
+        # - classify every mark name once for write-in combining
+        if writein_matcher is None:
+            writein_matcher = WriteinMatcher()
+        self._writein_matcher = writein_matcher.classify(
+            candidate_set.union({BallotMarks.OVERVOTE, BallotMarks.SKIPPED, BallotMarks.WRITEIN})
+        )
+
+        # - convert ranks to BallotMarks objects, or to views over an encoded matrix
+        if ballot_matrix:
+            self._ballot_matrix = BallotMatrix.from_ranks(cvr["ranks"])
+            cvr["ballot_marks"] = self._ballot_matrix.ballot_marks()
+        else:
+            cvr["ballot_marks"] = [BallotMarks(ranks) for ranks in cvr["ranks"]]
         del cvr["ranks"]
 
         # - make a default rule set that is just the parsed cvr
@@ -352,19 +392,75 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         self._candidate_sets = {}
         self._rule_sets = {}
 
+        # rule results keyed by (rank pattern, frozen rule set), shared by every ballot with that pattern
+        self._rule_memo = {}
+        self._rule_memo_info = {"hits": 0, "misses": 0}
+
         self._default_rule_set_name = "__cvr"
         self._rule_sets.update({self._default_rule_set_name: BallotMarks.new_rule_set()})
         self._modified_cvrs.update({self._default_rule_set_name: cvr})
         self._candidate_sets.update({self._default_rule_set_name: BallotMarks(candidate_set)})
 
-        # STAT INFO
+        # STAT INFO, computed on first use, see _get_cvr_stat_table
+        self._shared_cvr = None
         self._cvr_stat_table = None
-        self._compute_cvr_stat_table()
-
         self._summary_cvr_stat_table = None
-        self._compute_summary_cvr_stat_table()
+        self._summary_cvr_split_stat_table = None
+        self._stats_memo = {}
+        if eager_stats:
+            self._get_summary_cvr_stat_table()
+
+    def _share_cvr(self, cvr: CastVoteRecord, disable_aggregation: bool) -> None:
+
+        if disable_aggregation != cvr._disable_aggregation:
+            raise RuntimeError(
+                f"shared cvr has disable_aggregation={cvr._disable_aggregation} but {disable_aggregation} is required."
+            )
 
+        # build lazily computed data on the shared object, so every object sharing it reuses the same copy
+        cvr._encoded_ballots()
+        cvr._get_integer_weights()
+        if self._group_rank_patterns == cvr._group_rank_patterns:
+            cvr._get_rank_groups()
+
+        # ID INFO
+        self.jurisdiction = cvr.jurisdiction
+        self.state = cvr.state
+        self.date = cvr.date
+        self.year = cvr.year
+        self.office = cvr.office
+        self.notes = cvr.notes
+        self.split_fields = cvr.split_fields
+        self.unique_id = cvr.unique_id
+        self._id_df = cvr._id_df
+
+        # DEFAULT CVR
+        self._disable_aggregation = cvr._disable_aggregation
+        self._ballot_matrix = cvr._ballot_matrix
+        self._rank_groups = None
+        if self._group_rank_patterns == cvr._group_rank_patterns:
+            self._rank_groups = cvr._rank_groups
+        self._integer_weights = cvr._integer_weights
+        self._ballot_weights = cvr._ballot_weights
+        self._aggregation_inverse = cvr._aggregation_inverse
+        self._disaggregation_order = cvr._disaggregation_order
+        self._disaggregation_index = cvr._disaggregation_index
+        self._writein_matcher = cvr._writein_matcher
+
+        # rule sets added later belong to this object only, rule results are shared
+        self._modified_cvrs = dict(cvr._modified_cvrs)
+        self._candidate_sets = dict(cvr._candidate_sets)
+        self._rule_sets = dict(cvr._rule_sets)
+        self._rule_memo = cvr._rule_memo
+        self._rule_memo_info = cvr._rule_memo_info
+        self._default_rule_set_name = cvr._default_rule_set_name
+
+        # STAT INFO, taken from the shared object on first use so it is only computed once
+        self._shared_cvr = cvr
+        self._cvr_stat_table = None
+        self._summary_cvr_stat_table = None
         self._summary_cvr_split_stat_table = None
+        self._stats_memo = {}
 
     # CVR MODS
     def _validate_cvr(self, cvr_dict: Dict[str, List]) -> Dict[str, List]:
@@ -401,7 +497,24 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
 
         return cvr_dict
 
-    def _aggregate_cvr(self, cvr_dict: Dict[str, List]) -> Dict[str, List]:
+    @staticmethod
+    def _factorize(values: Union[List, np.ndarray]) -> np.ndarray:
+        """Integer code for each value, numbered in order of first appearance.
+
+        :param values: Column of hashable values.
+        :type values: Union[List, np.ndarray]
+        :return: Array of codes.
+        :rtype: np.ndarray
+        """
+        codes, _ = pd.factorize(pd.Series(values, dtype=object).to_numpy() if isinstance(values, list) else values)
+        # pandas folds all missing values into one code, fall back to plain dict semantics to match the
+        # key lookups that aggregation has always used
+        if (codes < 0).any():
+            lookup = {}
+            codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int64, count=len(values))
+        return codes
+
+    def _aggregate_cvr(self, cvr_dict: Dict[str, List]) -> Tuple[Dict[str, List], np.ndarray]:
 
         # any unique CVR fields?
         # unique_fields = set([k for k, v in cvr_dict.items() if k != "ranks" and len(v) == len(set(v))])
@@ -411,56 +524,76 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         # all other fields will be used for aggregation
         aggregate_fields = sorted([k for k in cvr_dict if k not in unique_fields])
 
-        # create hashable ID out of aggregation key value pairs
-        cvr_dict["aggregation_id"] = [
-            tuple((k, tuple(d[k])) if k == "ranks" else (k, d[k]) for k in aggregate_fields) for d in DL2LD(cvr_dict)
-        ]
+        # factorize each rank column and each other aggregation field into integer codes and fold them
+        # into a single group code per ballot, numbered by first appearance
+        n_ballots = len(cvr_dict["ranks"])
+        rank_array = np.empty((n_ballots, len(cvr_dict["ranks"][0])), dtype=object)
+        rank_array[:] = cvr_dict["ranks"]
 
-        # sum up weight by aggregate ID and store unaggregated fields for later disaggregation
-        cvr_ld = DL2LD(cvr_dict)
+        columns = [rank_array[:, col_idx] for col_idx in range(rank_array.shape[1])]
+        columns += [cvr_dict[k] for k in aggregate_fields if k != "ranks"]
 
-        # maintainence of key insertion order is critical to this implementation
-        disaggregation_info = {d["aggregation_id"]: [] for d in cvr_ld}
-        aggregate_counter = {d["aggregation_id"]: decimal.Decimal(0) for d in cvr_ld}
+        group_codes = np.zeros(n_ballots, dtype=np.int64)
+        for column in columns:
+            column_codes = self._factorize(column)
+            group_codes, _ = pd.factorize(group_codes * (column_codes.max() + 1) + column_codes)
+        del rank_array, columns
 
-        for idx, d in enumerate(cvr_ld):
-            disaggregation_info[d["aggregation_id"]].append(
-                {"ballot_order": idx, **{k: v for k, v in d.items() if k in unique_fields}}
-            )
-            aggregate_counter[d["aggregation_id"]] += d["weight"]
+        n_groups = int(group_codes.max()) + 1
+        first_rows = np.unique(group_codes, return_index=True)[1].tolist()
 
-        aggregated_cvr_LD = [
-            {
-                **{k: list(v) if k == "ranks" else v for k, v in dict(agg_id).items()},
-                "weight": aggregate_counter[agg_id],
-            }
-            for agg_id in aggregate_counter.keys()
-        ]
+        # sum up weight by group, in ballot order
+        weights = np.empty(n_ballots, dtype=object)
+        weights[:] = cvr_dict["weight"]
+        group_weights = np.full(n_groups, decimal.Decimal(0), dtype=object)
+        np.add.at(group_weights, group_codes, weights)
+
+        aggregated_cvr_DL = {
+            k: [list(cvr_dict[k][idx]) if k == "ranks" else cvr_dict[k][idx] for idx in first_rows]
+            for k in aggregate_fields
+        }
+        aggregated_cvr_DL["weight"] = group_weights.tolist()
+
+        return aggregated_cvr_DL, group_codes
 
-        aggregated_cvr_DL = LD2DL(aggregated_cvr_LD)
+    def _disaggregation_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Disaggregated ballots are ordered by aggregated row, then by original ballot order within each row.
+
+        :return: Original ballot position and aggregated row of each disaggregated ballot.
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
+        if self._disaggregation_order is None:
+            self._disaggregation_order = np.argsort(self._aggregation_inverse, kind="stable")
+            self._disaggregation_index = self._aggregation_inverse[self._disaggregation_order]
+        return self._disaggregation_order, self._disaggregation_index
+
+    def _disaggregate_values(self, values: List) -> LazyList:
+        """Repeat each aggregated row value for every ballot in the row.
+
+        :param values: One value per aggregated row.
+        :type values: List
+        :return: One value per disaggregated ballot.
+        :rtype: LazyList
+        """
+        _, index = self._disaggregation_arrays()
+        return LazyList(len(index), lambda pos: values[index[pos]])
 
-        return aggregated_cvr_DL, disaggregation_info
+    def _disaggregated_weights(self) -> LazyList:
+        """
+        :return: Parsed weight of each disaggregated ballot.
+        :rtype: LazyList
+        """
+        order, _ = self._disaggregation_arrays()
+        weights = self._ballot_weights
+        return LazyList(len(order), lambda pos: weights[order[pos]])
 
     def _disaggregate_cvr(self, cvr_dict: Dict[str, List]) -> Dict[str, List]:
 
-        disagg_info = self._disaggregation_info
-        disagg_info_keys = list(self._disaggregation_info.keys())
-
-        # copy aggregated fields and re-place unique fields removed during aggregation process
-        cvr_LD = DL2LD(cvr_dict)
-        cvr_LD = [
-            [
-                {
-                    **{k: v for k, v in agg_d.items() if k != "weight"},
-                    **{k: v for k, v in unique_d.items() if k != "ballot_order"},
-                }
-                for unique_d in disagg_info[disagg_info_keys[idx]]
-            ]
-            for idx, agg_d in enumerate(cvr_LD)
-        ]
-        cvr_LD = [d for sublist in cvr_LD for d in sublist]
-
-        return LD2DL(cvr_LD)
+        # repeat aggregated fields and re-place the weights removed during aggregation process
+        disaggregated_cvr = {k: self._disaggregate_values(v) for k, v in cvr_dict.items() if k != "weight"}
+        disaggregated_cvr["weight"] = self._disaggregated_weights()
+
+        return disaggregated_cvr
 
     def _unique_id(self) -> str:
         pieces = []
@@ -483,13 +616,106 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
             raise RuntimeError(f"rule set {rule_set_name} has not yet been added using add_rule_set().")
 
         cvr = {k: v for k, v in self.get_cvr_dict(disaggregate=False).items()}
-        cvr["ballot_marks"] = [b.copy() for b in cvr["ballot_marks"]]
 
-        for ballot in cvr["ballot_marks"]:
-            ballot.apply_rules(**self._rule_sets[rule_set_name])
+        # rules are applied to unique ranking patterns on an encoded matrix of the default cvr
+        matrix = self._encoded_ballots()
+
+        rule_set = BallotMarks.new_rule_set(**self._rule_sets[rule_set_name])
+        frozen_rule_set = frozenset(rule_set.items())
+
+        # look up each pattern in the memo, only patterns not seen with this rule set before are computed
+        row_ballots = [None] * matrix.n_unique()
+        missing_rows = []
+        for row_idx in range(matrix.n_unique()):
+            memo_key = (matrix.row_marks(row_idx), frozen_rule_set)
+            if memo_key in self._rule_memo:
+                row_ballots[row_idx] = self._rule_memo[memo_key]
+            else:
+                missing_rows.append(row_idx)
+
+        if missing_rows:
+            computed = matrix.row_subset(missing_rows).apply_rule_set(rule_set, self._writein_matcher)
+            for row_idx, ballot in zip(missing_rows, computed):
+                row_ballots[row_idx] = ballot
+                self._rule_memo[(matrix.row_marks(row_idx), frozen_rule_set)] = ballot
+
+        self._rule_memo_info["misses"] += len(missing_rows)
+        self._rule_memo_info["hits"] += len(matrix) - len(missing_rows)
+
+        cvr["ballot_marks"] = [row_ballots[row_idx] for row_idx in matrix.inverse.tolist()]
 
         self._modified_cvrs.update({rule_set_name: cvr})
 
+    def _encoded_ballots(self) -> BallotMatrix:
+        # list-backed cvrs only build the matrix once it is needed
+        if self._ballot_matrix is None:
+            ballot_marks = self._modified_cvrs[self._default_rule_set_name]["ballot_marks"]
+            self._ballot_matrix = BallotMatrix.from_ranks([b.marks for b in ballot_marks])
+        return self._ballot_matrix
+
+    def _get_rank_groups(self) -> Tuple[List[int], List[List[int]]]:
+        """Second level of aggregation. Aggregated CVR rows are grouped by their rank pattern alone, ignoring
+        any other CVR fields, so that ballots with unique IDs or other unique fields still collapse together.
+        Groups are numbered in order of first appearance. If aggregation or rank pattern grouping is disabled
+        every row is its own group.
+
+        :return: Group number of each aggregated row, and the aggregated row positions belonging to each group.
+        :rtype: Tuple[List[int], List[List[int]]]
+        """
+        if self._rank_groups is None:
+
+            if self._disable_aggregation or not self._group_rank_patterns:
+                n_rows = len(self._modified_cvrs[self._default_rule_set_name]["ballot_marks"])
+                group_index = list(range(n_rows))
+                group_rows = [[row_idx] for row_idx in group_index]
+            else:
+                group_ids = {}
+                group_index = []
+                group_rows = []
+                for row_idx, pattern_idx in enumerate(self._encoded_ballots().inverse.tolist()):
+                    if pattern_idx not in group_ids:
+                        group_ids[pattern_idx] = len(group_rows)
+                        group_rows.append([])
+                    group_index.append(group_ids[pattern_idx])
+                    group_rows[group_ids[pattern_idx]].append(row_idx)
+
+            self._rank_groups = (group_index, group_rows)
+
+        return self._rank_groups
+
+    def _get_integer_weights(self) -> Optional[List[int]]:
+        """Aggregated CVR row weights as ints, if every weight is a positive whole number written without
+        a fractional part or exponent. Sums of these ints convert back to the same Decimal that summing the
+        weights themselves would give, so integer arithmetic can stand in for Decimal arithmetic.
+
+        :return: Integer weights, or None if any weight needs Decimal arithmetic.
+        :rtype: Optional[List[int]]
+        """
+        if self._integer_weights is None:
+            weights = self._modified_cvrs[self._default_rule_set_name]["weight"]
+            if all(w > 0 and w.as_tuple().exponent == 0 for w in weights):
+                self._integer_weights = [int(w) for w in weights]
+            else:
+                self._integer_weights = False
+
+        return self._integer_weights or None
+
+    def _sum_weights(self, row_flags: List[bool]) -> Union[int, decimal.Decimal]:
+        """Sum of aggregated CVR row weights for flagged rows. Returns the same value as summing the Decimal
+        weights with `sum`, including the int 0 returned when no rows are flagged.
+
+        :param row_flags: One flag per aggregated CVR row.
+        :type row_flags: List[bool]
+        :rtype: Union[int, decimal.Decimal]
+        """
+        integer_weights = self._get_integer_weights()
+        if integer_weights is None:
+            weights = self._modified_cvrs[self._default_rule_set_name]["weight"]
+            return sum(w for flag, w in zip(row_flags, weights) if flag)
+
+        total = sum(w for flag, w in zip(row_flags, integer_weights) if flag)
+        return decimal.Decimal(total) if total else 0
+
     def _make_candidate_set(self, rule_set_name: str) -> None:
 
         if rule_set_name not in self._rule_sets:
@@ -504,6 +730,7 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
         candidate_ballot_marks.apply_rules(
             combine_writein_marks=combine_writeins,
             exclude_writein_marks=exclude_writeins,
+            writein_matcher=self._writein_matcher,
         )
 
         self._candidate_sets.update({rule_set_name: candidate_ballot_marks})
@@ -527,6 +754,17 @@ class CastVoteRecord(CastVoteRecord_stats, CastVoteRecord_tables):
 
         self._rule_sets.update({set_name: set_dict})
 
+        # stats may depend on the new rule set, e.g. contest stats on the contest rule set
+        self._stats_memo = {}
+
+    def get_rule_memo_info(self) -> Dict[str, int]:
+        """Return counts describing reuse of rule results between ballots. Every ballot row looked up while building a modified CVR counts as a hit, if its rank pattern already had the rules applied, or a miss.
+
+        :return: Dictionary with keys 'hits', 'misses' and 'patterns', the number of stored results.
+        :rtype: Dict[str, int]
+        """
+        return {**self._rule_memo_info, "patterns": len(self._rule_memo)}
+
     def get_cvr_dict(self, rule_set_name: Optional[str] = None, disaggregate: bool = True) -> Dict[str, List]:
         """Return CVR as dictionary of lists.
 
@@ -32,8 +32,26 @@ class CastVoteRecord_stats:
         :return: A list containing a single row dataframe with statistics organized in multiple columns. If `split_fields` are passed, then extra rows are added for each category in the split columns.
         :rtype: List[pd.DataFrame]
         """
+        return self._memoized_stats(keep_decimal_type, add_split_stats, add_id_info)
 
-        cvr_stats = self._summary_cvr_stat_table.copy()
+    def _memoized_stats(
+        self, keep_decimal_type: bool, add_split_stats: bool, add_id_info: bool
+    ) -> List[pd.DataFrame]:
+        """Stats from `_compute_stats`, kept for each combination of arguments until a rule set or tabulation is
+        added. Copies are returned so callers may modify them.
+
+        :rtype: List[pd.DataFrame]
+        """
+        stats_key = (keep_decimal_type, add_split_stats, add_id_info)
+        if stats_key not in self._stats_memo:
+            self._stats_memo[stats_key] = self._compute_stats(keep_decimal_type, add_split_stats, add_id_info)
+        return [df.copy() for df in self._stats_memo[stats_key]]
+
+    def _compute_stats(
+        self, keep_decimal_type: bool, add_split_stats: bool, add_id_info: bool
+    ) -> List[pd.DataFrame]:
+
+        cvr_stats = self._get_summary_cvr_stat_table().copy()
 
         if add_id_info:
             for col in self._id_df.columns[::-1]:
@@ -61,6 +79,48 @@ class CastVoteRecord_stats:
 
         return [cvr_stats]
 
+    def get_rank_limit(self) -> int:
+        """Number of rankings available on each ballot.
+
+        :rtype: int
+        """
+        return len(self.get_cvr_dict(disaggregate=False)["ballot_marks"][0].marks)
+
+    def get_n_candidates(self) -> int:
+        """Number of candidates in the CVR, with all write-in candidates counted as one and not counted if
+        write-ins are excluded.
+
+        :rtype: int
+        """
+        candidates_no_writeins = BallotMarks.remove_mark(
+            BallotMarks.combine_writein_marks(self.get_candidates(), self._writein_matcher), [BallotMarks.WRITEIN]
+        )
+        return len(candidates_no_writeins.marks)
+
+    def _get_cvr_stat_table(self) -> pd.DataFrame:
+        """Per ballot statistics table, computed on first use.
+
+        :rtype: pd.DataFrame
+        """
+        if self._cvr_stat_table is None:
+            if self._shared_cvr is not None:
+                self._cvr_stat_table = self._shared_cvr._get_cvr_stat_table()
+            else:
+                self._compute_cvr_stat_table()
+        return self._cvr_stat_table
+
+    def _get_summary_cvr_stat_table(self) -> pd.DataFrame:
+        """Single row summary statistics table, computed on first use.
+
+        :rtype: pd.DataFrame
+        """
+        if self._summary_cvr_stat_table is None:
+            if self._shared_cvr is not None:
+                self._summary_cvr_stat_table = self._shared_cvr._get_summary_cvr_stat_table()
+            else:
+                self._compute_summary_cvr_stat_table()
+        return self._summary_cvr_stat_table
+
     def _compute_cvr_stat_table(self) -> None:
 
         cvr = self.get_cvr_dict(disaggregate=False)
@@ -114,7 +174,7 @@ class CastVoteRecord_stats:
         df["irregular"] = df[irregular_condtions].any(axis="columns")
 
         # fully_ranked no overvotes
-        candidates_combined_writeins = BallotMarks.combine_writein_marks(candidates)
+        candidates_combined_writeins = BallotMarks.combine_writein_marks(candidates, self._writein_matcher)
         candidates_excluded_writeins = BallotMarks.remove_mark(candidates_combined_writeins, [BallotMarks.WRITEIN])
         candidate_set = candidates_excluded_writeins.unique_candidates
 
@@ -133,7 +193,7 @@ class CastVoteRecord_stats:
         df["fully_ranked_excl_overvotes"] = fully_ranked
 
         # fully_ranked with overvotes
-        candidates_combined_writeins = BallotMarks.combine_writein_marks(candidates)
+        candidates_combined_writeins = BallotMarks.combine_writein_marks(candidates, self._writein_matcher)
         candidates_excluded_writeins = BallotMarks.remove_mark(candidates_combined_writeins, [BallotMarks.WRITEIN])
         candidate_set = candidates_excluded_writeins.unique_candidates
 
@@ -153,16 +213,12 @@ class CastVoteRecord_stats:
 
     def _compute_summary_cvr_stat_table(self) -> None:
 
-        cvr = self.get_cvr_dict(disaggregate=False)
-        candidates = self.get_candidates()
+        cvr_stat_table = self._get_cvr_stat_table()
 
         s = pd.Series(dtype=object)
 
-        candidates_no_writeins = BallotMarks.remove_mark(
-            BallotMarks.combine_writein_marks(candidates), [BallotMarks.WRITEIN]
-        )
-        s["n_candidates"] = len(candidates_no_writeins.marks)
-        s["rank_limit"] = len(cvr["ballot_marks"][0].marks)
+        s["n_candidates"] = self.get_n_candidates()
+        s["rank_limit"] = self.get_rank_limit()
 
         s["restrictive_rank_limit"] = 0
         if s["rank_limit"] < (s["n_candidates"] - 1):
@@ -177,60 +233,60 @@ class CastVoteRecord_stats:
         # skipped rankings are followed by an overvote.
 
         # Other jursidictions (Minneapolis) simply skip over overvotes in a ballot.
-        s["first_round_overvote"] = self._cvr_stat_table.loc[
-            self._cvr_stat_table["first_round_overvote"], "weight"
+        s["first_round_overvote"] = cvr_stat_table.loc[
+            cvr_stat_table["first_round_overvote"], "weight"
         ].sum()
 
         # The number of voters that validly used only a single ranking. (weighted)
-        s["ranked_single"] = self._cvr_stat_table.loc[self._cvr_stat_table["ranked_single"], "weight"].sum()
+        s["ranked_single"] = cvr_stat_table.loc[cvr_stat_table["ranked_single"], "weight"].sum()
 
         # The number of voters that validly used 3 or more rankings. (weighted)
-        s["ranked_3_or_more"] = self._cvr_stat_table.loc[self._cvr_stat_table["ranked_3_or_more"], "weight"].sum()
+        s["ranked_3_or_more"] = cvr_stat_table.loc[cvr_stat_table["ranked_3_or_more"], "weight"].sum()
 
         # The number of voters that validly use more than one ranking. (weighted)
-        s["ranked_multiple"] = self._cvr_stat_table.loc[self._cvr_stat_table["ranked_multiple"], "weight"].sum()
+        s["ranked_multiple"] = cvr_stat_table.loc[cvr_stat_table["ranked_multiple"], "weight"].sum()
 
         # The number of voters that have validly used all available rankings on the
         # ballot, or that have validly ranked all non-write-in candidates. (weighted)
-        s["total_fully_ranked"] = self._cvr_stat_table.loc[
-            self._cvr_stat_table["fully_ranked_excl_overvotes"], "weight"
+        s["total_fully_ranked"] = cvr_stat_table.loc[
+            cvr_stat_table["fully_ranked_excl_overvotes"], "weight"
         ].sum()
 
         # The number of ballots that rank the same candidate more than once. (weighted)
-        s["includes_duplicate_ranking"] = self._cvr_stat_table.loc[
-            self._cvr_stat_table["contains_duplicate"], "weight"
+        s["includes_duplicate_ranking"] = cvr_stat_table.loc[
+            cvr_stat_table["contains_duplicate"], "weight"
         ].sum()
 
         # The number of ballots that have an skipped ranking followed by any other marked ranking. (weighted)
-        s["includes_skipped_ranking"] = self._cvr_stat_table.loc[self._cvr_stat_table["contains_skip"], "weight"].sum()
+        s["includes_skipped_ranking"] = cvr_stat_table.loc[cvr_stat_table["contains_skip"], "weight"].sum()
 
         # This includes ballots with no marks. (weighted)
-        s["total_ballots"] = self._cvr_stat_table["weight"].sum()
+        s["total_ballots"] = cvr_stat_table["weight"].sum()
 
         # Number of ballots that either had a multiple ranking, overvote,
         # or a skipped ranking (only those followed by a mark). This includes ballots even where the irregularity was not
         # the cause of exhaustion. (weighted)
-        s["total_irregular"] = self._cvr_stat_table.loc[self._cvr_stat_table["irregular"], "weight"].sum()
+        s["total_irregular"] = cvr_stat_table.loc[cvr_stat_table["irregular"], "weight"].sum()
 
         # Number of ballots with at least one overvote. Not necessarily cause of exhaustion. (weighted)
-        s["includes_overvote_ranking"] = self._cvr_stat_table.loc[
-            self._cvr_stat_table["contains_overvote"], "weight"
+        s["includes_overvote_ranking"] = cvr_stat_table.loc[
+            cvr_stat_table["contains_overvote"], "weight"
         ].sum()
 
         # Ballots completely made up of skipped rankings (no marks). (weighted)
-        s["total_undervote"] = self._cvr_stat_table.loc[self._cvr_stat_table["undervote"], "weight"].sum()
+        s["total_undervote"] = cvr_stat_table.loc[cvr_stat_table["undervote"], "weight"].sum()
 
         # Mean number of validly used rankings across all non-undervote ballots. (weighted)
-        weighted_sum = self._cvr_stat_table.loc[~self._cvr_stat_table["undervote"], "ranks_used_times_weight"].sum()
+        weighted_sum = cvr_stat_table.loc[~cvr_stat_table["undervote"], "ranks_used_times_weight"].sum()
         s["mean_rankings_used"] = (
-            weighted_sum / self._cvr_stat_table.loc[~self._cvr_stat_table["undervote"], "weight"].sum()
+            weighted_sum / cvr_stat_table.loc[~cvr_stat_table["undervote"], "weight"].sum()
         )
 
         # Median number of validly used rankings across all non-undervote ballots. (weighted)
-        # s['median_rankings_used'] = self._cvr_stat_table.loc[~self._cvr_stat_table['undervote'], 'ranks_used_times_weight'].median()
+        # s['median_rankings_used'] = cvr_stat_table.loc[~cvr_stat_table['undervote'], 'ranks_used_times_weight'].median()
 
-        # ranks_used = self._cvr_stat_table.loc[~self._cvr_stat_table["undervote"], "valid_ranks_used"].tolist()
-        # weights = self._cvr_stat_table.loc[~self._cvr_stat_table["undervote"], "weight"].tolist()
+        # ranks_used = cvr_stat_table.loc[~cvr_stat_table["undervote"], "valid_ranks_used"].tolist()
+        # weights = cvr_stat_table.loc[~cvr_stat_table["undervote"], "weight"].tolist()
         # weights_float = [float(i) for i in weights]
         # s["median_rankings_used"] = weightedstats.weighted_median(ranks_used, weights=weights_float)
 
@@ -258,7 +314,7 @@ class CastVoteRecord_stats:
 
     def _compute_cvr_split_stats(self, split_filter) -> pd.DataFrame:
 
-        filtered_stat_table = self._cvr_stat_table.loc[split_filter, :]
+        filtered_stat_table = self._get_cvr_stat_table().loc[split_filter, :]
 
         first_round_overvote = filtered_stat_table.loc[filtered_stat_table["first_round_overvote"], "weight"].sum()
         ranked_single = filtered_stat_table.loc[filtered_stat_table["ranked_single"], "weight"].sum()
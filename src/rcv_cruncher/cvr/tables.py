@@ -65,8 +65,7 @@ class CastVoteRecord_tables:
 
         # get ballots and candidates
         ballot_dl = {k: v for k, v in self.get_cvr_dict(disaggregate=disaggregate).items()}
-        candidates = self.get_candidates().get_unique_candidates()
-        candidates.update({BallotMarks.OVERVOTE})
+        candidates = self.get_candidates().get_unique_candidates().union({BallotMarks.OVERVOTE})
 
         # remove weights if all equal to 1
         if not disaggregate:
@@ -103,7 +102,7 @@ class CastVoteRecord_tables:
         """
 
         # get candidate set
-        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates())
+        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates(), self._writein_matcher)
         candidate_set_names = sorted(candidate_set.get_unique_candidates())
         candidate_set_codes = candidate_set.get_unique_candidates()
 
@@ -132,7 +131,7 @@ class CastVoteRecord_tables:
         # combine writeins
         ballot_set = [
             {
-                "ballot_marks": BallotMarks.combine_writein_marks(b["ballot_marks"]),
+                "ballot_marks": BallotMarks.combine_writein_marks(b["ballot_marks"], self._writein_matcher),
                 "weight": b["weight"],
             }
             for b in ballot_set
@@ -218,13 +217,13 @@ class CastVoteRecord_tables:
         """
 
         # get candidate set
-        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates())
+        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates(), self._writein_matcher)
         candidate_set_names = sorted(candidate_set.get_unique_candidates())
 
         ballot_dict = self.get_cvr_dict(disaggregate=False)
         ballot_weights = ballot_dict["weight"]
         ballot_marks = [BallotMarks.remove_mark(b, [BallotMarks.SKIPPED]) for b in ballot_dict["ballot_marks"]]
-        ballot_marks = [BallotMarks.combine_writein_marks(b) for b in ballot_marks]
+        ballot_marks = [BallotMarks.combine_writein_marks(b, self._writein_matcher) for b in ballot_marks]
         ballot_set = [{"ballot_marks": ranks, "weight": weight} for ranks, weight in zip(ballot_marks, ballot_weights)]
 
         index_label = "Ballots with first choice:"
@@ -273,15 +272,12 @@ class CastVoteRecord_tables:
 
     def get_annotated_cvr_table(self):
 
-        dfs = [self._rank_header_cvr(disaggregate=self._disable_aggregation), self._cvr_stat_table]
+        dfs = [self._rank_header_cvr(disaggregate=self._disable_aggregation), self._get_cvr_stat_table()]
         concat_df = pd.concat(dfs, axis="columns", sort=False)
 
         if not self._disable_aggregation:
 
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-            row_reps = [len(disagg_info[k]) for k in disagg_info_keys]
-
-            concat_df = concat_df.loc[concat_df.index.repeat(row_reps)].reset_index()
+            _, disagg_index = self._disaggregation_arrays()
+            concat_df = concat_df.loc[concat_df.index.take(disagg_index)].reset_index()
 
         return concat_df
@@ -1,13 +1,21 @@
 """
-Contains BallotMarks class
+Contains BallotMarks and WriteinMatcher classes
 """
 
 from __future__ import annotations
-from typing import Callable, Dict, Union, Set, List
+from typing import Dict, FrozenSet, Iterable, Optional, Union, Set, List, Tuple
+
+import re
 
 
 class BallotMarks:
-    """Wrap up ranking list of a ballot with useful methods."""
+    """Wrap up ranking list of a ballot with useful methods.
+
+    Marks are held in a tuple and are never modified in place, so objects can share them freely.
+    The unique mark and candidate sets are derived from the marks on first access.
+    """
+
+    __slots__ = ("_marks", "_input_marks", "_unique_marks", "_unique_candidates", "rules", "inactive_type")
 
     # special non-candidate marks
     SKIPPED = "skipped"
@@ -110,72 +118,78 @@ class BallotMarks:
         return matched
 
     @staticmethod
-    def combine_writein_marks(ballot_marks: BallotMarks) -> BallotMarks:
-        """Return copied BallotMarks object with any ballot marks that meet
+    def combine_writein_marks(
+        ballot_marks: BallotMarks, writein_matcher: Optional[WriteinMatcher] = None
+    ) -> BallotMarks:
+        """Return BallotMarks object with any ballot marks that meet
         writein match criteria changed into WRITEIN constant.
+        If no marks need to change, `ballot_marks` itself is returned.
 
-        :param ballot_marks: BallotMarks object to copy and combine the writein marks of.
+        :param ballot_marks: BallotMarks object to combine the writein marks of.
         :type ballot_marks: BallotMarks
-        :return: Copied BallotMarks object with matching marks converted to writein constant.
+        :param writein_matcher: Matcher used to classify marks. If None, :meth:`BallotMarks.check_writein_match` is used. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
+        :return: Object with matching marks converted to writein constant.
         :rtype: BallotMarks
         """
-        copy_ballot_marks = ballot_marks.copy()
-        new_marks = [
-            BallotMarks.WRITEIN if BallotMarks.check_writein_match(mark) else mark for mark in copy_ballot_marks.marks
-        ]
-        copy_ballot_marks.update_marks(new_marks)
-        return copy_ballot_marks
+        is_writein = writein_matcher if writein_matcher is not None else BallotMarks.check_writein_match
+        marks = ballot_marks.marks
+        new_marks = tuple(BallotMarks.WRITEIN if is_writein(mark) else mark for mark in marks)
+        if new_marks == marks:
+            return ballot_marks
+        return ballot_marks._with_marks(new_marks)
 
     @staticmethod
     def remove_mark(ballot_marks: BallotMarks, remove_mark_names: Union[List, Set]) -> BallotMarks:
-        """Return a copied BallotMarks object with any ballot marks present in `remove_mark_names` removed.
+        """Return a BallotMarks object with any ballot marks present in `remove_mark_names` removed.
+        If no marks are removed, `ballot_marks` itself is returned.
 
-        :param ballot_marks: Object to copy and remove marks from.
+        :param ballot_marks: Object to remove marks from.
         :type ballot_marks: BallotMarks
         :param remove_mark_names: List or Set of mark names to be removed.
         :type remove_mark_names: List or Set
-        :return: Copied object with specified marks removed.
+        :return: Object with specified marks removed.
         :rtype: BallotMarks
         """
-        remove_set = set(mark for mark in remove_mark_names)
-        copy_ballot_marks = ballot_marks.copy()
-        new_marks = [mark for mark in copy_ballot_marks.marks if mark not in remove_set]
-        copy_ballot_marks.update_marks(new_marks)
-        return copy_ballot_marks
+        remove_set = set(remove_mark_names)
+        marks = ballot_marks.marks
+        new_marks = tuple(mark for mark in marks if mark not in remove_set)
+        if len(new_marks) == len(marks):
+            return ballot_marks
+        return ballot_marks._with_marks(new_marks)
 
     @staticmethod
     def remove_duplicate_candidate_marks(ballot_marks: BallotMarks) -> BallotMarks:
-        """Return copied BallotMarks object with duplicated candidate marks removed, including WRITEIN constant.
+        """Return BallotMarks object with duplicated candidate marks removed, including WRITEIN constant.
+        If there are no duplicates, `ballot_marks` itself is returned.
 
-        :param ballot_marks: Object to copy and from which to remove duplicates.
+        :param ballot_marks: Object from which to remove duplicates.
         :type ballot_marks: BallotMarks
-        :return: Copied object with duplicate candidates removed.
+        :return: Object with duplicate candidates removed.
         :rtype: BallotMarks
         """
-        copy_ballot_marks = ballot_marks.copy()
-        new_marks_list = []
-        new_marks_set = set()
-        for mark in copy_ballot_marks.marks:
-            if mark not in new_marks_set.difference({BallotMarks.OVERVOTE, BallotMarks.SKIPPED}):
-                new_marks_list.append(mark)
-                new_marks_set = new_marks_set.union({mark})
-        copy_ballot_marks.update_marks(new_marks_list)
-        return copy_ballot_marks
-
-    def __init__(self, marks: List = []) -> None:
+        marks = ballot_marks.marks
+        new_marks = []
+        seen = set()
+        for mark in marks:
+            if mark not in seen:
+                new_marks.append(mark)
+                if mark != BallotMarks.OVERVOTE and mark != BallotMarks.SKIPPED:
+                    seen.add(mark)
+        if len(new_marks) == len(marks):
+            return ballot_marks
+        return ballot_marks._with_marks(tuple(new_marks))
+
+    def __init__(self, marks: Iterable[str] = ()) -> None:
         """Constructor
 
-        :param marks: List of mark names, including candidates and special marks, representing ranked choices on a ballot. Defaults to empty list.
-        :type marks: List, optional
+        :param marks: Mark names, including candidates and special marks, representing ranked choices on a ballot. Defaults to empty tuple.
+        :type marks: Iterable[str], optional
         """
-        self.input_marks = marks
-
-        self.marks = []
-        self.unique_marks = {}
-        self.unique_candidates = {}
-
-        if marks:
-            self.update_marks(marks)
+        self._marks = tuple(marks)
+        self._input_marks = self._marks
+        self._unique_marks = None
+        self._unique_candidates = None
 
         self.rules = {}
         self.inactive_type = None
@@ -183,52 +197,77 @@ class BallotMarks:
         # in the future, add functionality to handle overvotes that can be conditionally resolved
         # if all but one of the overvoted candidates is eliminated before the overvote is reached
 
+    @property
+    def marks(self) -> Tuple[str, ...]:
+        return self._marks
+
+    @property
+    def input_marks(self) -> Tuple[str, ...]:
+        return self._input_marks
+
+    @property
+    def unique_marks(self) -> FrozenSet[str]:
+        if self._unique_marks is None:
+            self._unique_marks = frozenset(self.marks)
+        return self._unique_marks
+
+    @property
+    def unique_candidates(self) -> FrozenSet[str]:
+        if self._unique_candidates is None:
+            self._unique_candidates = self.unique_marks - {BallotMarks.SKIPPED, BallotMarks.OVERVOTE}
+        return self._unique_candidates
+
+    def _with_marks(self, new_marks: Tuple[str, ...]) -> BallotMarks:
+        # plain BallotMarks object carrying over everything but the current marks
+        new_obj = BallotMarks.__new__(BallotMarks)
+        new_obj._marks = new_marks
+        new_obj._input_marks = self.input_marks
+        new_obj._unique_marks = None
+        new_obj._unique_candidates = None
+        new_obj.rules = dict(self.rules)
+        new_obj.inactive_type = self.inactive_type
+        return new_obj
+
     def copy(self) -> BallotMarks:
-        """Make a copy.
+        """Make a copy. Marks and derived sets are immutable and shared with the original.
 
         :return: Returns a copy of BallotMarks object
         :rtype: BallotMarks
         """
-        copy_obj = BallotMarks(self.marks)
-
-        copy_obj.input_marks = [i for i in self.input_marks]
-        copy_obj.rules = {k: v for k, v in self.rules.items()}
-        copy_obj.inactive_type = self.inactive_type
-
+        copy_obj = self._with_marks(self.marks)
+        copy_obj._unique_marks = self._unique_marks
+        copy_obj._unique_candidates = self._unique_candidates
         return copy_obj
 
-    def update_marks(self, new_marks: List[str]) -> None:
-        """Update `marks` property along with `unique_marks` and `unique_candidates`
-        based on a new list of marks names.
+    def update_marks(self, new_marks: Iterable[str]) -> None:
+        """Replace `marks` with a new sequence of mark names. `unique_marks` and `unique_candidates`
+        are recomputed on next access.
 
-        :param new_marks: List of new ordered mark names to replace old ones.
-        :type new_marks: List
+        :param new_marks: New ordered mark names to replace old ones.
+        :type new_marks: Iterable[str]
         """
-        self.marks = [mark for mark in new_marks]
-        self.unique_marks = set(self.marks)
-        self.unique_candidates = self.unique_marks - {
-            BallotMarks.SKIPPED,
-            BallotMarks.OVERVOTE,
-        }
+        self._marks = tuple(new_marks)
+        self._unique_marks = None
+        self._unique_candidates = None
 
     def get_marks(self) -> List:
         """
         :return: List of current marks
         :rtype: List
         """
-        return self.marks
+        return list(self.marks)
 
-    def get_unique_marks(self) -> Set:
+    def get_unique_marks(self) -> FrozenSet:
         """
         :return: Set of unique marks
-        :rtype: Set
+        :rtype: FrozenSet
         """
         return self.unique_marks
 
-    def get_unique_candidates(self) -> Set:
+    def get_unique_candidates(self) -> FrozenSet:
         """
         :return: Set of unique candidate marks
-        :rtype: Set
+        :rtype: FrozenSet
         """
         return self.unique_candidates
 
@@ -250,6 +289,7 @@ class BallotMarks:
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
         writeins_eliminated_first: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
     ) -> None:
         """
         Applies rules to ballot, modifying marks as necessary.
@@ -272,6 +312,8 @@ class BallotMarks:
         :type exhaust_on_overvote_marks: bool, optional
         :param exhaust_on_N_repeated_skipped_marks: If > 0, ballot is truncated following at least N `BallotMarks.SKIPPED` marks which are followed by a non-skipped mark, defaults to 0
         :type exhaust_on_N_repeated_skipped_marks: bool, optional
+        :param writein_matcher: Matcher used by `combine_writein_marks`. If None, :meth:`BallotMarks.check_writein_match` is used. Not stored as a rule. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
         :raises RuntimeError: Raised if rules already applied to this object. To apply fresh rules, first execute the `clean_rules` method.
         """
 
@@ -288,84 +330,71 @@ class BallotMarks:
             "exhaust_on_duplicate_candidate_marks": exhaust_on_duplicate_candidate_marks,
             "exhaust_on_overvote_marks": exhaust_on_overvote_marks,
             "exhaust_on_N_repeated_skipped_marks": exhaust_on_N_repeated_skipped_marks,
-            "writeins_eliminated_first":writeins_eliminated_first
+            "writeins_eliminated_first": writeins_eliminated_first
         }
 
-        all_skipped = None
         specific_exhaust = None
-
-        if self.unique_marks == {BallotMarks.SKIPPED}:
-            all_skipped = True
-        else:
-            all_skipped = False
+        all_skipped = self.unique_marks == {BallotMarks.SKIPPED}
 
         # has to occur before exhaustion by duplicates is computed
         if combine_writein_marks and treat_combined_writeins_as_exhaustable_duplicates:
-            self.update_marks(self.combine_writein_marks(self).marks)
-
-        new_marks_list = []
-        new_marks_set = set()
-        for mark_idx, mark in enumerate(self.marks):
-
-            repeated_skipped_marks_present = False
-            look_ahead_n = exhaust_on_N_repeated_skipped_marks - 1
-            if exhaust_on_N_repeated_skipped_marks and mark_idx + look_ahead_n < len(self.marks):
-
-                next_marks = self.marks[mark_idx: mark_idx + look_ahead_n + 1]
-                following_marks = self.marks[mark_idx + look_ahead_n + 1:]
-
-                # check for successive skips
-                if set(next_marks) == {BallotMarks.SKIPPED}:
-                    repeated_skipped_marks_present = True
-                else:
-                    repeated_skipped_marks_present = False
-
-                # and check if any non-skip marks remain after skips
-                if (
-                    repeated_skipped_marks_present
-                    and set(following_marks)
-                    and set(following_marks) != {BallotMarks.SKIPPED}
-                ):
-                    repeated_skipped_marks_present = True
-                else:
-                    repeated_skipped_marks_present = False
-
-            if exhaust_on_N_repeated_skipped_marks and repeated_skipped_marks_present:
+            self.update_marks(self.combine_writein_marks(self, writein_matcher).marks)
+
+        marks = self.marks
+        n_marks = len(marks)
+        n_skips = exhaust_on_N_repeated_skipped_marks
+
+        cut_idx = n_marks
+        seen_candidates = set()
+        for mark_idx, mark in enumerate(marks):
+
+            # N successive skips, followed by at least one non-skipped mark
+            if (
+                n_skips
+                and mark_idx + n_skips <= n_marks
+                and all(m == BallotMarks.SKIPPED for m in marks[mark_idx: mark_idx + n_skips])
+                and any(m != BallotMarks.SKIPPED for m in marks[mark_idx + n_skips:])
+            ):
                 if not self.inactive_type:
                     specific_exhaust = self.MAYBE_EXHAUSTED_BY_SKIPPED_RANKING
+                cut_idx = mark_idx
                 break
 
-            overvote_mark_present = mark == BallotMarks.OVERVOTE
-            if exhaust_on_overvote_marks and overvote_mark_present:
+            if exhaust_on_overvote_marks and mark == BallotMarks.OVERVOTE:
                 if not self.inactive_type:
                     specific_exhaust = self.MAYBE_EXHAUSTED_BY_OVERVOTE
+                cut_idx = mark_idx
                 break
 
-            duplicate_candidate_mark = mark in new_marks_set.difference({BallotMarks.OVERVOTE, BallotMarks.SKIPPED})
-            if exhaust_on_duplicate_candidate_marks and duplicate_candidate_mark:
+            if exhaust_on_duplicate_candidate_marks and mark in seen_candidates:
                 if not self.inactive_type:
                     specific_exhaust = self.MAYBE_EXHAUSTED_BY_DUPLICATE_RANKING
+                cut_idx = mark_idx
                 break
 
-            new_marks_list.append(mark)
-            new_marks_set = new_marks_set.union({mark})
+            if mark != BallotMarks.OVERVOTE and mark != BallotMarks.SKIPPED:
+                seen_candidates.add(mark)
 
-        self.update_marks(new_marks_list)
+        new_ballot = self._with_marks(marks[:cut_idx]) if cut_idx < n_marks else self
 
         if combine_writein_marks and not treat_combined_writeins_as_exhaustable_duplicates:
-            self.update_marks(self.combine_writein_marks(self).marks)
+            new_ballot = self.combine_writein_marks(new_ballot, writein_matcher)
 
         if exclude_duplicate_candidate_marks:
-            self.update_marks(self.remove_duplicate_candidate_marks(self).marks)
+            new_ballot = self.remove_duplicate_candidate_marks(new_ballot)
 
+        remove_set = set()
         if exclude_overvote_marks:
-            self.update_marks(self.remove_mark(self, [BallotMarks.OVERVOTE]).marks)
-
+            remove_set.add(BallotMarks.OVERVOTE)
         if exclude_skipped_marks:
-            self.update_marks(self.remove_mark(self, [BallotMarks.SKIPPED]).marks)
-
+            remove_set.add(BallotMarks.SKIPPED)
         if exclude_writein_marks:
-            self.update_marks(self.remove_mark(self, [BallotMarks.WRITEIN]).marks)
+            remove_set.add(BallotMarks.WRITEIN)
+        if remove_set:
+            new_ballot = self.remove_mark(new_ballot, remove_set)
+
+        if new_ballot is not self:
+            self.update_marks(new_ballot.marks)
 
         if all_skipped:
             self.inactive_type = self.UNDERVOTE
@@ -375,3 +404,76 @@ class BallotMarks:
             self.inactive_type = specific_exhaust
         else:
             self.inactive_type = self.MAYBE_EXHAUSTED
+
+
+class WriteinMatcher:
+    """Classify mark names as write-in candidates or not. The partial and exact match words are compiled
+    into one regular expression and every name is only checked once, later lookups come from a table.
+    Matching rules are the same as :meth:`BallotMarks.check_writein_match`.
+    """
+
+    def __init__(
+        self,
+        partial_match_words: Optional[List[str]] = None,
+        anycase_exact_match_words: Optional[List[str]] = None,
+    ) -> None:
+        """Constructor
+
+        :param partial_match_words: Names containing any of these strings, after lowercasing, are write-ins. If None, :attr:`BallotMarks.writein_partial_match_words` is used. Defaults to None
+        :type partial_match_words: Optional[List[str]], optional
+        :param anycase_exact_match_words: Names equal to any of these strings, after lowercasing, are write-ins. If None, :attr:`BallotMarks.writein_anycase_exact_match_words` is used. Defaults to None
+        :type anycase_exact_match_words: Optional[List[str]], optional
+        """
+        if partial_match_words is None:
+            partial_match_words = BallotMarks.writein_partial_match_words
+        if anycase_exact_match_words is None:
+            anycase_exact_match_words = BallotMarks.writein_anycase_exact_match_words
+
+        self.partial_match_words = list(partial_match_words)
+        self.anycase_exact_match_words = list(anycase_exact_match_words)
+
+        patterns = []
+        if self.partial_match_words:
+            patterns.append("(?s:.*?(?:" + "|".join(re.escape(w) for w in self.partial_match_words) + "))")
+        if self.anycase_exact_match_words:
+            patterns.append("(?:" + "|".join(re.escape(w) for w in self.anycase_exact_match_words) + r")\Z")
+        self._pattern = re.compile("|".join(patterns)) if patterns else None
+
+        self._table = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"WriteinMatcher(partial_match_words={self.partial_match_words}, "
+            f"anycase_exact_match_words={self.anycase_exact_match_words})"
+        )
+
+    def __call__(self, mark: str) -> bool:
+        """
+        :param mark: Mark name to check.
+        :type mark: str
+        :return: True if mark name is a match to writein conditions, else False.
+        :rtype: bool
+        """
+        try:
+            return self._table[mark]
+        except KeyError:
+            matched = self._pattern is not None and self._pattern.match(mark.lower()) is not None
+            self._table[mark] = matched
+            return matched
+
+    def classify(self, marks: Iterable[str]) -> WriteinMatcher:
+        """Return a new matcher with the same match words and its table filled in for `marks`.
+
+        :param marks: Mark names to classify up front, usually the candidate set of a contest.
+        :type marks: Iterable[str]
+        :return: New matcher.
+        :rtype: WriteinMatcher
+        """
+        new_matcher = WriteinMatcher.__new__(WriteinMatcher)
+        new_matcher.partial_match_words = self.partial_match_words
+        new_matcher.anycase_exact_match_words = self.anycase_exact_match_words
+        new_matcher._pattern = self._pattern
+        new_matcher._table = {}
+        for mark in marks:
+            new_matcher(mark)
+        return new_matcher
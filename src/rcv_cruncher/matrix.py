@@ -0,0 +1,449 @@
+"""
+Contains the integer-coded ballot storage used as an optional CastVoteRecord backend.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import collections.abc
+
+import numpy as np
+
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
+
+
+class CandidateCodes:
+    """Two way lookup between mark names and the small integer codes used in a :class:`BallotMatrix`.
+    The special marks SKIPPED, OVERVOTE and WRITEIN always receive the same reserved codes,
+    candidate names are numbered after them in sorted order.
+    """
+
+    SKIPPED_CODE = 0
+    OVERVOTE_CODE = 1
+    WRITEIN_CODE = 2
+
+    # padding used once rules have shortened a ballot
+    EMPTY_CODE = -1
+
+    reserved_marks = [BallotMarks.SKIPPED, BallotMarks.OVERVOTE, BallotMarks.WRITEIN]
+
+    def __init__(self, marks: Iterable[str] = ()) -> None:
+        """Constructor
+
+        :param marks: Mark names to assign codes to. Reserved marks are always included. Defaults to empty tuple.
+        :type marks: Iterable[str], optional
+        """
+        extra_marks = sorted(set(marks) - set(self.reserved_marks))
+        self.names = self.reserved_marks + extra_marks
+        self.codes = {name: code for code, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def encode(self, mark: str) -> int:
+        """
+        :param mark: Mark name.
+        :type mark: str
+        :raises RuntimeError: Raised if the mark name is not part of this code table.
+        :return: Integer code of the mark.
+        :rtype: int
+        """
+        if mark not in self.codes:
+            raise RuntimeError(f"mark {mark} is not part of this candidate code table.")
+        return self.codes[mark]
+
+    def decode(self, code: int) -> str:
+        """
+        :param code: Integer code.
+        :type code: int
+        :return: Mark name belonging to the code.
+        :rtype: str
+        """
+        return self.names[code]
+
+    def dtype(self) -> np.dtype:
+        """Smallest signed integer type able to hold every code, plus the negative padding code.
+
+        :rtype: np.dtype
+        """
+        for dtype in (np.int8, np.int16, np.int32):
+            if len(self.names) <= np.iinfo(dtype).max:
+                return np.dtype(dtype)
+        return np.dtype(np.int64)
+
+
+class BallotMatrix:
+    """Store ballot rankings as a matrix of candidate codes with one row per unique ranking pattern.
+    Every ballot points to its pattern through the `inverse` index array.
+    """
+
+    @staticmethod
+    def from_ranks(ranks: List[List[str]], codes: Optional[CandidateCodes] = None) -> BallotMatrix:
+        """Encode a list of equal length rank lists.
+
+        :param ranks: List of rank lists, all of the same length.
+        :type ranks: List[List[str]]
+        :param codes: Code table to use. If None, a new one is made from the marks present. Defaults to None
+        :type codes: Optional[CandidateCodes], optional
+        :return: Encoded ballots.
+        :rtype: BallotMatrix
+        """
+        if codes is None:
+            codes = CandidateCodes(mark for ballot in ranks for mark in ballot)
+
+        n_ballots = len(ranks)
+        rank_limit = len(ranks[0]) if n_ballots else 0
+
+        lookup = codes.codes
+        flat = np.fromiter(
+            (lookup[mark] for ballot in ranks for mark in ballot),
+            dtype=codes.dtype(),
+            count=n_ballots * rank_limit,
+        )
+        matrix = flat.reshape(n_ballots, rank_limit)
+
+        return BallotMatrix.from_array(matrix, codes)
+
+    @staticmethod
+    def from_array(matrix: np.ndarray, codes: CandidateCodes) -> BallotMatrix:
+        """Collapse an already encoded matrix (one row per ballot) into unique rows.
+
+        :param matrix: Two dimensional array of codes.
+        :type matrix: np.ndarray
+        :param codes: Code table used to encode `matrix`.
+        :type codes: CandidateCodes
+        :return: Encoded ballots.
+        :rtype: BallotMatrix
+        """
+        if matrix.shape[1] == 0:
+            rows = np.empty((1 if len(matrix) else 0, 0), dtype=matrix.dtype)
+            inverse = np.zeros(len(matrix), dtype=np.intp)
+        else:
+            rows, inverse = np.unique(matrix, axis=0, return_inverse=True)
+        return BallotMatrix(rows, inverse.reshape(-1), codes)
+
+    def __init__(self, rows: np.ndarray, inverse: np.ndarray, codes: CandidateCodes) -> None:
+        """Constructor
+
+        :param rows: Unique ranking patterns, one per row, padded with `CandidateCodes.EMPTY_CODE`.
+        :type rows: np.ndarray
+        :param inverse: Row index into `rows` for every ballot.
+        :type inverse: np.ndarray
+        :param codes: Code table used to encode `rows`.
+        :type codes: CandidateCodes
+        """
+        self.rows = rows
+        self.inverse = inverse
+        self.codes = codes
+        self._decoded = {}
+        self._views = {}
+
+        # intermediate rule results, shared by every rule set applied to these rows, see apply_rules
+        self._rule_steps = {}
+
+    def __len__(self) -> int:
+        return len(self.inverse)
+
+    def n_unique(self) -> int:
+        """
+        :return: Number of unique ranking patterns.
+        :rtype: int
+        """
+        return len(self.rows)
+
+    def rank_limit(self) -> int:
+        """
+        :return: Number of rank columns.
+        :rtype: int
+        """
+        return self.rows.shape[1]
+
+    def row_marks(self, row_idx: int) -> Tuple[str, ...]:
+        """Decode a unique row. Decoded rows are cached and shared between all ballots with that pattern.
+
+        :param row_idx: Index into unique rows.
+        :type row_idx: int
+        :return: Mark names, with padding removed.
+        :rtype: Tuple[str, ...]
+        """
+        if row_idx not in self._decoded:
+            names = self.codes.names
+            self._decoded[row_idx] = tuple(names[code] for code in self.rows[row_idx].tolist() if code >= 0)
+        return self._decoded[row_idx]
+
+    def writein_code_mask(self, writein_matcher: Optional[WriteinMatcher] = None) -> np.ndarray:
+        """
+        :param writein_matcher: Matcher used to classify mark names. If None, :meth:`BallotMarks.check_writein_match` is used. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
+        :return: Boolean array, indexed by code, that is True for marks matching the writein patterns.
+        :rtype: np.ndarray
+        """
+        is_writein = writein_matcher if writein_matcher is not None else BallotMarks.check_writein_match
+        return np.fromiter((is_writein(name) for name in self.codes.names), dtype=bool, count=len(self.codes))
+
+    def apply_rules(
+        self, writein_matcher: Optional[WriteinMatcher] = None, **rules
+    ) -> Tuple[BallotMatrix, List[str]]:
+        """Apply a rule set to every unique row at once. Produces the same marks and inactive types as calling
+        :meth:`BallotMarks.apply_rules` on a copy of each ballot.
+
+        :param writein_matcher: Matcher used when combining writeins. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
+        :param rules: Rule settings, as returned by :meth:`BallotMarks.new_rule_set`.
+        :return: A matrix with one row per row of this matrix holding the modified marks, sharing this matrix's inverse index, and the inactive type of each row.
+        :rtype: Tuple[BallotMatrix, List[str]]
+        """
+        rules = BallotMarks.new_rule_set(**rules)
+        rows = self.rows.copy()
+        n_rows, rank_limit = rows.shape
+
+        skipped = CandidateCodes.SKIPPED_CODE
+        overvote = CandidateCodes.OVERVOTE_CODE
+        writein = CandidateCodes.WRITEIN_CODE
+        empty = CandidateCodes.EMPTY_CODE
+
+        valid = rows != empty
+        is_skipped = rows == skipped
+        all_skipped = valid.any(axis=1) & (is_skipped == valid).all(axis=1)
+
+        combine = rules["combine_writein_marks"]
+        combine_first = combine and rules["treat_combined_writeins_as_exhaustable_duplicates"]
+        if combine:
+            writein_mask = self._rule_step(
+                ("writein_mask", writein_matcher), lambda: self.writein_code_mask(writein_matcher)
+            )
+
+        # has to occur before exhaustion by duplicates is computed
+        if combine_first:
+            rows[valid & writein_mask[rows]] = writein
+
+        # flag every position at which the ballot would be truncated, by each exhaustion rule
+        n_skips = int(rules["exhaust_on_N_repeated_skipped_marks"])
+        skip_break = np.zeros_like(valid)
+        if n_skips and n_skips <= rank_limit:
+
+            def repeated_skip_positions():
+                positions = np.zeros_like(valid)
+                skip_counts = np.zeros((n_rows, rank_limit + 1), dtype=np.int64)
+                np.cumsum(is_skipped, axis=1, out=skip_counts[:, 1:])
+                n_windows = rank_limit - n_skips + 1
+                window_all_skipped = (skip_counts[:, n_skips:] - skip_counts[:, :n_windows]) == n_skips
+                # count of non-skipped marks from each position to the end of the row
+                remaining = np.zeros((n_rows, rank_limit + 1), dtype=np.int64)
+                remaining[:, :-1] = np.cumsum((valid & ~is_skipped)[:, ::-1], axis=1)[:, ::-1]
+                positions[:, :n_windows] = window_all_skipped & (remaining[:, n_skips:] > 0)
+                return positions
+
+            skip_break = self._rule_step(("skip_break", n_skips), repeated_skip_positions)
+
+        overvote_break = np.zeros_like(valid)
+        if rules["exhaust_on_overvote_marks"]:
+            overvote_break = self._rule_step(("overvote_break",), lambda: rows == overvote)
+
+        duplicate_break = np.zeros_like(valid)
+        if rules["exhaust_on_duplicate_candidate_marks"]:
+            # rows differ with write-ins combined first, whatever matcher (or lack of one) picked them out
+            duplicate_key = ("duplicate_break", combine_first, writein_matcher if combine_first else None)
+            duplicate_break = self._rule_step(duplicate_key, lambda: self._duplicate_positions(rows))
+
+        breaks = skip_break | overvote_break | duplicate_break
+        has_break = breaks.any(axis=1)
+        cut = np.where(has_break, breaks.argmax(axis=1), rank_limit)
+        rows[np.arange(rank_limit) >= cut[:, None]] = empty
+
+        specific_exhaust = [None] * n_rows
+        for row_idx in np.flatnonzero(has_break).tolist():
+            cut_idx = cut[row_idx]
+            if skip_break[row_idx, cut_idx]:
+                specific_exhaust[row_idx] = BallotMarks.MAYBE_EXHAUSTED_BY_SKIPPED_RANKING
+            elif overvote_break[row_idx, cut_idx]:
+                specific_exhaust[row_idx] = BallotMarks.MAYBE_EXHAUSTED_BY_OVERVOTE
+            else:
+                specific_exhaust[row_idx] = BallotMarks.MAYBE_EXHAUSTED_BY_DUPLICATE_RANKING
+
+        if combine and not combine_first:
+            rows[(rows != empty) & writein_mask[rows]] = writein
+
+        if rules["exclude_duplicate_candidate_marks"]:
+            rows[self._duplicate_positions(rows)] = empty
+
+        if rules["exclude_overvote_marks"]:
+            rows[rows == overvote] = empty
+
+        if rules["exclude_skipped_marks"]:
+            rows[rows == skipped] = empty
+
+        if rules["exclude_writein_marks"]:
+            rows[rows == writein] = empty
+
+        # shift remaining marks to the front of each row
+        valid = rows != empty
+        order = np.argsort(~valid, axis=1, kind="stable")
+        rows = np.take_along_axis(rows, order, axis=1)
+        row_lengths = valid.sum(axis=1)
+
+        inactive_types = []
+        for row_idx in range(n_rows):
+            if all_skipped[row_idx]:
+                inactive_types.append(BallotMarks.UNDERVOTE)
+            elif not row_lengths[row_idx]:
+                inactive_types.append(BallotMarks.PRETALLY_EXHAUST)
+            elif specific_exhaust[row_idx]:
+                inactive_types.append(specific_exhaust[row_idx])
+            else:
+                inactive_types.append(BallotMarks.MAYBE_EXHAUSTED)
+
+        return BallotMatrix(rows, self.inverse, self.codes), inactive_types
+
+    def apply_rule_set(self, rule_set: Dict, writein_matcher: Optional[WriteinMatcher] = None) -> List[BallotMarks]:
+        """Apply a rule set to every ballot and wrap the results up as BallotMarks objects.
+        Ballots with the same ranking pattern share one object.
+
+        :param rule_set: Rule settings, as returned by :meth:`BallotMarks.new_rule_set`.
+        :type rule_set: Dict
+        :param writein_matcher: Matcher used when combining writeins. Defaults to None
+        :type writein_matcher: Optional[WriteinMatcher], optional
+        :return: List of BallotMarks, one per ballot, with rules applied.
+        :rtype: List[BallotMarks]
+        """
+        rules = BallotMarks.new_rule_set(**rule_set)
+        modified, inactive_types = self.apply_rules(writein_matcher=writein_matcher, **rules)
+
+        row_ballots = []
+        for row_idx, inactive_type in enumerate(inactive_types):
+            ballot = BallotMarks(self.row_marks(row_idx))
+            ballot.update_marks(modified.row_marks(row_idx))
+            ballot.rules = dict(rules)
+            ballot.inactive_type = inactive_type
+            row_ballots.append(ballot)
+
+        return [row_ballots[row_idx] for row_idx in self.inverse.tolist()]
+
+    def _rule_step(self, key: Tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        # steps only depend on the rows and the rules named in the key, never on the rest of the rule set
+        if key not in self._rule_steps:
+            self._rule_steps[key] = compute()
+        return self._rule_steps[key]
+
+    @staticmethod
+    def _duplicate_positions(rows: np.ndarray) -> np.ndarray:
+        # stable sort keeps the first occurrence of a code ahead of its repeats
+        order = np.argsort(rows, axis=1, kind="stable")
+        sorted_rows = np.take_along_axis(rows, order, axis=1)
+        repeat = np.zeros(rows.shape, dtype=bool)
+        repeat[:, 1:] = sorted_rows[:, 1:] == sorted_rows[:, :-1]
+        duplicates = np.zeros(rows.shape, dtype=bool)
+        np.put_along_axis(duplicates, order, repeat, axis=1)
+        # overvote and skipped marks are never candidate duplicates
+        return duplicates & (rows >= CandidateCodes.WRITEIN_CODE)
+
+    def row_subset(self, row_idxs: List[int]) -> BallotMatrix:
+        """
+        :param row_idxs: Indices into unique rows.
+        :type row_idxs: List[int]
+        :return: Matrix holding only the selected rows, with one ballot per row.
+        :rtype: BallotMatrix
+        """
+        subset = BallotMatrix(self.rows[row_idxs], np.arange(len(row_idxs)), self.codes)
+        # every row, in order, is the same rows so intermediate rule results stay valid
+        if np.array_equal(row_idxs, np.arange(self.n_unique())):
+            subset._rule_steps = self._rule_steps
+        return subset
+
+    def ballot_codes(self) -> np.ndarray:
+        """
+        :return: Expanded matrix with one row per ballot.
+        :rtype: np.ndarray
+        """
+        return self.rows[self.inverse]
+
+    def ballot_marks(self) -> BallotMarksSequence:
+        """
+        :return: Sequence of BallotMarks views, one per ballot.
+        :rtype: BallotMarksSequence
+        """
+        return BallotMarksSequence(self)
+
+    def row_view(self, row_idx: int) -> BallotMarksView:
+        """
+        :param row_idx: Index into unique rows.
+        :type row_idx: int
+        :return: Shared read-only BallotMarks view of the unique row.
+        :rtype: BallotMarksView
+        """
+        if row_idx not in self._views:
+            self._views[row_idx] = BallotMarksView(self, row_idx)
+        return self._views[row_idx]
+
+
+class BallotMarksView(BallotMarks):
+    """BallotMarks whose marks are decoded from a :class:`BallotMatrix` row on first access.
+    Views are meant to be read. Use `copy` to get an independent BallotMarks object before applying rules.
+    """
+
+    __slots__ = ("_matrix", "_row_idx")
+
+    def __init__(self, matrix: BallotMatrix, row_idx: int) -> None:
+        """Constructor
+
+        :param matrix: Matrix holding the row.
+        :type matrix: BallotMatrix
+        :param row_idx: Index into the unique rows of `matrix`.
+        :type row_idx: int
+        """
+        super().__init__()
+        self._matrix = matrix
+        self._row_idx = row_idx
+        self._marks = None
+        self._input_marks = None
+
+    @property
+    def marks(self) -> Tuple[str, ...]:
+        if self._marks is None:
+            self._marks = self._matrix.row_marks(self._row_idx)
+        return self._marks
+
+    @property
+    def input_marks(self) -> Tuple[str, ...]:
+        return self.marks
+
+    def update_marks(self, new_marks: List[str]) -> None:
+        raise RuntimeError("BallotMarksView objects are read-only, copy() the view before modifying marks.")
+
+    def clear_rules(self) -> None:
+        raise RuntimeError("BallotMarksView objects are read-only, copy() the view before modifying marks.")
+
+    def apply_rules(self, **rules) -> None:
+        raise RuntimeError("BallotMarksView objects are read-only, copy() the view before applying rules.")
+
+
+class BallotMarksSequence(collections.abc.Sequence):
+    """List-like sequence of BallotMarks views, one per ballot in a :class:`BallotMatrix`."""
+
+    def __init__(self, matrix: BallotMatrix) -> None:
+        self._matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self._matrix)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[BallotMarksView, List[BallotMarksView]]:
+        if isinstance(idx, slice):
+            return [self._matrix.row_view(row_idx) for row_idx in self._matrix.inverse[idx].tolist()]
+        return self._matrix.row_view(int(self._matrix.inverse[idx]))
+
+    def __iter__(self) -> Iterator[BallotMarksView]:
+        row_view = self._matrix.row_view
+        for row_idx in self._matrix.inverse.tolist():
+            yield row_view(row_idx)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, collections.abc.Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def matrix(self) -> BallotMatrix:
+        """
+        :return: Underlying ballot matrix.
+        :rtype: BallotMatrix
+        """
+        return self._matrix
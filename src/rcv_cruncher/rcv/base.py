@@ -12,12 +12,13 @@ import random
 import json
 import pathlib
 
+import numpy as np
 import pandas as pd
 
 import rcv_cruncher.util as util
 
 from rcv_cruncher.cvr.base import CastVoteRecord
-from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
 from rcv_cruncher.rcv.stats import RCV_stats
 from rcv_cruncher.rcv.tables import RCV_tables
 
@@ -27,6 +28,17 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
     Template class, inherits from CastVoteRecord. Creates the function skeleton for use in the definition of specific RCV variant tabulation methods. Also computes set of default statistics for CVR and RCV.
     """
 
+    # variants that re-weight ballots during tabulation must set this, it turns off integer tallies
+    _splits_weights = False
+
+    # variants that read or edit ballot ranks directly during rounds, rather than through the pile helpers
+    # (_candidate_ballots, _next_choice, ...), must turn this off, see _start_piles
+    _pile_tabulation = True
+
+    # variants that only know each round's net transfers, not the flows between candidates behind them, must turn
+    # this off, see _append_net_round_transfer
+    _transfer_flows = True
+
     @staticmethod
     def get_variant_group(rcv_obj: Type[RCV]) -> str:
         """Convenience function for batch script. Categorizes an election as single winner or multi winner based on the number of winners.
@@ -116,7 +128,7 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         save_path = pathlib.Path(save_dir) / "first_choice_to_finalist"
         save_path.mkdir(exist_ok=True, parents=True)
 
-        uid = rcv_obj.get_stats()[0]["unique_id"].item()
+        uid = rcv_obj.unique_id
         for iTab in range(1, rcv_obj.n_tabulations() + 1):
             df = rcv_obj.get_first_choice_to_finalist_table(tabulation_num=iTab)
             df.to_csv(save_path / f"{uid}_tab{iTab}.csv")
@@ -133,7 +145,7 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         save_path = pathlib.Path(save_dir) / "round_by_round_table"
         save_path.mkdir(exist_ok=True, parents=True)
 
-        uid = rcv_obj.get_stats()[0]["unique_id"].item()
+        uid = rcv_obj.unique_id
         for iTab in range(1, rcv_obj.n_tabulations() + 1):
             df = rcv_obj.get_round_by_round_table(tabulation_num=iTab)
             df.to_csv(save_path / f"{uid}_tab{iTab}.csv", index=False)
@@ -208,9 +220,8 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
     def _calc_round_transfer(self) -> None:
         """
         Abstract method to be implemented by RCV variant subclass.
-        This function should append a dictionary to self._tabulations[self._tab_num-1]['transfers'] containing:
-        candidate names as keys, plus one key for 'exhaust' and any other keys for transfer categories
-        values as round transfer flows.
+        This function should fill a transfer matrix from self._new_round_transfer with the round's transfers,
+        one ballot at a time, and pass it to self._append_round_transfer.
         """
         pass
 
@@ -251,6 +262,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
         disable_aggregation: bool = False,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
         exhaust_on_duplicate_candidate_marks: bool = False,
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
@@ -261,10 +276,11 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         multi_winner_rounds: bool = False,
         bottoms_up_threshold: Optional[float] = None,
         truncate_to: Optional[int] = 4,
-        writeins_eliminated_first: bool = False
+        writeins_eliminated_first: bool = False,
+        batch_elimination: bool = False,
     ) -> None:
         """
-        Constructor. Subclass of CastVoteRecord. Initializes CastVoteRecord superclass, applies contest rules to ballots, tabulates the election, and calculates default statistics.
+        Constructor. Subclass of CastVoteRecord. Initializes CastVoteRecord superclass, applies contest rules to ballots, and tabulates the election. Default statistics are computed on first use, unless **eager_stats** is True.
 
         First set of arguments are identical to CastVoteRecord constructor.
 
@@ -278,6 +294,8 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :type bottoms_up_threshold: Optional[float], optional
         :param truncate_to: int or None representing how many decimal places to truncate surplas ballot transfers, if None, does not truncacte, defaults to 4
         :parma writeins_eliminated_first: sets writeins as first loser (in _set_loser_round()) regardless of their number of votes. value should be True or False
+        :param batch_elimination: If True, every trailing group of candidates whose combined votes are fewer than the votes of the next candidate up is eliminated in a single round, see `_batch_losers`. Defaults to False
+        :type batch_elimination: bool, optional
         """
         writeins_eliminated_first = str(writeins_eliminated_first).lower() == 'true' #least clumsy way I can find it keep writeins_eliminated_first a bool
 
@@ -294,6 +312,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             parsed_cvr,
             split_fields,
             disable_aggregation,
+            ballot_matrix,
+            writein_matcher,
+            cvr,
+            eager_stats,
         )
 
         # APPLY CONTEST RULES
@@ -324,6 +346,7 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         self._contest_cvr_ld = None
         self._truncate_to = truncate_to
         self._writeins_lose_first = writeins_eliminated_first
+        self._batch_elimination = batch_elimination
         self._reset_ballots()
 
 
@@ -341,18 +364,17 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         self._round_num = 0
         self._round_winners = []
         self._round_loser = None
+        self._round_losers = []
 
         # RUN
         self._run_contest()
 
-        # CONTEST STATS
+        # CONTEST STATS, computed on first use, see _get_contest_stat_table
         self._contest_stat_table = None
-        self._compute_contest_stat_table()
-
         self._summary_contest_stat_tables = None
-        self._compute_summary_contest_stat_tables()
-
         self._summary_contest_split_stat_tables = None
+        if eager_stats:
+            self._get_summary_contest_stat_tables()
 
     def get_stats(
         self,
@@ -371,11 +393,16 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :return: A single row dataframe with statistics organized in multiple columns. If `split_fields` are passed, then extra rows are added for each category in the split columns. One dataframe is returned per tabulation.
         :rtype: List[pd.DataFrame]
         """
+        return self._memoized_stats(keep_decimal_type, add_split_stats, add_id_info)
+
+    def _compute_stats(
+        self, keep_decimal_type: bool, add_split_stats: bool, add_id_info: bool
+    ) -> List[pd.DataFrame]:
 
         # add on the contest stats for each tabulation
         contest_stats = [
-            pd.concat([self._summary_cvr_stat_table, df], axis="columns", sort=False)
-            for df in self._summary_contest_stat_tables
+            pd.concat([self._get_summary_cvr_stat_table(), df], axis="columns", sort=False)
+            for df in self._get_summary_contest_stat_tables()
         ]
 
         # add on the id info
@@ -427,27 +454,279 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         return contest_stats
 
     def _reset_ballots(self) -> None:
+        # tabulate over rank groups, see CastVoteRecord._get_rank_groups
         contest_cvr_dl = self.get_cvr_dict(self._contest_rule_set_name, disaggregate=False)
+        _, group_rows = self._get_rank_groups()
+
+        row_weights = contest_cvr_dl["weight"]
+        group_weights = []
+        for rows in group_rows:
+            weight = row_weights[rows[0]]
+            for row_idx in rows[1:]:
+                weight += row_weights[row_idx]
+            group_weights.append(weight)
+
         self._contest_cvr_ld = [
-            {"ballot_marks": bm, "weight": weight, "weight_distrib": []}
-            for bm, weight in zip(contest_cvr_dl["ballot_marks"], contest_cvr_dl["weight"])
+            {"ballot_marks": contest_cvr_dl["ballot_marks"][rows[0]], "weight": weight}
+            for rows, weight in zip(group_rows, group_weights)
         ]
 
+        # whole number weights are tallied as ints when ballots are never re-weighted, see _tally_active_ballots
+        self._contest_integer_weights = None
+        row_integer_weights = self._get_integer_weights()
+        if row_integer_weights is not None and not self._splits_weights:
+            self._contest_integer_weights = [sum(row_integer_weights[row_idx] for row_idx in rows) for rows in group_rows]
+
+        # pile tabulation state, see _start_piles
+        self._piles = None
+
+    def _expand_rank_groups(self, group_values: List) -> List:
+        """Repeat per rank group tabulation values for every aggregated CVR row in the group.
+
+        :param group_values: One value per rank group.
+        :type group_values: List
+        :return: One value per aggregated CVR row.
+        :rtype: List
+        """
+        group_index, _ = self._get_rank_groups()
+        return [group_values[group_idx] for group_idx in group_index]
+
+    def _rank_group_weight_splitter(self, tabulation_num: int) -> Callable[[decimal.Decimal, int], decimal.Decimal]:
+        """Return a function that takes a rank group weight and an aggregated CVR row index and returns the row's
+        share of that weight. Shares are proportional to the initial weight of each row in the group.
+
+        :param tabulation_num: Tabulation the weights belong to.
+        :type tabulation_num: int
+        :rtype: Callable[[decimal.Decimal, int], decimal.Decimal]
+        """
+        group_index, group_rows = self._get_rank_groups()
+        group_initial_weights = self._tabulations[tabulation_num - 1]["ballot_round_weight"][0]
+        row_weights = self.get_cvr_dict(self._contest_rule_set_name, disaggregate=False)["weight"]
+
+        def split(weight: decimal.Decimal, row_idx: int) -> decimal.Decimal:
+            group_idx = group_index[row_idx]
+            if len(group_rows[group_idx]) == 1:
+                return weight
+            if weight == group_initial_weights[group_idx]:
+                return row_weights[row_idx]
+            return row_weights[row_idx] * weight / group_initial_weights[group_idx]
+
+        return split
+
+    def _expand_rank_group_weights(self, group_weights: List[decimal.Decimal], tabulation_num: int) -> List[decimal.Decimal]:
+        """Split per rank group weights between the aggregated CVR rows in each group.
+
+        :param group_weights: One weight per rank group.
+        :type group_weights: List[decimal.Decimal]
+        :param tabulation_num: Tabulation the weights belong to.
+        :type tabulation_num: int
+        :return: One weight per aggregated CVR row.
+        :rtype: List[decimal.Decimal]
+        """
+        group_index, _ = self._get_rank_groups()
+        split = self._rank_group_weight_splitter(tabulation_num)
+        return [split(group_weights[group_idx], row_idx) for row_idx, group_idx in enumerate(group_index)]
+
     def _pre_check(self) -> None:
         """
         Any checks on the input data to make sure tabulation will be possible.
         """
 
         # check for all blank ballots, undervote or blank before exhaust
-        ballot_sets = [b["ballot_marks"].unique_marks for b in self._contest_cvr_ld]
-        if not set.union(*ballot_sets):
+        if self._piles is not None:
+            all_blank = all(candidate == "exhaust" for candidate in self._pile_alloc)
+        else:
+            all_blank = not any(b["ballot_marks"].unique_marks for b in self._contest_cvr_ld)
+
+        if all_blank:
             raise RuntimeError(f"(tabulation={self._tab_num}) all effectively blank ballots")
 
+    def _start_piles(self) -> None:
+        """
+        Switch the tabulation over to candidate piles. Ballot ranks are left untouched, instead each ballot keeps
+        a cursor pointing at its current choice and sits in that candidate's pile (or the "exhaust" pile).
+        Candidates still active are tracked as a bitmask. _clean_ballots then only moves the ballots in the piles
+        of newly inactive candidates on to the next rank whose bit is still set.
+
+        When ballots are tallied with whole number weights (see _reset_ballots) running pile totals are kept as
+        well, so _tally_active_ballots does not need to pass over every ballot each round.
+        """
+        if not self._pile_tabulation:
+            self._piles = None
+            return
+
+        self._candidate_bits = {
+            cand: 1 << bit for bit, cand in enumerate(sorted(self._contest_candidates.unique_candidates))
+        }
+        self._active_mask = sum(self._candidate_bits.values())
+
+        self._pile_ranks = [b["ballot_marks"].marks for b in self._contest_cvr_ld]
+        self._pile_cursors = [0] * len(self._pile_ranks)
+        self._pile_alloc = [marks[0] if marks else "exhaust" for marks in self._pile_ranks]
+
+        self._piles = {cand: [] for cand in self._candidate_bits}
+        self._piles["exhaust"] = []
+        for ballot_idx, cand in enumerate(self._pile_alloc):
+            self._piles[cand].append(ballot_idx)
+
+        self._pile_totals = None
+        if self._contest_integer_weights is not None:
+            self._pile_weights = [b["weight"] for b in self._contest_cvr_ld]
+            self._pile_totals = {cand: 0 for cand in self._piles}
+            for cand, int_weight in zip(self._pile_alloc, self._contest_integer_weights):
+                self._pile_totals[cand] += int_weight
+
+    def _start_tabulation(self) -> None:
+        """
+        Place each ballot with its first active choice before the first round: move ballots between candidate
+        piles, where possible, and remove inactive candidates.
+        """
+        self._start_piles()
+        self._clean_ballots()
+
+    def _end_tabulation(self) -> None:
+        """
+        Called once the last round is over, before final ballot weight distributions are recorded. Variants that
+        only know the weight allocated to winners at the end of tabulation add it to the weight ledger here.
+        """
+        pass
+
+    def _next_pile(self, ballot_idx: int, skip_mask: int = 0) -> Tuple[int, str]:
+        """
+        Find the next choice on a ballot after its current one that is still active.
+
+        :param ballot_idx: Ballot position in self._contest_cvr_ld.
+        :type ballot_idx: int
+        :param skip_mask: Bits of active candidates to pass over as well, defaults to 0
+        :type skip_mask: int, optional
+        :return: Cursor position and candidate of the next choice, the candidate is "exhaust" if there is none.
+        :rtype: Tuple[int, str]
+        """
+        marks = self._pile_ranks[ballot_idx]
+        bits = self._candidate_bits
+        mask = self._active_mask & ~skip_mask
+        cursor = self._pile_cursors[ballot_idx] + 1
+        while cursor < len(marks) and not bits[marks[cursor]] & mask:
+            cursor += 1
+        return cursor, marks[cursor] if cursor < len(marks) else "exhaust"
+
+    def _move_piles(self, candidates: List[str]) -> None:
+        """
+        Clear the bits of `candidates` and move every ballot in their piles on to its next active choice.
+
+        :param candidates: Candidates that have just been removed.
+        :type candidates: List[str]
+        """
+        for cand in candidates:
+            self._active_mask &= ~self._candidate_bits[cand]
+
+        for cand in candidates:
+
+            pile = self._piles[cand]
+            self._piles[cand] = []
+
+            for ballot_idx in pile:
+                cursor, next_cand = self._next_pile(ballot_idx)
+                self._pile_cursors[ballot_idx] = cursor
+                self._pile_alloc[ballot_idx] = next_cand
+                self._piles[next_cand].append(ballot_idx)
+
+            if self._pile_totals is not None:
+                self._pile_totals[cand] = 0
+                for ballot_idx in pile:
+                    self._pile_totals[self._pile_alloc[ballot_idx]] += self._contest_integer_weights[ballot_idx]
+
+    def _current_choices(self) -> List[str]:
+        """
+        :return: The candidate each ballot currently counts towards, or "exhaust".
+        :rtype: List[str]
+        """
+        if self._piles is not None:
+            return list(self._pile_alloc)
+        return [b["ballot_marks"].marks[0] if b["ballot_marks"].marks else "exhaust" for b in self._contest_cvr_ld]
+
+    def _current_ranks(self) -> List[List[str]]:
+        """
+        Ballot ranks with inactive candidates removed. With piles these are derived on access from the
+        untouched ballot ranks and a copy of the active candidate bitmask, rather than stored per ballot.
+
+        :rtype: List[List[str]]
+        """
+        if self._piles is None:
+            return [b["ballot_marks"].get_marks() for b in self._contest_cvr_ld]
+
+        ranks = self._pile_ranks
+        bits = self._candidate_bits
+        mask = self._active_mask
+        return util.LazyList(len(ranks), lambda ballot_idx: [mark for mark in ranks[ballot_idx] if bits[mark] & mask])
+
+    def _candidate_ballots(self, candidate: str) -> List[int]:
+        """
+        :param candidate: Candidate name.
+        :type candidate: str
+        :return: Positions in self._contest_cvr_ld of the ballots currently counting towards `candidate`, in
+        ballot order.
+        :rtype: List[int]
+        """
+        if self._piles is not None:
+            return sorted(self._piles[candidate])
+        return [
+            ballot_idx
+            for ballot_idx, b in enumerate(self._contest_cvr_ld)
+            if b["ballot_marks"].marks and b["ballot_marks"].marks[0] == candidate
+        ]
+
+    def _next_choice(self, ballot_idx: int, skip_candidates: Optional[List[str]] = None) -> str:
+        """
+        :param ballot_idx: Ballot position in self._contest_cvr_ld.
+        :type ballot_idx: int
+        :param skip_candidates: Active candidates to pass over as well, defaults to None
+        :type skip_candidates: Optional[List[str]], optional
+        :return: The ballot's next active choice after its current one, or "exhaust" if there is none.
+        :rtype: str
+        """
+        if self._piles is not None:
+            skip_mask = sum(self._candidate_bits[cand] for cand in skip_candidates) if skip_candidates else 0
+            return self._next_pile(ballot_idx, skip_mask)[1]
+
+        skip = set(skip_candidates) if skip_candidates else set()
+        for mark in self._contest_cvr_ld[ballot_idx]["ballot_marks"].marks[1:]:
+            if mark not in skip:
+                return mark
+        return "exhaust"
+
+    def _ballot_transfers(
+        self, candidate: str, skip_candidates: Optional[List[str]] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Ballots currently counting towards `candidate`, paired with their next continuing choice.
+
+        :param candidate: Candidate whose ballots are transferred.
+        :type candidate: str
+        :param skip_candidates: Active candidates to pass over as well, e.g. others eliminated in the same round,
+        defaults to None
+        :type skip_candidates: Optional[List[str]], optional
+        :return: Ballot positions in self._contest_cvr_ld, in ballot order, and the candidate each would transfer
+        to, "exhaust" if none is left.
+        :rtype: List[Tuple[int, str]]
+        """
+        if self._piles is not None:
+            skip_mask = sum(self._candidate_bits[cand] for cand in skip_candidates) if skip_candidates else 0
+            return [
+                (ballot_idx, self._next_pile(ballot_idx, skip_mask)[1])
+                for ballot_idx in self._candidate_ballots(candidate)
+            ]
+        return [
+            (ballot_idx, self._next_choice(ballot_idx, skip_candidates))
+            for ballot_idx in self._candidate_ballots(candidate)
+        ]
+
     def _new_tabulation(self) -> None:
         """
         Add a new set of results for tabulation
         """
         self._tab_num += 1
+        self._stats_memo = {}
         new_outcomes = {
             cand: {"name": cand, "round_eliminated": None, "round_elected": None}
             for cand in self._contest_candidates.unique_candidates
@@ -457,13 +736,18 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
                 "rounds": [],
                 "summary_transfers": [],
                 "by_candidate_transfers": [],
+                "transfer_matrices": [],
                 "candidate_outcomes": new_outcomes,
+                "weight_ledger": util.WeightLedger(),
                 "final_weight_distrib": [],
                 "final_ranks": [],
                 "initial_ranks": [],
-                "ballot_round_allocation": [],
-                "ballot_round_weight": [],
+                "ballot_round_allocation": util.RoundHistory(),
+                "ballot_round_weight": util.RoundHistory(),
                 "win_threshold": None,
+                "convergence_tolerance": None,
+                "convergence_iterations": None,
+                "round_tally_cache": {},
             }
         )
 
@@ -475,15 +759,14 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         # use to mark first elimination round that occurs
         first_elimination_round = None
 
-        # remove inactive candidates
-        self._clean_ballots()
+        # place each ballot with its first active choice
+        self._start_tabulation()
 
         # checks to make tabulation can proceed
         self._pre_check()
 
         # store initial values
-        initial_ranks = [b["ballot_marks"].marks for b in self._contest_cvr_ld]
-        self._tabulations[self._tab_num - 1]["initial_ranks"] = initial_ranks
+        self._tabulations[self._tab_num - 1]["initial_ranks"] = self._current_ranks()
 
         not_complete = self._contest_not_complete()
         while not_complete:
@@ -493,6 +776,7 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             # CLEAR LAST ROUND VALUES
             self._round_winners = []
             self._round_loser = None
+            self._round_losers = []
 
             #############################################
             # COUNT ROUND RESULTS
@@ -539,10 +823,7 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             if not_complete:
                 self._calc_round_transfer()
             else:
-                self._tabulations[self._tab_num - 1]["summary_transfers"].append(
-                    {cand: util.NAN for cand in self._contest_candidates.unique_candidates.union({"exhaust"})}
-                )
-                self._tabulations[self._tab_num - 1]["by_candidate_transfers"].append({})
+                self._append_round_transfer(None)
 
             #############################################
             # CLEAN ROUND BALLOTS
@@ -551,32 +832,45 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             if not_complete:
                 self._clean_ballots()
 
-        # record final ballot weight distributions
-        final_weight_distrib = [
-            b["weight_distrib"] + [(b["ballot_marks"].marks[0], b["weight"])]
-            if b["ballot_marks"].marks
-            else b["weight_distrib"] + [("exhaust", b["weight"])]
-            for b in self._contest_cvr_ld
-        ]
-        self._tabulations[self._tab_num - 1]["final_weight_distrib"] = final_weight_distrib
+        self._end_tabulation()
+
+        # record final ballot weight distributions, weight allocated along the way followed by where each ballot
+        # ended up in the final round
+        tabulation = self._tabulations[self._tab_num - 1]
+        ballot_allocations = tabulation["weight_ledger"].ballot_allocations()
+        final_alloc = tabulation["ballot_round_allocation"][-1]
+        final_alloc_weight = tabulation["ballot_round_weight"][-1]
+        tabulation["final_weight_distrib"] = util.LazyList(
+            len(final_alloc),
+            lambda ballot_idx: ballot_allocations.get(ballot_idx, [])
+            + [(final_alloc[ballot_idx], final_alloc_weight[ballot_idx])],
+        )
 
         # set final ranks for each ballot
-        final_ranks = [b["ballot_marks"].marks for b in self._contest_cvr_ld]
-        self._tabulations[self._tab_num - 1]["final_ranks"] = final_ranks
+        self._tabulations[self._tab_num - 1]["final_ranks"] = self._current_ranks()
+        self._piles = None
 
         self._tabulations[self._tab_num - 1]["win_threshold"] = self._win_threshold()
 
     def _clean_ballots(self) -> None:
         """
-        Remove any newly inactivated candidates from the ballot ranks.
+        Remove any newly inactivated candidates from the ballot ranks. With piles, ballot ranks are left as they
+        are and ballots counting towards those candidates move on to their next active choice.
         """
+        if self._piles is not None:
+            new_inactive = [
+                cand for cand in dict.fromkeys(self._inactive_candidates) if cand not in self._removed_candidates
+            ]
+            self._move_piles(new_inactive)
+            self._removed_candidates += new_inactive
+            return
+
         for inactive_cand in self._inactive_candidates:
             if inactive_cand not in self._removed_candidates:
                 self._contest_cvr_ld = [
                     {
                         "ballot_marks": BallotMarks.remove_mark(b["ballot_marks"], [inactive_cand]),
                         "weight": b["weight"],
-                        "weight_distrib": b["weight_distrib"],
                     }
                     for b in self._contest_cvr_ld
                 ]
@@ -585,28 +879,114 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
     def _tally_active_ballots(self) -> None:
 
         # tally current and distributed weights
-        ballot_alloc = []
         ballot_alloc_weight = []
         vote_alloc = collections.Counter({cand: 0 for cand in self._contest_candidates.unique_candidates})
 
-        for b in self._contest_cvr_ld:
+        if self._piles is not None and self._pile_totals is not None:
+
+            # candidates without votes keep the int 0 they start with
+            for candidate in vote_alloc:
+                if self._pile_totals[candidate]:
+                    vote_alloc[candidate] = decimal.Decimal(self._pile_totals[candidate])
+
+            self._append_round_tally(vote_alloc, self._pile_alloc, self._pile_weights)
+            return
+
+        ballot_alloc = self._current_choices()
+
+        if self._contest_integer_weights is not None:
+
+            int_alloc = collections.Counter()
+            for b, candidate, int_weight in zip(self._contest_cvr_ld, ballot_alloc, self._contest_integer_weights):
+                ballot_alloc_weight.append(b["weight"])
+                if candidate != "exhaust":
+                    int_alloc[candidate] += int_weight
+
+            # candidates without votes keep the int 0 they start with
+            for candidate, int_count in int_alloc.items():
+                vote_alloc[candidate] = decimal.Decimal(int_count)
+
+            self._append_round_tally(vote_alloc, ballot_alloc, ballot_alloc_weight)
+            return
+
+        for b, candidate in zip(self._contest_cvr_ld, ballot_alloc):
 
-            candidate = "exhaust" if len(b["ballot_marks"].marks) == 0 else b["ballot_marks"].marks[0]
-            ballot_alloc.append(candidate)
             ballot_alloc_weight.append(b["weight"])
 
             if candidate != "exhaust":
                 vote_alloc[candidate] += b["weight"]
 
-            if b["weight_distrib"]:
-                for candidate, weight in b["weight_distrib"]:
-                    vote_alloc[candidate] += weight
+        # weight already allocated to candidates no longer on any ballot, e.g. winners of transferred surplus
+        for candidate, weight in self._tabulations[self._tab_num - 1]["weight_ledger"].totals.items():
+            vote_alloc[candidate] += weight
+
+        self._append_round_tally(vote_alloc, ballot_alloc, ballot_alloc_weight)
 
+    def _append_round_tally(
+        self, vote_alloc: collections.Counter, ballot_alloc: List[str], ballot_alloc_weight: List[decimal.Decimal]
+    ) -> None:
         round_results = list(zip(*vote_alloc.most_common()))
         self._tabulations[self._tab_num - 1]["rounds"].append(round_results)
+        self._tabulations[self._tab_num - 1]["round_tally_cache"].clear()
         self._tabulations[self._tab_num - 1]["ballot_round_allocation"].append(ballot_alloc)
         self._tabulations[self._tab_num - 1]["ballot_round_weight"].append(ballot_alloc_weight)
 
+    def _new_round_transfer(self) -> util.TransferMatrix:
+        """
+        :return: Empty transfer matrix over all candidates and "exhaust", to be filled by _calc_round_transfer.
+        :rtype: util.TransferMatrix
+        """
+        return util.TransferMatrix(self._contest_candidates.unique_candidates.union({"exhaust"}))
+
+    def _transfer_weight(self, ballot_idx: int) -> Union[int, decimal.Decimal]:
+        """
+        :param ballot_idx: Ballot position in self._contest_cvr_ld.
+        :type ballot_idx: int
+        :return: Ballot weight to transfer, as an int when ballots are tallied with whole number weights.
+        :rtype: Union[int, decimal.Decimal]
+        """
+        if self._contest_integer_weights is not None:
+            return self._contest_integer_weights[ballot_idx]
+        return self._contest_cvr_ld[ballot_idx]["weight"]
+
+    def _append_round_transfer(self, transfers: Optional[util.TransferMatrix]) -> None:
+        """
+        Store the round's transfers and the netted and by candidate transfer dicts derived from them.
+
+        :param transfers: Transfers out of the round, None if the contest ended this round.
+        :type transfers: Optional[util.TransferMatrix]
+        """
+        tabulation = self._tabulations[self._tab_num - 1]
+        tabulation["transfer_matrices"].append(transfers)
+        if transfers is None:
+            tabulation["summary_transfers"].append(
+                {cand: util.NAN for cand in self._contest_candidates.unique_candidates.union({"exhaust"})}
+            )
+            tabulation["by_candidate_transfers"].append({})
+        else:
+            tabulation["summary_transfers"].append(transfers.summary_dict())
+            tabulation["by_candidate_transfers"].append(transfers.by_candidate_dict())
+
+    def _append_net_round_transfer(self, transfers: Dict[str, Union[int, decimal.Decimal]]) -> None:
+        """
+        Store the round's net transfers, for variants without flows between candidates. No transfer matrix or by
+        candidate transfers are stored.
+
+        :param transfers: Net transfer to (positive) or from (negative) each candidate and "exhaust".
+        :type transfers: Dict[str, Union[int, decimal.Decimal]]
+        """
+        tabulation = self._tabulations[self._tab_num - 1]
+        tabulation["transfer_matrices"].append(None)
+        tabulation["summary_transfers"].append(transfers)
+        tabulation["by_candidate_transfers"].append({})
+
+    def _check_transfer_flows(self) -> None:
+        if not self._transfer_flows:
+            raise RuntimeError(
+                f"{self.__class__.__name__} only records net transfers, use get_round_transfer_dict with "
+                + "candidate_netted=True"
+            )
+
     def _update_candidates(self) -> None:
         """
         Update candidate outcomes
@@ -621,12 +1001,13 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         # if contest is not over
         if self._contest_not_complete():
 
-            # if no winner, add loser
+            # if no winner, add losers
             if not self._round_winners:
-                self._inactive_candidates.append(self._round_loser)
-                self._tabulations[self._tab_num - 1]["candidate_outcomes"][self._round_loser][
-                    "round_eliminated"
-                ] = self._round_num
+                for loser in self._round_losers:
+                    self._inactive_candidates.append(loser)
+                    self._tabulations[self._tab_num - 1]["candidate_outcomes"][loser][
+                        "round_eliminated"
+                    ] = self._round_num
 
         # if contest is over
         else:
@@ -645,6 +1026,9 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         """
         Find candidate from round with least votes.
         If more than one, choose randomly
+
+        With batch elimination, all the candidates of the largest trailing group that cannot catch up are losers,
+        see `_batch_losers`. self._round_losers holds every loser, self._round_loser the one with least votes.
         """
 
 
@@ -653,10 +1037,16 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             self._round_num, self._tab_num, only_round_active_candidates=True
         )
 
+        batch_losers = self._batch_losers(active_candidates, round_tallies) if self._batch_elimination else []
+
         if self._writeins_lose_first and ("writein" in active_candidates):
 
             self._round_loser = "writein"
 
+        elif batch_losers:
+
+            self._round_losers = batch_losers
+            self._round_loser = batch_losers[0]
 
         else: #if self._round_loser != "writein":
             # find round loser
@@ -674,6 +1064,47 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
             )
             self._round_loser = random.sample(round_losers, 1)[0]
 
+        if not self._round_losers:
+            self._round_losers = [self._round_loser]
+
+    def _batch_losers(self, active_candidates: Tuple[str], round_tallies: Tuple) -> List[str]:
+        """
+        Find the largest group of trailing candidates whose combined votes are fewer than the votes of the candidate
+        just above the group. Transfers between members of the group cannot lift any of them past that candidate. The
+        group never takes the number of continuing candidates below `_min_continuing_candidates`.
+
+        :param active_candidates: Round active candidates, in tally order.
+        :type active_candidates: Tuple[str]
+        :param round_tallies: Round votes of each active candidate.
+        :type round_tallies: Tuple
+        :return: Candidates in the group, least votes first. Empty if no group has more than one candidate.
+        :rtype: List[str]
+        """
+        # ignore zero vote candidates, as for a single loser
+        tallies = sorted((tally, cand) for cand, tally in zip(active_candidates, round_tallies) if tally)
+        max_group = len(tallies) - self._min_continuing_candidates()
+
+        group_size = 0
+        group_votes = 0
+        for size, (tally, _) in enumerate(tallies[:-1], start=1):
+            group_votes += tally
+            if size > max_group:
+                break
+            if group_votes < tallies[size][0]:
+                group_size = size
+
+        if group_size < 2:
+            return []
+        return [cand for _, cand in tallies[:group_size]]
+
+    def _min_continuing_candidates(self) -> int:
+        """
+        Number of round active candidates that batch elimination must leave continuing.
+
+        :rtype: int
+        """
+        return 2
+
     def get_round_tally_tuple(
         self,
         round_num: int,
@@ -692,34 +1123,44 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :return: List of tuples containing candidate names and vote totals.
         :rtype: List[Tuple[str, decimal.Decimal]]
         """
+        return list(self._round_tally(round_num, tabulation_num, only_round_active_candidates)[0])
+
+    def _round_tally(
+        self, round_num: int, tabulation_num: int, only_round_active_candidates: bool
+    ) -> Tuple[List[Tuple[str, decimal.Decimal]], Dict[str, decimal.Decimal]]:
+        """
+        Sorted round tally, as returned by get_round_tally_tuple, and the same tally as a dictionary. Both are
+        cached per tabulation until the next round is added. Candidates leave the active set in the round they are
+        elected or eliminated or later, so a finished round's tally never changes.
+
+        :rtype: Tuple[List[Tuple[str, decimal.Decimal]], Dict[str, decimal.Decimal]]
+        """
+        cache = self._tabulations[tabulation_num - 1]["round_tally_cache"]
+        cache_key = (round_num, only_round_active_candidates)
+        if cache_key in cache:
+            return cache[cache_key]
+
         cands, tallies = self._tabulations[tabulation_num - 1]["rounds"][round_num - 1]
 
         # remove elected or eliminated candidates
         if only_round_active_candidates:
 
             outcomes = self._tabulations[tabulation_num - 1]["candidate_outcomes"]
-
-            elected_filter = [
-                (outcomes[cand]["round_elected"] is None or outcomes[cand]["round_elected"] >= round_num)
-                for cand in outcomes
-            ]
-            eliminated_filter = [
-                (outcomes[cand]["round_eliminated"] is None or outcomes[cand]["round_eliminated"] >= round_num)
-                for cand in outcomes
-            ]
-
-            active_candidates = [
+            active_candidates = {
                 cand
-                for cand, elect_filt, elim_filt in zip(outcomes, elected_filter, eliminated_filter)
-                if elect_filt and elim_filt
-            ]
-            tallies = [tally for idx, tally in enumerate(tallies) if cands[idx] in active_candidates]
+                for cand, outcome in outcomes.items()
+                if (outcome["round_elected"] is None or outcome["round_elected"] >= round_num)
+                and (outcome["round_eliminated"] is None or outcome["round_eliminated"] >= round_num)
+            }
+            tallies = [tally for cand, tally in zip(cands, tallies) if cand in active_candidates]
             cands = [cand for cand in cands if cand in active_candidates]
 
         # sort
         rounds = list(zip(*[(cand, tally) for cand, tally in sorted(zip(cands, tallies), key=lambda x: (-x[1], x[0]))]))
+        round_dict = dict(zip(*rounds))
 
-        return rounds
+        cache[cache_key] = (rounds, round_dict)
+        return rounds, round_dict
 
     def get_round_tally_dict(
         self,
@@ -739,22 +1180,12 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :return: Dictionary containing candidate names and vote totals.
         :rtype: Dict[str, decimal.Decimal]
         """
-        # convert to dict
-        return {
-            cand: count
-            for cand, count in zip(
-                *self.get_round_tally_tuple(
-                    round_num,
-                    tabulation_num,
-                    only_round_active_candidates=only_round_active_candidates,
-                )
-            )
-        }
+        return dict(self._round_tally(round_num, tabulation_num, only_round_active_candidates)[1])
 
     def get_round_transfer_dict(
         self, round_num: int, candidate_netted: bool = True, tabulation_num: int = 1
     ) -> Union[Dict[str, decimal.Decimal], Dict[str, Dict[str, decimal.Decimal]]]:
-        """Return a dictionary describing vote transfers from round specified. Keys are candidate names. If `candidate_netted` is True, an extra key 'exhaust' is included and dictionary values are the net vote counts flowing to/from a candidate. Else, values are each another dictionary containing candidate names, plus 'exhaust', as keys and vote flows from the outer key candidate to the inner key candidate.
+        """Return a dictionary describing vote transfers from round specified. Keys are candidate names. If `candidate_netted` is True, an extra key 'exhaust' is included and dictionary values are the net vote counts flowing to/from a candidate. Else, values are each another dictionary containing candidate names, plus 'exhaust', as keys and vote flows from the outer key candidate to the inner key candidate. Variants that only record net transfers, such as Meek STV, raise a RuntimeError if `candidate_netted` is False.
 
         :param round_num: Round number to get transfer info for
         :type round_num: int
@@ -768,9 +1199,35 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         if candidate_netted:
             transfers = self._tabulations[tabulation_num - 1]["summary_transfers"]
         else:
+            self._check_transfer_flows()
             transfers = self._tabulations[tabulation_num - 1]["by_candidate_transfers"]
         return transfers[round_num - 1]
 
+    def get_round_transfer_matrix(self, round_num: int, tabulation_num: int = 1) -> pd.DataFrame:
+        """Return a table of vote transfers from the round specified, between every pair of candidates. Rows are the candidates votes are transferred from and columns the candidates, plus 'exhaust', they are transferred to. Useful for building Sankey style diagrams. All values are NaN for the final round, in which no votes are transferred. Variants that only record net transfers, such as Meek STV, raise a RuntimeError.
+
+        :param round_num: Round number to get transfer info for
+        :type round_num: int
+        :param tabulation_num: Tabulation in which to index round number, defaults to 1
+        :type tabulation_num: int, optional
+        :return: Table of vote flows, indexed by candidate transferred from.
+        :rtype: pd.DataFrame
+        """
+        self._check_transfer_flows()
+        transfers = self._tabulations[tabulation_num - 1]["transfer_matrices"][round_num - 1]
+
+        candidates = sorted(self._contest_candidates.unique_candidates)
+        if transfers is None:
+            return pd.DataFrame(util.NAN, index=candidates, columns=candidates + ["exhaust"], dtype=object)
+
+        matrix = transfers.full_matrix()
+        codes = [transfers.candidates.index(cand) for cand in candidates + ["exhaust"]]
+        return pd.DataFrame(
+            [[matrix[from_code][to_code] for to_code in codes] for from_code in codes[:-1]],
+            index=candidates,
+            columns=candidates + ["exhaust"],
+        )
+
     def get_candidate_outcomes(self, tabulation_num: int = 1) -> List[Dict]:
         """Return a list of dictionaries containing candidate outcome information for a given tabulation. Keys are name, round_elected, and round_eliminated. Values for round_elected and round_eliminated are either integers indicating round numbers or None.
 
@@ -793,22 +1250,20 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :rtype: List[decimal.Decimal]
         """
         final_weights = self._tabulations[tabulation_num - 1]["ballot_round_weight"][-1]
+        final_weights = self._expand_rank_group_weights(final_weights, tabulation_num)
 
         if disaggregate and not self._disable_aggregation:
 
             # reduction ratio for each aggregated ballot
-            initial_weights = self.get_initial_weights(disaggregate=False)
+            initial_weights = self.get_initial_weights(tabulation_num=tabulation_num, disaggregate=False)
             reduct_ratio = [(initial - final) / initial for final, initial in zip(final_weights, initial_weights)]
 
             # apply ratio to each disaggregated weight
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-
-            disagg_weights = [
-                [unique_d["weight"] - (unique_d["weight"] * reduct) for unique_d in disagg_info[disagg_info_keys[idx]]]
-                for idx, reduct in enumerate(reduct_ratio)
-            ]
-            final_weights = util.flatten_list(disagg_weights)
+            disagg_reduct = self._disaggregate_values(reduct_ratio)
+            disagg_weights = self._disaggregated_weights()
+            final_weights = util.LazyList(
+                len(disagg_weights), lambda pos: disagg_weights[pos] - (disagg_weights[pos] * disagg_reduct[pos])
+            )
 
         return final_weights
 
@@ -822,17 +1277,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :return: List of lists of candidates/marks.
         :rtype: List[List[str]]
         """
-        initial_ranks = self._tabulations[tabulation_num - 1]["initial_ranks"]
+        initial_ranks = self._expand_rank_groups(self._tabulations[tabulation_num - 1]["initial_ranks"])
 
         if disaggregate and not self._disable_aggregation:
-
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-
-            initial_ranks = [
-                [ranks for _ in disagg_info[disagg_info_keys[idx]]] for idx, ranks in enumerate(initial_ranks)
-            ]
-            initial_ranks = util.flatten_list(initial_ranks)
+            initial_ranks = self._disaggregate_values(initial_ranks)
 
         return initial_ranks
 
@@ -847,12 +1295,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :rtype: List[decimal.Decimal]
         """
         initial_weights = self._tabulations[tabulation_num - 1]["ballot_round_weight"][0]
+        initial_weights = self._expand_rank_group_weights(initial_weights, tabulation_num)
 
         if disaggregate and not self._disable_aggregation:
-
-            disagg_info = self._disaggregation_info
-            disagg_weights = [[unique_d["weight"] for unique_d in disagg_info[key]] for key in disagg_info]
-            initial_weights = util.flatten_list(disagg_weights)
+            initial_weights = self._disaggregated_weights()
 
         return initial_weights
 
@@ -868,15 +1314,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :rtype: List[List[str]]
 
         """
-        final_ranks = self._tabulations[tabulation_num - 1]["final_ranks"]
+        final_ranks = self._expand_rank_groups(self._tabulations[tabulation_num - 1]["final_ranks"])
 
         if disaggregate and not self._disable_aggregation:
-
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-
-            final_ranks = [[ranks for _ in disagg_info[disagg_info_keys[idx]]] for idx, ranks in enumerate(final_ranks)]
-            final_ranks = util.flatten_list(final_ranks)
+            final_ranks = self._disaggregate_values(final_ranks)
 
         return final_ranks
 
@@ -895,6 +1336,14 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         """
         final_weights = self._tabulations[tabulation_num - 1]["final_weight_distrib"]
 
+        # split each rank group distribution between its rows
+        group_index, _ = self._get_rank_groups()
+        split = self._rank_group_weight_splitter(tabulation_num)
+        final_weights = [
+            [(t[0], split(t[1], row_idx)) for t in final_weights[group_idx]]
+            for row_idx, group_idx in enumerate(group_index)
+        ]
+
         if disaggregate and not self._disable_aggregation:
 
             initial_weights = self.get_initial_weights(tabulation_num=tabulation_num, disaggregate=False)
@@ -903,20 +1352,24 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
                 for final_distrib, init_weight in zip(final_weights, initial_weights)
             ]
 
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-
-            final_weights = [
-                [
-                    [(t[0], t[1] * disagg_d["weight"]) for t in weights_percent]
-                    for disagg_d in disagg_info[disagg_info_keys[idx]]
-                ]
-                for idx, weights_percent in enumerate(final_weights_percent)
-            ]
-            final_weights = util.flatten_list(final_weights)
+            disagg_percent = self._disaggregate_values(final_weights_percent)
+            disagg_weights = self._disaggregated_weights()
+            final_weights = util.LazyList(
+                len(disagg_weights),
+                lambda pos: [(t[0], t[1] * disagg_weights[pos]) for t in disagg_percent[pos]],
+            )
 
         return final_weights
 
+    def get_total_pretally_exhausted(self, tabulation_num: int = 1) -> Union[int, decimal.Decimal]:
+        """Weighted number of ballots exhausted before being counted in the first round of a given tabulation. Same value as the 'total_pretally_exhausted' statistic, without converting every statistic to build it.
+
+        :param tabulation_num: Tabulation number, defaults to 1
+        :type tabulation_num: int, optional
+        :rtype: Union[int, decimal.Decimal]
+        """
+        return self._exhaustion_totals(tabulation_num)["total_pretally_exhausted"]
+
     def get_win_threshold(self, tabulation_num: int = 1) -> Union[int, float, str, decimal.Decimal]:
         """Win threshold for a given tabulation expressed as a number of votes. If threshold is not static, string 'dynamic' should be returned.
 
@@ -935,8 +1388,10 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
         :return: List of candidates
         :rtype: List[str]
         """
-        final_weight_distrib = self.get_final_weight_distrib(tabulation_num=tabulation_num)
-        final_weight_cands = list(set(t[0] for t in util.flatten_list(final_weight_distrib)).difference({"exhaust"}))
+        tabulation = self._tabulations[tabulation_num - 1]
+        allocated_cands = set(tabulation["weight_ledger"].candidates)
+        allocated_cands.update(tabulation["ballot_round_allocation"][-1])
+        final_weight_cands = list(allocated_cands.difference({"exhaust"}))
         return final_weight_cands
 
     def n_rounds(self, tabulation_num: int = 1) -> int:
@@ -961,33 +1416,30 @@ class RCV(abc.ABC, CastVoteRecord, RCV_stats, RCV_tables):
     def get_annotated_cvr_table(self):
 
         cvr_stats_annotated_cvr = super().get_annotated_cvr_table()
-        contest_stat_table = self._contest_stat_table
+        contest_stat_table = self._get_contest_stat_table()
 
         if not self._disable_aggregation:
-            disagg_info = self._disaggregation_info
-            disagg_info_keys = list(self._disaggregation_info.keys())
-
-            row_reps = [len(disagg_info[k]) for k in disagg_info_keys]
-            contest_stat_table = contest_stat_table.loc[contest_stat_table.index.repeat(row_reps)].reset_index()
+            _, disagg_index = self._disaggregation_arrays()
+            contest_stat_table = contest_stat_table.loc[contest_stat_table.index.take(disagg_index)].reset_index()
 
         extra_df = pd.DataFrame()
         for iTab in range(1, self._tab_num + 1):
 
             round_exhausted = ["not_exhausted" for i in self.get_initial_ranks()]
 
-            for iRound in range(1, self.n_rounds(tabulation_num=iTab) + 1):
+            # round history is decoded one round after another
+            round_allocations = zip(
+                self._tabulations[iTab - 1]["ballot_round_allocation"],
+                self._tabulations[iTab - 1]["ballot_round_weight"],
+            )
+            for iRound, (ballot_alloc, ballot_alloc_weight) in enumerate(round_allocations, start=1):
 
-                ballot_alloc = self._tabulations[iTab - 1]["ballot_round_allocation"][iRound - 1]
-                ballot_alloc_weight = self._tabulations[iTab - 1]["ballot_round_weight"][iRound - 1]
+                ballot_alloc = self._expand_rank_groups(ballot_alloc)
+                ballot_alloc_weight = self._expand_rank_group_weights(ballot_alloc_weight, iTab)
 
                 if not self._disable_aggregation:
-
-                    ballot_alloc = [[cand for _ in disagg_info[disagg_info_keys[idx]]] for idx, cand in enumerate(ballot_alloc)]
-                    ballot_alloc = util.flatten_list(ballot_alloc)
-
-                    ballot_alloc_weight = [[weight for _ in disagg_info[disagg_info_keys[idx]]]
-                                           for idx, weight in enumerate(ballot_alloc_weight)]
-                    ballot_alloc_weight = util.flatten_list(ballot_alloc_weight)
+                    ballot_alloc = np.array(ballot_alloc, dtype=object)[disagg_index]
+                    ballot_alloc_weight = np.array(ballot_alloc_weight, dtype=object)[disagg_index]
 
                 extra_df[f'ballot_allocation{iTab}_round{iRound}'] = ballot_alloc
                 extra_df[f'ballot_allocation_weight{iTab}_round{iRound}'] = ballot_alloc_weight
@@ -1,9 +1,10 @@
 """Contains RCV_stats class which is added into RCV.
 """
 
-from typing import List
+from typing import Dict, List, Union
 
 import collections
+import decimal
 
 import pandas as pd
 
@@ -49,9 +50,10 @@ class RCV_stats:
         rank restricted ballot: less than or equal to n-2 ranks, where n is number of candidates (not counting writeins).
         """
 
-        restrictive_rank_limit = bool(self._summary_cvr_stat_table["restrictive_rank_limit"].item())
+        # same rule as the restrictive_rank_limit statistic, without building the summary cvr stats
+        restrictive_rank_limit = self.get_rank_limit() < (self.get_n_candidates() - 1)
 
-        used_last_rank_list = self._cvr_stat_table["used_last_rank"]
+        used_last_rank_list = self._get_cvr_stat_table()["used_last_rank"]
         initial_ranks_list = self.get_initial_ranks(tabulation_num=tabulation_num, disaggregate=False)
         final_ranks_list = self.get_final_ranks(tabulation_num=tabulation_num, disaggregate=False)
         ballot_marks_list = self.get_cvr_dict(self._contest_rule_set_name, disaggregate=False)["ballot_marks"]
@@ -303,7 +305,16 @@ class RCV_stats:
 
         winners = self._tabulation_winner(tabulation_num=tabulation_num)
         winner_marked = [bool(set(winners).intersection(b["ballot_marks"].unique_marks)) for b in contest_cvr_ld]
-        return sum(b["weight"] for flag, b in zip(winner_marked, contest_cvr_ld) if flag)
+        return self._sum_weights(winner_marked)
+
+    def _convergence_iterations(self, tabulation_num=1):
+        """
+        Total number of iterations needed to converge the round tallies, for variants that iterate them, otherwise None.
+        """
+        round_iterations = self._tabulations[tabulation_num - 1]["convergence_iterations"]
+        if round_iterations is None:
+            return None
+        return sum(round_iterations)
 
     def _win_threshold(self, tabulation_num=1):
         """
@@ -331,7 +342,25 @@ class RCV_stats:
         winner = self._tabulation_winner(tabulation_num=tabulation_num)
         top3 = [b["ballot_marks"].marks[: min(3, len(b["ballot_marks"].marks))] for b in contest_cvr_ld]
         top3_check = [bool(set(winner).intersection(b)) for b in top3]
-        return sum(b["weight"] for flag, b in zip(top3_check, contest_cvr_ld) if flag)
+        return self._sum_weights(top3_check)
+
+    def _get_contest_stat_table(self) -> pd.DataFrame:
+        """Per ballot contest statistics table, computed on first use.
+
+        :rtype: pd.DataFrame
+        """
+        if self._contest_stat_table is None:
+            self._compute_contest_stat_table()
+        return self._contest_stat_table
+
+    def _get_summary_contest_stat_tables(self) -> List[pd.DataFrame]:
+        """Single row summary contest statistics tables, one per tabulation, computed on first use.
+
+        :rtype: List[pd.DataFrame]
+        """
+        if self._summary_contest_stat_tables is None:
+            self._compute_summary_contest_stat_tables()
+        return self._summary_contest_stat_tables
 
     def _compute_contest_stat_table(self):
 
@@ -377,13 +406,60 @@ class RCV_stats:
             ]
             df["posttally_exhausted" + str(iTab)] = df[all_posttally_conditions].any(axis="columns")
 
-            exh_by_rank_limit_fully_ranked = self._cvr_stat_table["fully_ranked_incl_overvotes"] & df[
+            exh_by_rank_limit_fully_ranked = self._get_cvr_stat_table()["fully_ranked_incl_overvotes"] & df[
                 exhaust_type_str
             ].eq(BallotMarks.POSTTALLY_EXHAUSTED_BY_RANK_LIMIT)
             df[f"posttally_exhausted_by_rank_limit_fully_ranked{iTab}"] = exh_by_rank_limit_fully_ranked
 
         self._contest_stat_table = df
 
+    def _exhaustion_totals(self, tabulation_num: int = 1) -> Dict[str, Union[int, decimal.Decimal]]:
+        """Weighted number of ballots in each exhaustion category, named as in the default statistics.
+
+        :param tabulation_num: Tabulation number, defaults to 1
+        :type tabulation_num: int, optional
+        :rtype: Dict[str, Union[int, decimal.Decimal]]
+        """
+        contest_stat_table = self._get_contest_stat_table()
+        totals = {}
+
+        weight = contest_stat_table[f"final_weight{tabulation_num}"]
+
+        pretally = sum(contest_stat_table[f"pretally_exhausted{tabulation_num}"] * weight)
+        totals["total_pretally_exhausted"] = pretally
+
+        posttally = sum(contest_stat_table[f"posttally_exhausted{tabulation_num}"] * weight)
+        totals["total_posttally_exhausted"] = posttally
+
+        posttally_overvote = sum(contest_stat_table[f"posttally_exhausted_by_overvote{tabulation_num}"] * weight)
+        totals["total_posttally_exhausted_by_overvote"] = posttally_overvote
+
+        posttally_skipped = sum(
+            contest_stat_table[f"posttally_exhausted_by_skipped_rankings{tabulation_num}"] * weight
+        )
+        totals["total_posttally_exhausted_by_skipped_rankings"] = posttally_skipped
+
+        posttally_abstention = sum(contest_stat_table[f"posttally_exhausted_by_abstention{tabulation_num}"] * weight)
+        totals["total_posttally_exhausted_by_abstention"] = posttally_abstention
+
+        posttally_duplicate = sum(
+            contest_stat_table[f"posttally_exhausted_by_duplicate_rankings{tabulation_num}"] * weight
+        )
+        totals["total_posttally_exhausted_by_duplicate_rankings"] = posttally_duplicate
+
+        posttally_rank_limit = sum(contest_stat_table[f"posttally_exhausted_by_rank_limit{tabulation_num}"] * weight)
+        totals["total_posttally_exhausted_by_rank_limit"] = posttally_rank_limit
+
+        posttally_rank_limit_full = sum(
+            contest_stat_table[f"posttally_exhausted_by_rank_limit_fully_ranked{tabulation_num}"] * weight
+        )
+        totals["total_posttally_exhausted_by_rank_limit_fully_ranked"] = posttally_rank_limit_full
+        totals["total_posttally_exhausted_by_rank_limit_partially_ranked"] = (
+            posttally_rank_limit - posttally_rank_limit_full
+        )
+
+        return totals
+
     def _compute_summary_contest_stat_tables(self) -> None:
 
         tabulation_stats = []
@@ -407,6 +483,8 @@ class RCV_stats:
 
             s["n_winners"] = self._n_winners
             s["bottoms_up_threshold"] = self._bottoms_up_threshold
+            s["batch_elimination"] = self._batch_elimination
+            s["convergence_tolerance"] = self._tabulations[iTab - 1]["convergence_tolerance"]
             s["exhaust_on_overvote_marks"] = exhaust_on_overvote
             s["exhaust_on_N_repeated_skipped_marks"] = exhaust_on_N_repeated_skipped
             s["exhaust_on_duplicate_candidate_marks"] = exhaust_on_duplicate
@@ -420,6 +498,7 @@ class RCV_stats:
             s["tabulation_num"] = iTab
             s["winner"] = self._winner(tabulation_num=iTab)
             s["n_rounds"] = self.n_rounds(tabulation_num=iTab)
+            s["convergence_iterations"] = self._convergence_iterations(tabulation_num=iTab)
             s["winners_consensus_value"] = self._winners_consensus_value(tabulation_num=iTab)
 
             first_round_active_votes = sum(self.get_round_tally_dict(1, tabulation_num=iTab).values())
@@ -428,40 +507,8 @@ class RCV_stats:
             final_round_active_votes = sum(self.get_round_tally_dict(s["n_rounds"], tabulation_num=iTab).values())
             s["final_round_active_votes"] = final_round_active_votes
 
-            weight = self._contest_stat_table[f"final_weight{iTab}"]
-
-            pretally = sum(self._contest_stat_table[f"pretally_exhausted{iTab}"] * weight)
-            s["total_pretally_exhausted"] = pretally
-
-            posttally = sum(self._contest_stat_table[f"posttally_exhausted{iTab}"] * weight)
-            s["total_posttally_exhausted"] = posttally
-
-            posttally_overvote = sum(self._contest_stat_table[f"posttally_exhausted_by_overvote{iTab}"] * weight)
-            s["total_posttally_exhausted_by_overvote"] = posttally_overvote
-
-            posttally_skipped = sum(
-                self._contest_stat_table[f"posttally_exhausted_by_skipped_rankings{iTab}"] * weight
-            )
-            s["total_posttally_exhausted_by_skipped_rankings"] = posttally_skipped
-
-            posttally_abstention = sum(self._contest_stat_table[f"posttally_exhausted_by_abstention{iTab}"] * weight)
-            s["total_posttally_exhausted_by_abstention"] = posttally_abstention
-
-            posttally_duplicate = sum(
-                self._contest_stat_table[f"posttally_exhausted_by_duplicate_rankings{iTab}"] * weight
-            )
-            s["total_posttally_exhausted_by_duplicate_rankings"] = posttally_duplicate
-
-            posttally_rank_limit = sum(self._contest_stat_table[f"posttally_exhausted_by_rank_limit{iTab}"] * weight)
-            s["total_posttally_exhausted_by_rank_limit"] = posttally_rank_limit
-
-            posttally_rank_limit_full = sum(
-                self._contest_stat_table[f"posttally_exhausted_by_rank_limit_fully_ranked{iTab}"] * weight
-            )
-            s["total_posttally_exhausted_by_rank_limit_fully_ranked"] = posttally_rank_limit_full
-            s["total_posttally_exhausted_by_rank_limit_partially_ranked"] = (
-                posttally_rank_limit - posttally_rank_limit_full
-            )
+            for stat_name, total in self._exhaustion_totals(tabulation_num=iTab).items():
+                s[stat_name] = total
 
             if len(self._tabulation_winner(tabulation_num=iTab)) == 1:
 
@@ -501,7 +548,7 @@ class RCV_stats:
 
         tabulation_split_stats = []
 
-        filtered_stat_table = self._contest_stat_table.loc[split_filter, :]
+        filtered_stat_table = self._get_contest_stat_table().loc[split_filter, :]
 
         for iTab in range(1, self._tab_num + 1):
 
@@ -32,7 +32,7 @@ class RCV_tables:
         """
 
         candidate_set = self.get_candidates()
-        candidate_set = BallotMarks.combine_writein_marks(candidate_set)
+        candidate_set = BallotMarks.combine_writein_marks(candidate_set, self._writein_matcher)
         # candidate_set = BallotMarks.remove_mark(candidate_set, BallotMarks.WRITEIN)
         candidate_set = sorted(candidate_set.unique_candidates)
 
@@ -136,7 +136,7 @@ class RCV_tables:
         :rtype: Tuple[pd.DataFrame]
         """
 
-        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates())
+        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates(), self._writein_matcher)
         candidate_set = sorted(candidate_set.unique_candidates)
 
         cleaned_dict = self.get_cvr_dict(self._contest_rule_set_name, disaggregate=False)
@@ -242,17 +242,17 @@ class RCV_tables:
         """
 
         # get inputs
-        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates())
+        candidate_set = BallotMarks.combine_writein_marks(self.get_candidates(), self._writein_matcher)
         candidate_set = sorted(candidate_set.unique_candidates)
 
         # ballot rank limit
-        ballot_length = self.get_stats()[0]["rank_limit"].item()
+        ballot_length = self.get_rank_limit()
 
         # get cleaned ballots
         cleaned_dict = self.get_cvr_dict(self._contest_rule_set_name, disaggregate=False)
         ballot_set = [
             {
-                "ranks": ranks.marks + (["NA"] * (ballot_length - len(ranks.marks))),
+                "ranks": list(ranks.marks) + (["NA"] * (ballot_length - len(ranks.marks))),
                 "weight": weight,
             }
             for ranks, weight in zip(cleaned_dict["ballot_marks"], cleaned_dict["weight"])
@@ -317,7 +317,7 @@ class RCV_tables:
             return None
 
         winner = winner[0]
-        rank_limit = self.get_stats()[0]["rank_limit"].item()
+        rank_limit = self.get_rank_limit()
         winner_final_round_count = self._final_round_winner_vote(tabulation_num=tabulation_num)
         final_weight_distrib = self.get_final_weight_distrib(tabulation_num=tabulation_num, disaggregate=False)
 
@@ -456,7 +456,7 @@ class RCV_tables:
 
         num_rounds = self.n_rounds(tabulation_num=tabulation_num)
 
-        first_round_exhaust = self.get_stats()[tabulation_num - 1]["total_pretally_exhausted"].item()
+        first_round_exhaust = util.decimal2float(self.get_total_pretally_exhausted(tabulation_num=tabulation_num))
 
         # get rcv results
         first_round_dict = self.get_round_tally_dict(1, tabulation_num=tabulation_num)
@@ -623,10 +623,10 @@ class RCV_tables:
 
         json_dict = {
             "config": {
-                "notes": self.get_stats()[tabulation_num - 1]["notes"].item(),
-                "date": self.get_stats()[tabulation_num - 1]["date"].item(),
-                "jurisdiction": self.get_stats()[tabulation_num - 1]["jurisdiction"].item(),
-                "office": self.get_stats()[tabulation_num - 1]["office"].item(),
+                "notes": self.notes,
+                "date": self.date,
+                "jurisdiction": self.jurisdiction,
+                "office": self.office,
                 "threshold": self._win_threshold() if not None else 0,
             },
             "results": [],
@@ -677,7 +677,7 @@ class RCV_tables:
 
         # set up vars
         contest_candidates = self._contest_candidates.unique_candidates
-        rank_limit = self._summary_cvr_stat_table["rank_limit"].item()
+        rank_limit = self.get_rank_limit()
         candidate_outcomes = {dikt["name"]: dikt for dikt in self.get_candidate_outcomes(tabulation_num=1)}
         first_round_dict = self.get_round_tally_dict(round_num=1, tabulation_num=1)
         first_round_leader = sorted(first_round_dict.items(), key=lambda x: -x[1])[0][0]
@@ -716,8 +716,8 @@ class RCV_tables:
         # fill precomputed columns
         df["contestID"] = self._id_df["unique_id"].item()
         df["rank_limit"] = rank_limit
-        df["n_rounds"] = self._summary_contest_stat_tables[0]["n_rounds"].item()
-        df["rcv_type"] = self._summary_contest_stat_tables[0]["rcv_type"].item()
+        df["n_rounds"] = self._get_summary_contest_stat_tables()[0]["n_rounds"].item()
+        df["rcv_type"] = self._get_summary_contest_stat_tables()[0]["rcv_type"].item()
         df["winner"] = [
             True if candidate in self._tabulation_winner(tabulation_num=1) else False for candidate in df.index
         ]
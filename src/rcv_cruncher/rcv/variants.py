@@ -1,15 +1,20 @@
 """RCV variants defined here. All take RCV class as parent class.
 """
 
-from typing import List, Optional, Dict, Callable
+from typing import List, Optional, Dict, Callable, Tuple
 
 import abc
+import collections
 import copy
 import decimal
 from decimal import Decimal, getcontext, ROUND_DOWN
 
+import numpy as np
 
-from rcv_cruncher.marks import BallotMarks
+import rcv_cruncher.util as util
+
+from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
 from rcv_cruncher.rcv.base import RCV
 
 
@@ -24,6 +29,8 @@ def get_rcv_dict():
         "Sequential": Sequential,
         "SingleWinner": SingleWinner,
         "BottomsUpThresh": BottomsUpThresh,
+        "STVMeek": STVMeek,
+        "STVGregory": STVGregory,
     }
 
 
@@ -32,6 +39,9 @@ class SingleWinner(RCV):
     Single winner rcv contest.
     - Winner is candidate to first achieve more than half the active round votes.
     - Votes are transferred from losers each round.
+
+    If the **cvr** argument is an Until2 contest with the same contest rules, its tabulations are reused rather
+    than tabulating again, see Until2.
     """
 
     def __init__(
@@ -46,6 +56,10 @@ class SingleWinner(RCV):
         parser_args: Optional[Dict] = None,
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
         exhaust_on_duplicate_candidate_marks: bool = False,
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
@@ -56,6 +70,7 @@ class SingleWinner(RCV):
         multi_winner_rounds: bool = False,
         writeins_eliminated_first: bool = False,
         bottoms_up_threshold: Optional[float] = None,
+        batch_elimination: bool = False,
     ) -> None:
         super().__init__(
             jurisdiction=jurisdiction,
@@ -68,6 +83,10 @@ class SingleWinner(RCV):
             parser_args=parser_args,
             parsed_cvr=parsed_cvr,
             split_fields=split_fields,
+            ballot_matrix=ballot_matrix,
+            writein_matcher=writein_matcher,
+            cvr=cvr,
+            eager_stats=eager_stats,
             disable_aggregation=False,
             exhaust_on_duplicate_candidate_marks=exhaust_on_duplicate_candidate_marks,
             exhaust_on_overvote_marks=exhaust_on_overvote_marks,
@@ -79,6 +98,7 @@ class SingleWinner(RCV):
             multi_winner_rounds=multi_winner_rounds,
             bottoms_up_threshold=bottoms_up_threshold,
             writeins_eliminated_first=writeins_eliminated_first,
+            batch_elimination=batch_elimination,
         )
 
     def _contest_stats(self) -> List:
@@ -88,6 +108,21 @@ class SingleWinner(RCV):
         """
         return self.single_winner_stats
 
+    def _run_contest(self) -> None:
+        """
+        Reuse the tabulations of a shared Until2 contest with the same rules, they are the same as this contest's up
+        to the round a majority is first reached. Otherwise tabulate.
+        """
+        until2 = self._shared_cvr
+        if type(self) is SingleWinner and isinstance(until2, Until2) and until2._same_contest_rules(self):
+            tabulations = [until2._single_winner_tabulation(iTab) for iTab in range(1, until2.n_tabulations() + 1)]
+            if None not in tabulations:
+                self._tabulations = tabulations
+                self._tab_num = len(tabulations)
+                return
+
+        super()._run_contest()
+
     def _set_round_winners(self) -> None:
         """
         This function should set self._round_winners to the list of candidates that won the round
@@ -108,38 +143,14 @@ class SingleWinner(RCV):
         values as round transfer flows.
 
         rules:
-        - transfer votes from round loser
+        - transfer votes from round losers
         """
-        candidates = self._contest_candidates.unique_candidates.union({"exhaust"})
+        transfers = self._new_round_transfer()
+        for loser in self._round_losers:
+            for ballot_idx, transfer_to_candidate in self._ballot_transfers(loser, skip_candidates=self._round_losers):
+                transfers.add(loser, transfer_to_candidate, self._transfer_weight(ballot_idx))
 
-        # calculate transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: 0 for to_cand in candidates if to_cand != from_cand}
-            for from_cand in candidates
-            if from_cand != "exhaust"
-        }
-        summary_transfer_dict = {cand: 0 for cand in candidates}
-
-        for b in self._contest_cvr_ld:
-            if len(b["ballot_marks"].marks) > 0 and b["ballot_marks"].marks[0] == self._round_loser:
-                if len(b["ballot_marks"].marks) > 1:
-                    transfer_to_candidate = b["ballot_marks"].marks[1]
-                    summary_transfer_dict[transfer_to_candidate] += b["weight"]
-                    by_candidate_transfer_dict[self._round_loser][transfer_to_candidate] += b["weight"]
-                else:
-                    summary_transfer_dict["exhaust"] += b["weight"]
-                    by_candidate_transfer_dict[self._round_loser]["exhaust"] += b["weight"]
-
-        summary_transfer_dict[self._round_loser] = sum(summary_transfer_dict.values()) * -1
-        self._tabulations[self._tab_num - 1]["summary_transfers"].append(summary_transfer_dict)
-
-        # remove candidates with no transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: transfer_count for to_cand, transfer_count in transfers.items() if transfer_count != 0}
-            for from_cand, transfers in by_candidate_transfer_dict.items()
-            if sum(transfers.values()) != 0
-        }
-        self._tabulations[self._tab_num - 1]["by_candidate_transfers"].append(by_candidate_transfer_dict)
+        self._append_round_transfer(transfers)
 
     def _contest_not_complete(self) -> bool:
         """
@@ -176,13 +187,17 @@ class Sequential(SingleWinner):
         self._tab_num = 0
         self._tabulations = []
 
+        # piles at the start of the previous tabulation, see _start_tabulation
+        self._seat_start = None
+
         # continue until the number of winners is reached OR until candidates run out
         while len(winners) != self._n_winners and len(self._contest_candidates.unique_candidates - set(winners)) != 0:
 
             self._new_tabulation()
 
-            # reset inputs
-            self._reset_ballots()
+            # reset inputs, ballots are never re-weighted so the rule applied ballots can be reused with piles
+            if self._seat_start is None:
+                self._reset_ballots()
 
             # tabulation-level
             self._inactive_candidates = copy.copy(winners)  # mark previous iteration winners as inactive
@@ -199,14 +214,52 @@ class Sequential(SingleWinner):
             winners.append([d["name"] for d in tabulation_outcomes.values() if d["round_elected"] is not None][0])
 
 
+    def _start_tabulation(self) -> None:
+        """
+        Each tabulation starts from the piles the previous one started from, with only the previous winner's pile
+        moved on to their next active choice. Without piles every tabulation starts over from the ballots.
+        """
+        if self._seat_start is None:
+            super()._start_tabulation()
+        else:
+            cursors, alloc, piles, totals, active_mask, removed = self._seat_start
+            self._pile_cursors = list(cursors)
+            self._pile_alloc = list(alloc)
+            self._piles = {cand: list(pile) for cand, pile in piles.items()}
+            self._pile_totals = None if totals is None else dict(totals)
+            self._active_mask = active_mask
+            self._removed_candidates = list(removed)
+            self._clean_ballots()
+
+        if self._piles is not None:
+            self._seat_start = (
+                list(self._pile_cursors),
+                list(self._pile_alloc),
+                {cand: list(pile) for cand, pile in self._piles.items()},
+                None if self._pile_totals is None else dict(self._pile_totals),
+                self._active_mask,
+                list(self._removed_candidates),
+            )
+
+
 class Until2(SingleWinner):
     """
     Run single winner contest all the way down to final two canidates.
+
+    The round a candidate first holds a majority, where a SingleWinner contest would end, is recorded as well. A
+    SingleWinner contest constructed with an Until2 contest as its **cvr** argument, and the same contest rules,
+    takes its results from that round rather than tabulating the ballots again.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def _new_tabulation(self) -> None:
+        super()._new_tabulation()
+        self._tabulations[self._tab_num - 1].update(
+            {"majority_round": None, "majority_winner": None, "majority_final_ranks": None}
+        )
+
     def _set_round_winners(self) -> None:
         """
         This function should set self._round_winners to the list of candidates that won the round
@@ -214,12 +267,91 @@ class Until2(SingleWinner):
         single winner rules:
         - winner is candidate with more votes when there are only two candidates left
         """
-        round_candidates, _ = self.get_round_tally_tuple(
+        round_candidates, round_tallies = self.get_round_tally_tuple(
             self._round_num, self._tab_num, only_round_active_candidates=True
         )
+
+        # where a single winner contest would end, see _single_winner_tabulation
+        tabulation = self._tabulations[self._tab_num - 1]
+        if tabulation["majority_round"] is None and round_tallies[0] * 2 > sum(round_tallies):
+            tabulation["majority_round"] = self._round_num
+            tabulation["majority_winner"] = round_candidates[0]
+            tabulation["majority_final_ranks"] = self._current_ranks()
+
         if len(round_candidates) == 2:
             self._round_winners = [round_candidates[0]]
 
+    def _same_contest_rules(self, rcv: RCV) -> bool:
+        """
+        :param rcv: Contest sharing this contest's CVR.
+        :type rcv: RCV
+        :return: True if `rcv` applies the same rules to the ballots and candidates as this contest.
+        :rtype: bool
+        """
+        return (
+            rcv._rule_sets[rcv._contest_rule_set_name] == self._rule_sets[self._contest_rule_set_name]
+            and rcv._writeins_lose_first == self._writeins_lose_first
+            and rcv._batch_elimination == self._batch_elimination
+        )
+
+    def _single_winner_tabulation(self, tabulation_num: int) -> Optional[Dict]:
+        """
+        The tabulation a SingleWinner contest would produce: the rounds up to the one where a majority is first
+        reached, with the majority candidate elected and every other continuing candidate eliminated in that round.
+
+        :param tabulation_num: Tabulation to take the rounds from.
+        :type tabulation_num: int
+        :return: Tabulation results, or None if no majority was reached before the final two candidates tied.
+        :rtype: Optional[Dict]
+        """
+        tabulation = self._tabulations[tabulation_num - 1]
+        majority_round = tabulation["majority_round"]
+        if majority_round is None:
+            return None
+
+        candidate_outcomes = {}
+        for cand, outcome in tabulation["candidate_outcomes"].items():
+            if outcome["round_eliminated"] is not None and outcome["round_eliminated"] < majority_round:
+                candidate_outcomes[cand] = dict(outcome)
+            elif cand == tabulation["majority_winner"]:
+                candidate_outcomes[cand] = {"name": cand, "round_eliminated": None, "round_elected": majority_round}
+            else:
+                candidate_outcomes[cand] = {"name": cand, "round_eliminated": majority_round, "round_elected": None}
+
+        # no transfers out of the final round
+        n_transfers = majority_round - 1
+        final_summary_transfers = {
+            cand: util.NAN for cand in self._contest_candidates.unique_candidates.union({"exhaust"})
+        }
+
+        ballot_round_allocation = tabulation["ballot_round_allocation"].head(majority_round)
+        ballot_round_weight = tabulation["ballot_round_weight"].head(majority_round)
+        ballot_allocations = tabulation["weight_ledger"].ballot_allocations()
+        final_alloc = ballot_round_allocation[-1]
+        final_alloc_weight = ballot_round_weight[-1]
+
+        return {
+            "rounds": tabulation["rounds"][:majority_round],
+            "summary_transfers": tabulation["summary_transfers"][:n_transfers] + [final_summary_transfers],
+            "by_candidate_transfers": tabulation["by_candidate_transfers"][:n_transfers] + [{}],
+            "transfer_matrices": tabulation["transfer_matrices"][:n_transfers] + [None],
+            "candidate_outcomes": candidate_outcomes,
+            "weight_ledger": tabulation["weight_ledger"],
+            "final_weight_distrib": util.LazyList(
+                len(final_alloc),
+                lambda ballot_idx: ballot_allocations.get(ballot_idx, [])
+                + [(final_alloc[ballot_idx], final_alloc_weight[ballot_idx])],
+            ),
+            "final_ranks": tabulation["majority_final_ranks"],
+            "initial_ranks": tabulation["initial_ranks"],
+            "ballot_round_allocation": ballot_round_allocation,
+            "ballot_round_weight": ballot_round_weight,
+            "win_threshold": tabulation["win_threshold"],
+            "convergence_tolerance": tabulation["convergence_tolerance"],
+            "convergence_iterations": tabulation["convergence_iterations"],
+            "round_tally_cache": {},
+        }
+
 
 class STV(RCV, abc.ABC):
     """
@@ -257,7 +389,7 @@ class STV(RCV, abc.ABC):
             return
 
         # any threshold winners?
-        threshold = self._win_threshold()
+        threshold = self._round_threshold()
         all_winners = [(cand, tally) for cand, tally in zip(round_candidates, round_tally) if tally > threshold]
         all_winners = [cand for cand, _ in sorted(all_winners, key=lambda x: (-x[1], x[0]))]
         if all_winners and self._multi_winner_rounds:
@@ -280,6 +412,22 @@ class STV(RCV, abc.ABC):
         else:
             return True
 
+    def _min_continuing_candidates(self) -> int:
+        """
+        rules:
+        - batch elimination leaves at least as many continuing candidates as there are seats left to fill
+        """
+        candidate_outcomes = self._tabulations[self._tab_num - 1]["candidate_outcomes"]
+        n_elected_candidates = len([d for d in candidate_outcomes.values() if d["round_elected"] is not None])
+        return self._n_winners - n_elected_candidates
+
+    def _round_threshold(self) -> decimal.Decimal:
+        """
+        Votes a candidate needs to exceed to win the current round. The static win threshold, unless a variant
+        recalculates it each round.
+        """
+        return self._win_threshold()
+
     def _win_threshold(self) -> decimal.Decimal:
         """
         rules:
@@ -307,6 +455,9 @@ class STVWholeBallot(STV):
     - If no winners in round, candidate with least votes in a round is eliminated and has votes transferred.
     """
 
+    # winners are removed from only some of their ballots, see _clean_ballots, so ranks are edited directly
+    _pile_tabulation = False
+
     def __init__(
         self,
         jurisdiction: str = "",
@@ -319,6 +470,10 @@ class STVWholeBallot(STV):
         parser_args: Optional[Dict] = None,
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
         exhaust_on_duplicate_candidate_marks: bool = False,
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
@@ -329,7 +484,13 @@ class STVWholeBallot(STV):
         multi_winner_rounds: bool = False,
         writeins_eliminated_first: bool = None,
         bottoms_up_threshold: Optional[float] = None,
+        batch_elimination: bool = False,
     ) -> None:
+
+        # surplus ballots chosen for each winner in the current round, see _surplus_ballots
+        self._surplus_round = None
+        self._surplus_selections = {}
+
         super().__init__(
             jurisdiction=jurisdiction,
             state=state,
@@ -341,6 +502,10 @@ class STVWholeBallot(STV):
             parser_args=parser_args,
             parsed_cvr=parsed_cvr,
             split_fields=split_fields,
+            ballot_matrix=ballot_matrix,
+            writein_matcher=writein_matcher,
+            cvr=cvr,
+            eager_stats=eager_stats,
             disable_aggregation=True,
             exhaust_on_duplicate_candidate_marks=exhaust_on_duplicate_candidate_marks,
             exhaust_on_overvote_marks=exhaust_on_overvote_marks,
@@ -351,7 +516,8 @@ class STVWholeBallot(STV):
             n_winners=n_winners,
             multi_winner_rounds=multi_winner_rounds,
             bottoms_up_threshold=bottoms_up_threshold,
-            writeins_eliminated_first=writeins_eliminated_first
+            writeins_eliminated_first=writeins_eliminated_first,
+            batch_elimination=batch_elimination,
         )
 
         weights = set(b["weight"] for b in self._contest_cvr_ld)
@@ -361,15 +527,39 @@ class STVWholeBallot(STV):
 
     def _removal_ballots(self, candidate, default_as_true=True) -> List[bool]:
 
-        if default_as_true:
-            # marks all ballots to be transferred
-            to_remove = [True] * len(self._contest_cvr_ld)
-        else:
-            to_remove = [False] * len(self._contest_cvr_ld)
-
         # all ballots are transferred for non-winners
         if candidate not in self._round_winners:
-            return to_remove
+            return [default_as_true] * len(self._contest_cvr_ld)
+
+        cand_ballot_idxs, transfer_ballot_idxs = self._surplus_ballots(candidate)
+
+        to_remove = [default_as_true] * len(self._contest_cvr_ld)
+        for ballot_idx in cand_ballot_idxs:
+            to_remove[ballot_idx] = False
+        for ballot_idx in transfer_ballot_idxs:
+            to_remove[ballot_idx] = True
+
+        return to_remove
+
+    def _surplus_ballots(self, candidate: str) -> Tuple[List[int], List[int]]:
+        """
+        Choose which of a winner's ballots transfer their surplus, following the Cambridge rules: every
+        `surplus_factor`th ballot with a continuing candidate is transferred, starting again one ballot later on
+        each pass, until the winner is down to the threshold. The choice is made once per round and winner, and is
+        reused by _clean_ballots.
+
+        :param candidate: Round winner.
+        :type candidate: str
+        :return: Positions in self._contest_cvr_ld of the ballots counting towards `candidate` and, in the order
+        they were chosen, of the ballots chosen for transfer.
+        :rtype: Tuple[List[int], List[int]]
+        """
+        round_key = (self._tab_num, self._round_num)
+        if self._surplus_round != round_key:
+            self._surplus_round = round_key
+            self._surplus_selections = {}
+        if candidate in self._surplus_selections:
+            return self._surplus_selections[candidate]
 
         thresh = self._win_threshold()
         ballot_weight = self._contest_cvr_ld[0]["weight"]  # assuming equal weighted ballots
@@ -382,69 +572,62 @@ class STVWholeBallot(STV):
         # skip factor for determining transferred ballots
         surplus_factor = int(round(cand_total / surplus))
 
-        # pull out ballots that counted towards this winning candidate
-        cand_ballots = [
-            (idx, b)
-            for idx, b in enumerate(self._contest_cvr_ld)
-            if b["ballot_marks"].marks and b["ballot_marks"].marks[0] == candidate
-        ]
-
-        # mark all ballot belonging to candidate as not-transfer
-        for ballot in cand_ballots:
-            to_remove[ballot[0]] = False
-
-        seen_idxs = []
-        used_idxs = []
+        # pull out ballots that counted towards this winning candidate, and flag those with a continuing candidate
+        cand_ballot_idxs = []
+        has_continuing = []
+        for idx, b in enumerate(self._contest_cvr_ld):
+            marks = b["ballot_marks"].marks
+            if marks and marks[0] == candidate:
+                cand_ballot_idxs.append(idx)
+                has_continuing.append(not continuing_candidates.isdisjoint(marks))
+
+        n_cand_ballots = len(cand_ballot_idxs)
+        seen = [False] * n_cand_ballots
+        used = [False] * n_cand_ballots
+        transfer_ballot_idxs = []
+
+        # each pass starts one ballot later than the last and visits different ballots, once enough ballots
+        # are marked for transfer every later pass stops at its first ballot
         for offset in range(0, surplus_factor):
 
-            # start_idx = offset
-            start_idx = surplus_factor + offset - 1
-            skip_factor = surplus_factor
+            if cand_total <= thresh:
+                break
 
-            for idx in range(start_idx, len(cand_ballots), skip_factor):
-
-                if idx in seen_idxs or idx in used_idxs:
-                    raise RuntimeError("should this happen?")
+            start_idx = surplus_factor + offset - 1
+            for idx in range(start_idx, n_cand_ballots, surplus_factor):
 
                 # enough ballots have been marked for transfer
                 if cand_total <= thresh:
                     break
 
-                # if current ballot has a next choice that is a continuing candidate,
-                ranks = cand_ballots[idx][1]["ballot_marks"]
-                if set(ranks.marks).intersection(continuing_candidates):
-                    # mark it for transfer
-                    to_remove[cand_ballots[idx][0]] = True
-                    # decrement candidate total
+                # if current ballot has a next choice that is a continuing candidate, mark it for transfer
+                if has_continuing[idx]:
+                    transfer_ballot_idxs.append(cand_ballot_idxs[idx])
                     cand_total -= ballot_weight
-                    used_idxs.append(idx)
+                    used[idx] = True
 
-                seen_idxs.append(idx)
+                seen[idx] = True
 
         if cand_total > thresh:
 
-            unseen_idx = [idx for idx, _ in enumerate(cand_ballots) if idx not in seen_idxs]
-            non_transfer_continuing = [
-                bool(set(b[1]["ballot_marks"].marks).intersection(continuing_candidates))
-                for idx, b in enumerate(cand_ballots)
-                if idx not in used_idxs
-            ]
-            non_transfer_ballot_idx = [b[0] for idx, b in enumerate(cand_ballots) if idx not in used_idxs]
+            non_transfer_idxs = [idx for idx in range(n_cand_ballots) if not used[idx]]
 
-            if any(flag for idx, flag in enumerate(non_transfer_continuing) if idx not in unseen_idx):
+            # flags of the not transferred ballots are checked by their position among those ballots
+            if any(has_continuing[idx] and seen[position] for position, idx in enumerate(non_transfer_idxs)):
                 print("some un-chosen ballots have continuing candidates")
                 raise RuntimeError
             else:
-                for idx in non_transfer_ballot_idx:
+                for idx in non_transfer_idxs:
                     if cand_total <= thresh:
                         break
-                    to_remove[idx] = True
+                    transfer_ballot_idxs.append(cand_ballot_idxs[idx])
                     cand_total -= ballot_weight
 
         if cand_total > thresh:
             raise RuntimeError
 
-        return to_remove
+        self._surplus_selections[candidate] = (cand_ballot_idxs, transfer_ballot_idxs)
+        return self._surplus_selections[candidate]
 
     def _calc_round_transfer(self) -> None:
         """
@@ -456,81 +639,31 @@ class STVWholeBallot(STV):
         - transfer votes from round loser or winner
         """
 
-        candidates = self._contest_candidates.unique_candidates.union({"exhaust"})
-
-        # calculate transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: 0 for to_cand in candidates if to_cand != from_cand}
-            for from_cand in candidates
-            if from_cand != "exhaust"
-        }
-        summary_transfer_dict = {cand: 0 for cand in candidates}
+        transfers = self._new_round_transfer()
 
         if self._round_winners:
 
-            # collect flags indicating
-            all_removal_ballots = []
+            # ballots chosen to transfer the surplus of any winner, in ballot order
+            transfer_ballot_idxs = set()
             for winner in self._round_winners:
-                all_removal_ballots.append(self._removal_ballots(winner, default_as_true=False))
+                transfer_ballot_idxs.update(self._surplus_ballots(winner)[1])
 
-            combined_removal_ballots = [False] * len(self._contest_cvr_ld)
-            for idx in range(0, len(self._contest_cvr_ld)):
-                if any(flag_list[idx] for flag_list in all_removal_ballots):
-                    combined_removal_ballots[idx] = True
+            for ballot_idx in sorted(transfer_ballot_idxs):
 
-            for b, is_transfer in zip(self._contest_cvr_ld, combined_removal_ballots):
-
-                if is_transfer:
-
-                    eliminated_candidate = b["ballot_marks"].marks[0]
-
-                    if len(b["ballot_marks"].marks) == 0:
-                        print("this shouldnt happen.")
-                        raise RuntimeError
-
-                    remaining_candidates = [cand for cand in b["ballot_marks"].marks if cand not in self._round_winners]
-                    if len(remaining_candidates) == 0:
-                        # exhausted
-                        summary_transfer_dict["exhaust"] += b["weight"]
-                        by_candidate_transfer_dict[eliminated_candidate]["exhaust"] += b["weight"]
-                    elif len(remaining_candidates) > 0:
-                        # transfer to another candidate
-                        transfer_to = remaining_candidates[0]
-                        summary_transfer_dict[transfer_to] += b["weight"]
-                        by_candidate_transfer_dict[eliminated_candidate][transfer_to] += b["weight"]
+                b = self._contest_cvr_ld[ballot_idx]
+                eliminated_candidate = b["ballot_marks"].marks[0]
 
-                    # include outflow
-                    summary_transfer_dict[eliminated_candidate] += b["weight"] * -1
+                remaining_candidates = [cand for cand in b["ballot_marks"].marks if cand not in self._round_winners]
+                # transfer to another candidate, or exhausted
+                transfer_to = remaining_candidates[0] if remaining_candidates else "exhaust"
+                transfers.add(eliminated_candidate, transfer_to, self._transfer_weight(ballot_idx))
 
         else:
-            transfer_candidates = [self._round_loser]
+            for loser in self._round_losers:
+                for ballot_idx, transfer_to in self._ballot_transfers(loser, skip_candidates=self._round_losers):
+                    transfers.add(loser, transfer_to, self._transfer_weight(ballot_idx))
 
-            # calculate transfer
-            for b in self._contest_cvr_ld:
-                if len(b["ballot_marks"].marks) > 0 and b["ballot_marks"].marks[0] in transfer_candidates:
-
-                    eliminated_candidate = b["ballot_marks"].marks[0]
-
-                    if len(b["ballot_marks"].marks) > 1:
-                        transfer_to = b["ballot_marks"].marks[1]
-                        summary_transfer_dict[transfer_to] += b["weight"]
-                        by_candidate_transfer_dict[eliminated_candidate][transfer_to] += b["weight"]
-                    else:
-                        summary_transfer_dict["exhaust"] += b["weight"]
-                        by_candidate_transfer_dict[eliminated_candidate]["exhaust"] += b["weight"]
-
-                    # mark transfer outflow
-                    summary_transfer_dict[eliminated_candidate] += b["weight"] * -1
-
-        self._tabulations[self._tab_num - 1]["summary_transfers"].append(summary_transfer_dict)
-
-        # remove candidates with no transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: transfer_count for to_cand, transfer_count in transfers.items() if transfer_count != 0}
-            for from_cand, transfers in by_candidate_transfer_dict.items()
-            if sum(transfers.values()) != 0
-        }
-        self._tabulations[self._tab_num - 1]["by_candidate_transfers"].append(by_candidate_transfer_dict)
+        self._append_round_transfer(transfers)
 
     def _clean_ballots(self) -> None:
         """
@@ -548,7 +681,6 @@ class STVWholeBallot(STV):
                         {
                             "ballot_marks": BallotMarks.remove_mark(b["ballot_marks"], [inactive_cand]),
                             "weight": b["weight"],
-                            "weight_distrib": b["weight_distrib"],
                         }
                         for b in self._contest_cvr_ld
                     ]
@@ -566,7 +698,6 @@ class STVWholeBallot(STV):
                 {
                     "ballot_marks": BallotMarks.remove_mark(b["ballot_marks"], [winner]),
                     "weight": b["weight"],
-                    "weight_distrib": b["weight_distrib"],
                 }
                 if is_remove
                 else b
@@ -583,6 +714,11 @@ class STVFractionalBallot(STV):
     - If no winners in round, candidate with least votes in a round is eliminated and has votes transferred.
     """
 
+    # surplus transfers are rounded to the decimal context precision, so a merged group
+    # would not always keep the same weight as its rows tabulated separately
+    _group_rank_patterns = False
+    _splits_weights = True
+
     def __init__(
         self,
         jurisdiction: str = "",
@@ -595,6 +731,10 @@ class STVFractionalBallot(STV):
         parser_args: Optional[Dict] = None,
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
         exhaust_on_duplicate_candidate_marks: bool = False,
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
@@ -605,7 +745,8 @@ class STVFractionalBallot(STV):
         multi_winner_rounds: bool = False,
         bottoms_up_threshold: Optional[float] = None,
         truncate_to: Optional[int] = 4,
-         writeins_eliminated_first: bool = False
+         writeins_eliminated_first: bool = False,
+        batch_elimination: bool = False,
     ) -> None:
         super().__init__(
             jurisdiction=jurisdiction,
@@ -618,6 +759,10 @@ class STVFractionalBallot(STV):
             parser_args=parser_args,
             parsed_cvr=parsed_cvr,
             split_fields=split_fields,
+            ballot_matrix=ballot_matrix,
+            writein_matcher=writein_matcher,
+            cvr=cvr,
+            eager_stats=eager_stats,
             disable_aggregation=False,
             exhaust_on_duplicate_candidate_marks=exhaust_on_duplicate_candidate_marks,
             exhaust_on_overvote_marks=exhaust_on_overvote_marks,
@@ -629,9 +774,92 @@ class STVFractionalBallot(STV):
             multi_winner_rounds=multi_winner_rounds,
             bottoms_up_threshold=bottoms_up_threshold,
             truncate_to=truncate_to,
-            writeins_eliminated_first=writeins_eliminated_first
+            writeins_eliminated_first=writeins_eliminated_first,
+            batch_elimination=batch_elimination,
         )
 
+    def _reset_ballots(self) -> None:
+        super()._reset_ballots()
+        self._fixed_point_weights = self._new_fixed_point_weights()
+
+    def _new_fixed_point_weights(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Fixed point copy of the ballot weights, used by _update_weights when surplus percentages are truncated.
+        Each weight is held as an int64 coefficient and a number of decimal places, the same pair a Decimal
+        stores. Every surplus transfer multiplies the coefficient by the truncated surplus percentage scaled to
+        an integer and adds truncate_to decimal places, which is exactly what the Decimal product does as long
+        as the coefficient fits in an int64 (well inside the decimal context precision).
+
+        :return: Coefficient and decimal places of each ballot weight, or None if any weight cannot be held.
+        :rtype: Optional[Tuple[np.ndarray, np.ndarray]]
+        """
+        if self._truncate_to is None:
+            return None
+
+        coefs = []
+        places = []
+        for b in self._contest_cvr_ld:
+            sign, digits, exponent = b["weight"].as_tuple()
+            if sign or not isinstance(exponent, int) or exponent > 0 or len(digits) > 18:
+                return None
+            coefs.append(int("".join(map(str, digits))))
+            places.append(-exponent)
+
+        return np.array(coefs, dtype=np.int64), np.array(places, dtype=np.int64)
+
+    def _truncate_surplus(self, surplus_percent: Decimal) -> Decimal:
+        """
+        Returns value truncated to self._truncate_to decimal places in decimal data type
+        ie. truncation(2.16, 1) returns 2.1
+        if self._truncate_to == None, returns value unchanged
+        """
+        if self._truncate_to is None:
+            return surplus_percent
+
+        quantizer = Decimal("1." + "0" * self._truncate_to)
+        # round Down same as truncate
+        return surplus_percent.quantize(quantizer, rounding=ROUND_DOWN)
+
+    def _fixed_point_surplus_weights(
+        self, pile: np.ndarray, truncated_percent: Decimal, winner_percent: Decimal
+    ) -> Optional[Tuple[List[Decimal], List[Decimal]]]:
+        """
+        Apply a surplus transfer to the fixed point weights of the ballots on a winner's pile.
+
+        :param pile: Positions of the winner's ballots in self._contest_cvr_ld.
+        :type pile: np.ndarray
+        :param truncated_percent: Truncated surplus percentage carried forward by each ballot.
+        :type truncated_percent: Decimal
+        :param winner_percent: Share of each ballot kept by the winner.
+        :type winner_percent: Decimal
+        :return: Remaining weight and winner weight of each pile ballot, or None if the transfer would overflow
+        the fixed point weights, in which case they are dropped.
+        :rtype: Optional[Tuple[List[Decimal], List[Decimal]]]
+        """
+        coefs, places = self._fixed_point_weights
+        multiplier = int(truncated_percent.scaleb(self._truncate_to))
+
+        pile_coefs = coefs[pile]
+        pile_places = places[pile]
+        if multiplier and pile_coefs.size and int(pile_coefs.max()) > np.iinfo(np.int64).max // multiplier:
+            self._fixed_point_weights = None
+            return None
+
+        # ballots holding the same weight share the same results, so compute them once per distinct weight
+        unique_weights, weight_inverse = np.unique(np.stack([pile_coefs, pile_places]), axis=1, return_inverse=True)
+        unique_remaining = []
+        unique_winner = []
+        for coef, n_places in unique_weights.T.tolist():
+            weight = Decimal(coef).scaleb(-n_places)
+            unique_remaining.append(Decimal(coef * multiplier).scaleb(-(n_places + self._truncate_to)))
+            unique_winner.append(weight * winner_percent)
+
+        coefs[pile] = pile_coefs * multiplier
+        places[pile] = pile_places + self._truncate_to
+
+        weight_inverse = weight_inverse.ravel().tolist()
+        return [unique_remaining[i] for i in weight_inverse], [unique_winner[i] for i in weight_inverse]
+
     def _update_weights(self) -> None:
         """
         If surplus needs to be transferred, change weights on winner ballots to reflect remaining
@@ -643,23 +871,6 @@ class STVFractionalBallot(STV):
         rules:
         - reduce weights of ballots ranking the winner by the amount
         """
-
-        def truncation(weight,truncation_dp=self._truncate_to):
-            """
-            Returns value truncated to truncation_dp in decimal data type
-            ie. truncation(2.16, 1) returns 2.1
-            if truncation_dp==None, returns weight unchanged
-            """
-
-            if truncation_dp == None:
-                return weight
-
-            quantizer = Decimal('1.' + '0' * truncation_dp)
-            weight = weight.quantize(quantizer, rounding=ROUND_DOWN)
-            #round Down same as truncate
-
-            return weight
-
         round_dict = self.get_round_tally_dict(self._round_num, tabulation_num=self._tab_num)
         threshold = self._win_threshold()
 
@@ -673,29 +884,30 @@ class STVFractionalBallot(STV):
 
                 # which ballots had the winner on top
                 # and need to be fractionally split
-                new = []
-                for b in self._contest_cvr_ld:
-                    if b["ballot_marks"].marks and b["ballot_marks"].marks[0] == winner:
-
-                        # record ballot weight allotted to winner
-                        winner_weight = b["weight"] * (1 - surplus_percent)
-                        new_weight_distrib = b["weight_distrib"] + [(winner, winner_weight)]
-
-                        # remaining weight, truncated using function within this function
-                        remaining_weight = b["weight"] * truncation(surplus_percent)
-
-
-                        # adjust ballot's current weight
-                        new.append(
-                            {
-                                "ballot_marks": b["ballot_marks"],
-                                "weight": remaining_weight,
-                                "weight_distrib": new_weight_distrib,
-                            }
-                        )
-                    else:
-                        new.append(b)
-                self._contest_cvr_ld = new
+                pile = self._candidate_ballots(winner)
+
+                truncated_percent = self._truncate_surplus(surplus_percent)
+                winner_percent = 1 - surplus_percent
+
+                pile_weights = None
+                if self._fixed_point_weights is not None:
+                    pile_weights = self._fixed_point_surplus_weights(
+                        np.array(pile, dtype=np.int64), truncated_percent, winner_percent
+                    )
+
+                if pile_weights is None:
+                    # record ballot weight allotted to winner, and the truncated remaining weight
+                    pile_weights = (
+                        [self._contest_cvr_ld[idx]["weight"] * truncated_percent for idx in pile],
+                        [self._contest_cvr_ld[idx]["weight"] * winner_percent for idx in pile],
+                    )
+
+                # adjust ballot's current weight
+                weight_ledger = self._tabulations[self._tab_num - 1]["weight_ledger"]
+                for idx, remaining_weight, winner_weight in zip(pile, *pile_weights):
+                    b = self._contest_cvr_ld[idx]
+                    self._contest_cvr_ld[idx] = {"ballot_marks": b["ballot_marks"], "weight": remaining_weight}
+                    weight_ledger.add(idx, winner, winner_weight)
 
     #
     def _calc_round_transfer(self) -> None:
@@ -710,44 +922,484 @@ class STVFractionalBallot(STV):
         if self._round_winners:
             transfer_candidates = self._round_winners
         else:
-            transfer_candidates = [self._round_loser]
+            transfer_candidates = self._round_losers
 
-        candidates = self._contest_candidates.unique_candidates.union({"exhaust"})
+        # ballots from all transferring candidates, in ballot order
+        transfer_ballots = sorted(
+            (ballot_idx, eliminated_candidate)
+            for eliminated_candidate in transfer_candidates
+            for ballot_idx in self._candidate_ballots(eliminated_candidate)
+        )
 
-        # calculate transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: 0 for to_cand in candidates if to_cand != from_cand}
-            for from_cand in candidates
-            if from_cand != "exhaust"
-        }
-        summary_transfer_dict = {cand: 0 for cand in candidates}
+        transfers = self._new_round_transfer()
+        for ballot_idx, eliminated_candidate in transfer_ballots:
+            transfer_to = self._next_choice(ballot_idx, skip_candidates=transfer_candidates)
+            transfers.add(eliminated_candidate, transfer_to, self._transfer_weight(ballot_idx))
 
-        for b in self._contest_cvr_ld:
-            if len(b["ballot_marks"].marks) > 0 and b["ballot_marks"].marks[0] in transfer_candidates:
+        self._append_round_transfer(transfers)
 
-                eliminated_candidate = b["ballot_marks"].marks[0]
 
-                remaining_candidates = [cand for cand in b["ballot_marks"].marks if cand not in transfer_candidates]
-                if remaining_candidates:
-                    transfer_to = remaining_candidates[0]
-                    summary_transfer_dict[transfer_to] += b["weight"]
-                    by_candidate_transfer_dict[eliminated_candidate][transfer_to] += b["weight"]
-                else:
-                    summary_transfer_dict["exhaust"] += b["weight"]
-                    by_candidate_transfer_dict[eliminated_candidate]["exhaust"] += b["weight"]
+class STVVectorized(STV, abc.ABC):
+    """
+    Template base class for multi-winner STV variants that split ballots into fractional weights. Ballot ranks are
+    held in a util.RankMatrix, so each round moves or re-tallies all ballots at once. Subclasses hold the ballot
+    weights and record round tallies and ballot weights as Decimals.
+    """
 
-                # mark transfer outflow
-                summary_transfer_dict[eliminated_candidate] += b["weight"] * -1
+    _splits_weights = True
 
-        self._tabulations[self._tab_num - 1]["summary_transfers"].append(summary_transfer_dict)
+    # ballots are moved on through the rank matrix rather than through candidate piles
+    _pile_tabulation = False
 
-        # remove candidates with no transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: transfer_count for to_cand, transfer_count in transfers.items() if transfer_count != 0}
-            for from_cand, transfers in by_candidate_transfer_dict.items()
-            if sum(transfers.values()) != 0
-        }
-        self._tabulations[self._tab_num - 1]["by_candidate_transfers"].append(by_candidate_transfer_dict)
+    # override me
+    @abc.abstractmethod
+    def _start_weights(self) -> None:
+        """
+        Abstract method to be implemented by vectorized STV subclass.
+        This function should set up the ballot weights and any per candidate arrays, once the rank matrix is built.
+        """
+        pass
+
+    # override me
+    @abc.abstractmethod
+    def _remove_candidates(self, codes: np.ndarray) -> None:
+        """
+        Abstract method to be implemented by vectorized STV subclass.
+        This function should update the ballot weights or allocations after candidates stop continuing.
+
+        :param codes: Rank matrix codes of the candidates just elected or eliminated.
+        :type codes: np.ndarray
+        """
+        pass
+
+    def _start_tabulation(self) -> None:
+        self._start_piles()
+
+        candidates = sorted(self._contest_candidates.unique_candidates)
+        self._candidate_codes = {cand: code for code, cand in enumerate(candidates)}
+        self._allocation_names = candidates + ["exhaust"]
+        self._rank_matrix = util.RankMatrix([b["ballot_marks"].marks for b in self._contest_cvr_ld], candidates)
+
+        self._continuing = np.ones(len(candidates), dtype=bool)
+        self._elected = np.zeros(len(candidates), dtype=bool)
+
+        self._start_weights()
+        self._clean_ballots()
+
+    def _current_ranks(self) -> List[List[str]]:
+        ranks = [b["ballot_marks"].marks for b in self._contest_cvr_ld]
+        continuing = {cand for cand, code in self._candidate_codes.items() if self._continuing[code]}
+        return util.LazyList(len(ranks), lambda ballot_idx: [mark for mark in ranks[ballot_idx] if mark in continuing])
+
+    def _clean_ballots(self) -> None:
+        """
+        Mark newly inactive candidates as elected or eliminated. Ballot ranks are left as they are.
+        """
+        new_inactive = [
+            cand for cand in dict.fromkeys(self._inactive_candidates) if cand not in self._removed_candidates
+        ]
+        if not new_inactive:
+            return
+
+        candidate_outcomes = self._tabulations[self._tab_num - 1]["candidate_outcomes"]
+        codes = np.array([self._candidate_codes[cand] for cand in new_inactive])
+        self._continuing[codes] = False
+        self._elected[codes] = [candidate_outcomes[cand]["round_elected"] is not None for cand in new_inactive]
+        self._removed_candidates += new_inactive
+
+        self._remove_candidates(codes)
+
+    def _append_weighted_tally(
+        self, votes: List[Decimal], ballot_codes: np.ndarray, ballot_weights: List[Decimal]
+    ) -> None:
+        """
+        Record the round tally and each ballot's allocation.
+
+        :param votes: Votes held by each candidate, in rank matrix code order.
+        :type votes: List[Decimal]
+        :param ballot_codes: Rank matrix code of the candidate each ballot counts towards, the pad code if exhausted.
+        :type ballot_codes: np.ndarray
+        :param ballot_weights: Weight each ballot counts with.
+        :type ballot_weights: List[Decimal]
+        """
+        # candidates without votes keep the int 0 they start with
+        vote_alloc = collections.Counter({cand: 0 for cand in self._contest_candidates.unique_candidates})
+        for cand, code in self._candidate_codes.items():
+            if votes[code]:
+                vote_alloc[cand] = votes[code]
+
+        names = self._allocation_names
+        ballot_alloc = [names[code] for code in ballot_codes.tolist()]
+        self._append_round_tally(vote_alloc, ballot_alloc, ballot_weights)
+
+
+class STVMeek(STVVectorized):
+    """
+    Multi-winner elections counted with Meek's method.
+    - Each candidate has a keep factor, 1 while hopeful and 0 once eliminated. Every ballot is passed down its
+    rankings, each candidate keeping their keep factor share of the weight that reaches them.
+    - Win threshold is recalculated each round as (# votes held by candidates)/(# of seats + 1), so exhausted weight
+    lowers it.
+    - Keep factors of elected candidates are scaled by threshold/votes and all ballots re-tallied, until elected
+    candidates are within convergence_tolerance votes of the threshold in total.
+    - If no winners in round, candidate with least votes in a round is eliminated and their keep factor set to 0.
+
+    Keep factors are only known to within the convergence tolerance, so tallies, thresholds, ballot weights and
+    transfers are recorded rounded to the decimal place of convergence_tolerance, e.g. 5 places for 0.00001.
+    Electing or eliminating a candidate moves weight between every candidate at once, so round transfers are only
+    recorded as the net change in each candidate's tally, see _calc_round_transfer.
+    """
+
+    # keep factors failing to converge in this many iterations, e.g. a tolerance below float precision, is an error
+    _max_iterations = 1000
+
+    # transfers are the change in tallies between rounds, there are no flows from one candidate to another
+    _transfer_flows = False
+
+    def __init__(
+        self,
+        jurisdiction: str = "",
+        state: str = "",
+        year: str = "",
+        date: str = "",
+        office: str = "",
+        notes: str = "",
+        parser_func: Optional[Callable] = None,
+        parser_args: Optional[Dict] = None,
+        parsed_cvr: Optional[Dict] = None,
+        split_fields: Optional[List] = None,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
+        exhaust_on_duplicate_candidate_marks: bool = False,
+        exhaust_on_overvote_marks: bool = False,
+        exhaust_on_N_repeated_skipped_marks: int = 0,
+        treat_combined_writeins_as_exhaustable_duplicates: bool = True,
+        combine_writein_marks: bool = True,
+        exclude_writein_marks: bool = False,
+        n_winners: Optional[int] = None,
+        multi_winner_rounds: bool = False,
+        bottoms_up_threshold: Optional[float] = None,
+        convergence_tolerance: float = 0.00001,
+        writeins_eliminated_first: bool = False,
+        batch_elimination: bool = False,
+    ) -> None:
+        """
+        See RCV constructor for the other arguments.
+
+        :param convergence_tolerance: Total difference, in votes, between elected candidates' votes and the threshold below which keep factors count as converged. Tallies are recorded rounded to its first significant decimal place. Defaults to 0.00001
+        :type convergence_tolerance: float, optional
+        """
+        self._convergence_tolerance = convergence_tolerance
+        self._convergence_places = max(0, -Decimal(repr(convergence_tolerance)).adjusted())
+
+        super().__init__(
+            jurisdiction=jurisdiction,
+            state=state,
+            year=year,
+            date=date,
+            office=office,
+            notes=notes,
+            parser_func=parser_func,
+            parser_args=parser_args,
+            parsed_cvr=parsed_cvr,
+            split_fields=split_fields,
+            ballot_matrix=ballot_matrix,
+            writein_matcher=writein_matcher,
+            cvr=cvr,
+            eager_stats=eager_stats,
+            disable_aggregation=False,
+            exhaust_on_duplicate_candidate_marks=exhaust_on_duplicate_candidate_marks,
+            exhaust_on_overvote_marks=exhaust_on_overvote_marks,
+            exhaust_on_N_repeated_skipped_marks=exhaust_on_N_repeated_skipped_marks,
+            treat_combined_writeins_as_exhaustable_duplicates=treat_combined_writeins_as_exhaustable_duplicates,
+            combine_writein_marks=combine_writein_marks,
+            exclude_writein_marks=exclude_writein_marks,
+            n_winners=n_winners,
+            multi_winner_rounds=multi_winner_rounds,
+            bottoms_up_threshold=bottoms_up_threshold,
+            writeins_eliminated_first=writeins_eliminated_first,
+            batch_elimination=batch_elimination,
+        )
+
+    def _start_weights(self) -> None:
+        self._weights = np.array([float(b["weight"]) for b in self._contest_cvr_ld], dtype=np.float64)
+        self._keep = np.ones(len(self._candidate_codes))
+
+        # next round tally, already converged by _calc_round_transfer
+        self._converged_tally = None
+
+        # Decimal of each rounded float seen so far, see _to_decimals. Starts with the ballot weights that need no
+        # rounding, so a weight that never changes is recorded as the same object in every round.
+        self._decimals = {}
+        for b, weight in zip(self._contest_cvr_ld, self._weights.tolist()):
+            if round(weight, self._convergence_places) == weight:
+                self._decimals.setdefault(weight, b["weight"])
+
+        tabulation = self._tabulations[self._tab_num - 1]
+        tabulation["convergence_tolerance"] = self._convergence_tolerance
+        tabulation["convergence_iterations"] = []
+
+    def _to_decimals(self, values: np.ndarray) -> List[Decimal]:
+        """
+        Convert float weights to Decimals rounded to the decimal place of the convergence tolerance, each distinct
+        value once.
+
+        :param values: Float weights.
+        :type values: np.ndarray
+        :rtype: List[Decimal]
+        """
+        # adding 0.0 turns the -0.0 left by rounding tiny negative float errors into 0.0
+        unique_values, inverse = np.unique(np.round(values, self._convergence_places) + 0.0, return_inverse=True)
+
+        unique_decimals = []
+        for value in unique_values.tolist():
+            if value not in self._decimals:
+                # whole numbers are recorded as whole number Decimals, the same as other variants' tallies
+                self._decimals[value] = Decimal(int(value)) if value.is_integer() else Decimal(repr(value))
+            unique_decimals.append(self._decimals[value])
+
+        return [unique_decimals[idx] for idx in inverse.ravel().tolist()]
+
+    def _remove_candidates(self, codes: np.ndarray) -> None:
+        # elected candidates keep their keep factor, it is adjusted in _converge_keep_factors
+        self._keep[codes[~self._elected[codes]]] = 0
+
+    def _converge_keep_factors(self) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        """
+        Tally all ballots, then scale each elected candidate's keep factor by threshold/votes and tally again, until
+        the elected candidates' votes are within convergence tolerance of the threshold.
+
+        :return: Votes held by each candidate, weight left over on each ballot, threshold and number of keep factor
+        updates.
+        :rtype: Tuple[np.ndarray, np.ndarray, float, int]
+        """
+        iterations = 0
+        while True:
+
+            votes, excess = self._rank_matrix.keep_tally(self._weights, self._keep)
+            threshold = votes.sum() / (self._n_winners + 1)
+
+            # an elected candidate already keeping all the weight that reaches them cannot be brought up to threshold
+            adjustable = self._elected & (votes > 0) & ((votes > threshold) | (self._keep < 1))
+            if np.abs(votes[adjustable] - threshold).sum() <= self._convergence_tolerance:
+                return votes, excess, threshold, iterations
+
+            if iterations == self._max_iterations:
+                raise RuntimeError(
+                    f"(tabulation={self._tab_num}) keep factors did not converge within {iterations} iterations"
+                )
+
+            iterations += 1
+            scale = np.divide(threshold, votes, out=np.ones_like(votes), where=adjustable)
+            self._keep = np.minimum(self._keep * scale, 1)
+
+    def _tally_active_ballots(self) -> None:
+        """
+        Each ballot counts towards its first continuing choice, with the weight left after the elected candidates
+        ranked above them keep their share.
+        """
+        if self._converged_tally is None:
+            self._converged_tally = self._converge_keep_factors()
+        votes, excess, threshold, iterations = self._converged_tally
+        self._converged_tally = None
+
+        self._tabulations[self._tab_num - 1]["convergence_iterations"].append(iterations)
+        self._round_quota = self._to_decimals(np.array([threshold]))[0]
+
+        # recorded votes of each candidate, followed by exhausted weight
+        self._round_votes = self._to_decimals(np.append(votes, excess.sum()))
+
+        self._round_shares, remaining = self._rank_matrix.keep_shares(self._weights, self._keep)
+        n_ballots, n_ranks = self._round_shares.shape
+        positions, codes = self._rank_matrix.next_choices(np.full(n_ballots, -1), self._continuing)
+        continuing_shares = self._round_shares[np.arange(n_ballots), np.minimum(positions, n_ranks - 1)]
+
+        ballot_weights = self._to_decimals(np.where(positions < n_ranks, continuing_shares, remaining))
+        self._append_weighted_tally(self._round_votes, codes, ballot_weights)
+
+    def _round_threshold(self) -> Decimal:
+        return self._round_quota
+
+    def _win_threshold(self) -> str:
+        """
+        rules:
+        - threshold is recalculated each round
+        """
+        return "dynamic"
+
+    def _calc_round_transfer(self) -> None:
+        """
+        Electing or eliminating a candidate changes the keep factors of every elected candidate, so the next round
+        is tallied here and the transfer of each candidate, and exhaust, recorded as the change in their recorded
+        votes. Only these net transfers are recorded, see RCV._append_net_round_transfer.
+        """
+        self._clean_ballots()
+        self._converged_tally = self._converge_keep_factors()
+        votes, excess, _, _ = self._converged_tally
+
+        next_votes = self._to_decimals(np.append(votes, excess.sum()))
+
+        # no change is recorded as int 0, the same as in transfer matrices
+        self._append_net_round_transfer(
+            {
+                name: (next_vote - vote) or 0
+                for name, vote, next_vote in zip(self._allocation_names, self._round_votes, next_votes)
+            }
+        )
+
+    def _end_tabulation(self) -> None:
+        """
+        Add the weight each candidate elected before the final round keeps from each ballot to the weight ledger,
+        in rank order. Candidates elected in the final round are still each ballot's final allocation.
+        """
+        weight_ledger = self._tabulations[self._tab_num - 1]["weight_ledger"]
+        elected = np.append(self._elected, False)
+
+        for rank_codes, rank_shares in zip(self._rank_matrix.matrix.T, self._round_shares.T):
+            kept = elected[rank_codes] & (rank_shares > 0)
+            for code in np.unique(rank_codes[kept]).tolist():
+                rows = np.flatnonzero(kept & (rank_codes == code))
+                weights = self._to_decimals(rank_shares[rows])
+                weight_ledger.add_many(rows.tolist(), self._allocation_names[code], weights)
+
+        self._round_shares = None
+
+
+class STVGregory(STVVectorized):
+    """
+    Multi-winner elections with weighted inclusive Gregory surplus transfers.
+    - Win threshold is set as the (# first round votes)/(# of seats + 1).
+    - Every ballot counting towards a winner is transferred at its current weight times (# of votes winner has --
+    minus the threshold)/(# of votes winner has). Unlike STVFractionalBallot, transfer values are not truncated.
+    - Ballots pass over candidates already elected or eliminated.
+    - If no winners in round, candidate with least votes in a round is eliminated and has votes transferred.
+
+    Ballot weights are Decimals, computed the same way as STVFractionalBallot with truncate_to=None. Ballots sharing
+    a weight are tallied and transferred together, so each distinct weight is only multiplied and summed once.
+    """
+
+    def _start_weights(self) -> None:
+        # each ballot holds the id of its weight in self._weight_values, equal weights share an id
+        self._weight_values = []
+        self._weight_index = {}
+        self._weight_ids = np.array([self._weight_id(b["weight"]) for b in self._contest_cvr_ld], dtype=np.int64)
+
+        n_ballots = len(self._contest_cvr_ld)
+        self._positions, self._alloc = self._rank_matrix.next_choices(np.full(n_ballots, -1), self._continuing)
+
+        # votes kept by each winner and the share of each ballot behind them, added to the weight ledger at the end
+        self._kept_votes = [0] * len(self._candidate_codes)
+        self._surplus_shares = []
+
+    def _weight_id(self, weight: Decimal) -> int:
+        """
+        :param weight: Ballot weight.
+        :type weight: Decimal
+        :return: Id of the weight in self._weight_values, added if not seen before.
+        :rtype: int
+        """
+        if weight not in self._weight_index:
+            self._weight_index[weight] = len(self._weight_values)
+            self._weight_values.append(weight)
+        return self._weight_index[weight]
+
+    def _weight_totals(self, codes: np.ndarray, weight_ids: np.ndarray) -> List[Decimal]:
+        """
+        :param codes: Rank matrix code each ballot counts towards, the pad code if exhausted.
+        :type codes: np.ndarray
+        :param weight_ids: Weight id of each ballot.
+        :type weight_ids: np.ndarray
+        :return: Total weight counting towards each code, including the pad code, int 0 if none.
+        :rtype: List[Decimal]
+        """
+        n_codes = self._rank_matrix.pad + 1
+        totals = [0] * n_codes
+
+        # count the ballots of each (weight, code) pair, as one integer key per pair
+        keys, counts = np.unique(weight_ids * n_codes + codes, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            weight_id, code = divmod(key, n_codes)
+            totals[code] += count * self._weight_values[weight_id]
+        return totals
+
+    def _remove_candidates(self, codes: np.ndarray) -> None:
+        rows = np.flatnonzero(np.isin(self._alloc, codes))
+        self._positions[rows], self._alloc[rows] = self._rank_matrix.next_choices(
+            self._positions[rows], self._continuing, rows
+        )
+
+    def _tally_active_ballots(self) -> None:
+        totals = self._weight_totals(self._alloc, self._weight_ids)
+        self._round_votes = [total + kept for total, kept in zip(totals, self._kept_votes)]
+
+        weight_values = self._weight_values
+        ballot_weights = [weight_values[weight_id] for weight_id in self._weight_ids.tolist()]
+        self._append_weighted_tally(self._round_votes, self._alloc, ballot_weights)
+
+    def _update_weights(self) -> None:
+        """
+        rules:
+        - reduce weights of ballots counting towards each winner to their share of the surplus
+        """
+        threshold = self._win_threshold()
+
+        for winner in self._round_winners:
+
+            code = self._candidate_codes[winner]
+            votes = self._round_votes[code]
+            if not votes:
+                continue
+            surplus_percent = max((votes - threshold) / votes, 0)
+
+            # ballots holding the same weight share the same results, so compute them once per distinct weight
+            pile = np.flatnonzero(self._alloc == code)
+            pile_ids, weight_inverse, counts = np.unique(
+                self._weight_ids[pile], return_inverse=True, return_counts=True
+            )
+
+            remaining_ids = []
+            kept = []
+            for weight_id, count in zip(pile_ids.tolist(), counts.tolist()):
+                weight = self._weight_values[weight_id]
+                remaining_ids.append(self._weight_id(weight * surplus_percent))
+                kept.append(weight * (1 - surplus_percent))
+                self._kept_votes[code] += count * kept[-1]
+
+            weight_inverse = weight_inverse.ravel()
+            self._weight_ids[pile] = np.array(remaining_ids, dtype=np.int64)[weight_inverse]
+            self._surplus_shares.append((winner, pile, [kept[idx] for idx in weight_inverse.tolist()]))
+
+    def _calc_round_transfer(self) -> None:
+        """
+        rules:
+        - transfer votes from round loser or winner
+        """
+        if self._round_winners:
+            transfer_candidates = self._round_winners
+        else:
+            transfer_candidates = self._round_losers
+
+        continuing = self._continuing.copy()
+        continuing[[self._candidate_codes[cand] for cand in transfer_candidates]] = False
+
+        transfers = self._new_round_transfer()
+        for cand in transfer_candidates:
+
+            pile = np.flatnonzero(self._alloc == self._candidate_codes[cand])
+            _, next_codes = self._rank_matrix.next_choices(self._positions[pile], continuing, pile)
+
+            for to_code, weight in enumerate(self._weight_totals(next_codes, self._weight_ids[pile])):
+                if weight:
+                    transfers.add(cand, self._allocation_names[to_code], weight)
+
+        self._append_round_transfer(transfers)
+
+    def _end_tabulation(self) -> None:
+        weight_ledger = self._tabulations[self._tab_num - 1]["weight_ledger"]
+        for winner, pile, kept in self._surplus_shares:
+            weight_ledger.add_many(pile.tolist(), winner, kept)
 
 
 class BottomsUpThresh(RCV):
@@ -768,6 +1420,10 @@ class BottomsUpThresh(RCV):
         parser_args: Optional[Dict] = None,
         parsed_cvr: Optional[Dict] = None,
         split_fields: Optional[List] = None,
+        ballot_matrix: bool = False,
+        writein_matcher: Optional[WriteinMatcher] = None,
+        cvr: Optional[CastVoteRecord] = None,
+        eager_stats: bool = False,
         exhaust_on_duplicate_candidate_marks: bool = False,
         exhaust_on_overvote_marks: bool = False,
         exhaust_on_N_repeated_skipped_marks: int = 0,
@@ -778,6 +1434,7 @@ class BottomsUpThresh(RCV):
         multi_winner_rounds: bool = False,
         writeins_eliminated_first: bool = None,
         bottoms_up_threshold: Optional[float] = None,
+        batch_elimination: bool = False,
 
     ) -> None:
         super().__init__(
@@ -791,6 +1448,10 @@ class BottomsUpThresh(RCV):
             parser_args=parser_args,
             parsed_cvr=parsed_cvr,
             split_fields=split_fields,
+            ballot_matrix=ballot_matrix,
+            writein_matcher=writein_matcher,
+            cvr=cvr,
+            eager_stats=eager_stats,
             disable_aggregation=False,
             exhaust_on_duplicate_candidate_marks=exhaust_on_duplicate_candidate_marks,
             exhaust_on_overvote_marks=exhaust_on_overvote_marks,
@@ -802,12 +1463,17 @@ class BottomsUpThresh(RCV):
             multi_winner_rounds=multi_winner_rounds,
             bottoms_up_threshold=bottoms_up_threshold,
             writeins_eliminated_first=writeins_eliminated_first,
+            batch_elimination=batch_elimination,
         )
         if self._bottoms_up_threshold is None:
             #raise RuntimeError('BottomsUpThresh RCV variant requires values for "bottoms_up_thresh" argument')
             print("No bottoms up threshold set, default to 1/(n_winners+1)_")
             self._bottoms_up_threshold=Decimal(1)/Decimal(self._n_winners+1)
 
+        # winners are decided by which candidates are left, so eliminating a group could overshoot
+        if self._batch_elimination:
+            raise RuntimeError("BottomsUpThresh RCV variant does not support batch_elimination.")
+
     def _set_round_winners(self) -> None:
         """
         This function should set self._round_winners to the list of candidates that won the round
@@ -834,37 +1500,11 @@ class BottomsUpThresh(RCV):
         rules:
         - transfer votes from round loser
         """
+        transfers = self._new_round_transfer()
+        for ballot_idx, transfer_to in self._ballot_transfers(self._round_loser):
+            transfers.add(self._round_loser, transfer_to, self._transfer_weight(ballot_idx))
 
-        candidates = self._contest_candidates.unique_candidates.union({"exhaust"})
-
-        # calculate transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: 0 for to_cand in candidates if to_cand != from_cand}
-            for from_cand in candidates
-            if from_cand != "exhaust"
-        }
-        transfer_dict = {cand: 0 for cand in self._contest_candidates.unique_candidates.union({"exhaust"})}
-
-        for b in self._contest_cvr_ld:
-            if len(b["ballot_marks"].marks) > 0 and b["ballot_marks"].marks[0] == self._round_loser:
-                if len(b["ballot_marks"].marks) > 1:
-                    transfer_to = b["ballot_marks"].marks[1]
-                    transfer_dict[transfer_to] += b["weight"]
-                    by_candidate_transfer_dict[self._round_loser][transfer_to] += b["weight"]
-                else:
-                    transfer_dict["exhaust"] += b["weight"]
-                    by_candidate_transfer_dict[self._round_loser]["exhaust"] += b["weight"]
-
-        transfer_dict[self._round_loser] = sum(transfer_dict.values()) * -1
-        self._tabulations[self._tab_num - 1]["summary_transfers"].append(transfer_dict)
-
-        # remove candidates with no transfer
-        by_candidate_transfer_dict = {
-            from_cand: {to_cand: transfer_count for to_cand, transfer_count in transfers.items() if transfer_count != 0}
-            for from_cand, transfers in by_candidate_transfer_dict.items()
-            if sum(transfers.values()) != 0
-        }
-        self._tabulations[self._tab_num - 1]["by_candidate_transfers"].append(by_candidate_transfer_dict)
+        self._append_round_transfer(transfers)
 
     def _contest_not_complete(self) -> None:
         """
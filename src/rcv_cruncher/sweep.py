@@ -0,0 +1,218 @@
+"""
+Tabulate one CVR under many ballot rule sets and compare the results.
+"""
+
+from typing import Dict, List, Optional, Type, Union
+
+import concurrent.futures
+import itertools
+import math
+import pathlib
+import random
+
+import pandas as pd
+
+import rcv_cruncher.util as util
+from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.base import RCV
+from rcv_cruncher.rcv.variants import SingleWinner
+
+# rule set options an RCV contest accepts, see RCV.__init__
+contest_rule_options = [
+    "exhaust_on_duplicate_candidate_marks",
+    "exhaust_on_overvote_marks",
+    "exhaust_on_N_repeated_skipped_marks",
+    "treat_combined_writeins_as_exhaustable_duplicates",
+    "combine_writein_marks",
+    "exclude_writein_marks",
+    "writeins_eliminated_first",
+]
+
+# rule set options every RCV contest applies, that cannot be swept
+fixed_contest_rules = {
+    "exclude_duplicate_candidate_marks": True,
+    "exclude_overvote_marks": True,
+    "exclude_skipped_marks": True,
+}
+
+# exhaustion rules compared when no options are given, see write_rule_set_sweep
+default_sweep_options = {
+    "exhaust_on_overvote_marks": [False, True],
+    "exhaust_on_N_repeated_skipped_marks": [0, 1, 2],
+    "exhaust_on_duplicate_candidate_marks": [False, True],
+}
+
+# worker process copy of the CVR being swept, see _init_sweep_worker
+_sweep_cvr = None
+
+
+def rule_set_grid(**options: List) -> List[Dict]:
+    """Every combination of the passed rule set option values.
+
+    :param options: Rule set option names, as used by `BallotMarks.new_rule_set`, each with a list of values to try.
+    :return: List of rule sets, one per combination of values. Options left out keep the contest defaults.
+    :rtype: List[Dict]
+    """
+    names = list(options)
+    return [dict(zip(names, values)) for values in itertools.product(*(options[name] for name in names))]
+
+
+def _contest_rules(rule_set: Dict) -> Dict:
+
+    contest_rules = {}
+    for option, value in rule_set.items():
+        if option in contest_rule_options:
+            contest_rules[option] = value
+        elif option not in fixed_contest_rules:
+            raise RuntimeError(f'"{option}" is not a rule set option.')
+        elif value != fixed_contest_rules[option]:
+            raise RuntimeError(f'"{option}" is always {fixed_contest_rules[option]} in an RCV contest.')
+
+    return contest_rules
+
+
+def _sweep_rows(
+    cvr: CastVoteRecord,
+    rule_set_num: int,
+    rule_set: Dict,
+    rcv_type: Type[RCV],
+    contest_args: Dict,
+    random_seed: Optional[int],
+) -> List[Dict]:
+
+    if random_seed is not None:
+        random.seed(random_seed + rule_set_num)
+
+    rcv = rcv_type(cvr=cvr, **contest_args, **_contest_rules(rule_set))
+    contest_rules = rcv._rule_sets[rcv._contest_rule_set_name]
+
+    rows = []
+    for iTab in range(1, rcv.n_tabulations() + 1):
+        rows.append(
+            {
+                "rule_set_num": rule_set_num,
+                **{option: contest_rules[option] for option in contest_rule_options},
+                "tabulation_num": iTab,
+                "winner": rcv._winner(tabulation_num=iTab),
+                "n_rounds": rcv.n_rounds(tabulation_num=iTab),
+                **rcv._exhaustion_totals(tabulation_num=iTab),
+            }
+        )
+
+    return rows
+
+
+def _init_sweep_worker(cvr: CastVoteRecord) -> None:
+    global _sweep_cvr
+    _sweep_cvr = cvr
+
+
+def _sweep_worker_rows(*job) -> List[Dict]:
+    return _sweep_rows(_sweep_cvr, *job)
+
+
+def sweep_rule_sets(
+    cvr: CastVoteRecord,
+    rule_sets: List[Dict],
+    rcv_type: Type[RCV] = SingleWinner,
+    contest_args: Optional[Dict] = None,
+    n_processes: int = 1,
+    random_seed: Optional[int] = None,
+    keep_decimal_type: bool = False,
+) -> pd.DataFrame:
+    """Tabulate a CVR once for each rule set and compare the winners, number of rounds and exhaustion totals.
+
+    Every tabulation shares the parsed and aggregated CVR of `cvr`, see the **cvr** argument of `CastVoteRecord`, and rule sets reuse the intermediate rule results, such as the positions at which a ballot exhausts by overvote, that they have in common.
+
+    :param cvr: CVR to tabulate. Either a CastVoteRecord or an RCV object.
+    :type cvr: CastVoteRecord
+    :param rule_sets: Rule sets to try, see `rule_set_grid`. Each is a dictionary of `BallotMarks.new_rule_set` options. Options an RCV contest always applies, such as excluding overvote marks, may be included but not changed.
+    :type rule_sets: List[Dict]
+    :param rcv_type: RCV variant used for every tabulation, defaults to SingleWinner
+    :type rcv_type: Type[RCV], optional
+    :param contest_args: Other RCV constructor arguments used for every tabulation, such as **n_winners**. Defaults to None
+    :type contest_args: Optional[Dict], optional
+    :param n_processes: Number of worker processes to spread the rule sets over. Each worker receives one copy of `cvr`. If 1, rule sets are tabulated in this process. Defaults to 1
+    :type n_processes: int, optional
+    :param random_seed: Tied losers are chosen at random. If not None, the random module is seeded with `random_seed` plus the rule set number before each tabulation, so results do not depend on `n_processes`. Defaults to None
+    :type random_seed: Optional[int], optional
+    :param keep_decimal_type: Return the decimal class objects used by internal calculations rather than converting them to floats, defaults to False
+    :type keep_decimal_type: bool, optional
+    :return: Table with one row per rule set and tabulation, holding the rule set options, winner, number of rounds and exhaustion totals.
+    :rtype: pd.DataFrame
+    """
+    if contest_args is None:
+        contest_args = {}
+
+    # fail before tabulating anything
+    for rule_set in rule_sets:
+        _contest_rules(rule_set)
+
+    # rule sets with the same write-in handling share the most intermediate results, keep them in the same worker
+    def writein_handling(idx):
+        rules = BallotMarks.new_rule_set(**rule_sets[idx])
+        return rules["combine_writein_marks"], rules["treat_combined_writeins_as_exhaustable_duplicates"]
+
+    order = sorted(range(len(rule_sets)), key=writein_handling)
+    jobs = [(idx + 1, rule_sets[idx], rcv_type, contest_args, random_seed) for idx in order]
+
+    if n_processes > 1 and len(jobs) > 1:
+        chunksize = math.ceil(len(jobs) / n_processes)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_processes, initializer=_init_sweep_worker, initargs=(cvr,)
+        ) as executor:
+            job_rows = list(executor.map(_sweep_worker_rows, *zip(*jobs), chunksize=chunksize))
+    else:
+        job_rows = [_sweep_rows(cvr, *job) for job in jobs]
+
+    df = pd.DataFrame(util.flatten_list(job_rows))
+    df = df.sort_values(["rule_set_num", "tabulation_num"], ignore_index=True)
+
+    if not keep_decimal_type:
+        df = df.applymap(util.decimal2float)
+
+    return df
+
+
+def write_rule_set_sweep(
+    rcv_obj: Type[RCV],
+    save_dir: Union[str, pathlib.Path],
+    options: Optional[Dict[str, List]] = None,
+    n_processes: int = 1,
+) -> None:
+    """Wrapper for `sweep_rule_sets` that sweeps the CVR of an RCV object using its variant, contest arguments and contest rule set, and writes the table out to path '{save_dir}/rule_set_sweep/{jurisdiction}_{date OR year}_{office}.csv'
+
+    :param rcv_obj: RCV object or RCV subclass object
+    :type rcv_obj: Type[RCV]
+    :param save_dir: Directory path to write table to.
+    :type save_dir: Union[str, pathlib.Path]
+    :param options: Rule set option values to combine, see `rule_set_grid`. Options left out keep the values of the contest rule set of `rcv_obj`. If None or empty, the `default_sweep_options` exhaustion rules are combined. Defaults to None
+    :type options: Optional[Dict[str, List]], optional
+    :param n_processes: Number of worker processes, see `sweep_rule_sets`. Defaults to 1
+    :type n_processes: int, optional
+    """
+    contest_rules = rcv_obj._rule_sets[rcv_obj._contest_rule_set_name]
+    contest_rule_set = {option: contest_rules[option] for option in contest_rule_options}
+    rule_sets = [
+        {**contest_rule_set, **rule_set} for rule_set in rule_set_grid(**(options or default_sweep_options))
+    ]
+
+    contest_args = {
+        "n_winners": rcv_obj._n_winners,
+        "multi_winner_rounds": rcv_obj._multi_winner_rounds,
+        "bottoms_up_threshold": rcv_obj._bottoms_up_threshold,
+        "batch_elimination": rcv_obj._batch_elimination,
+    }
+
+    # variants that always set disable_aggregation themselves, such as STVWholeBallot, do not take it as an argument,
+    # and convergence_tolerance is only taken by variants that iterate tallies, such as STVMeek
+    for arg_name in ["disable_aggregation", "convergence_tolerance"]:
+        if util.takes_argument(type(rcv_obj), arg_name):
+            contest_args[arg_name] = getattr(rcv_obj, f"_{arg_name}")
+
+    df = sweep_rule_sets(rcv_obj, rule_sets, rcv_type=type(rcv_obj), contest_args=contest_args, n_processes=n_processes)
+
+    save_path = pathlib.Path(save_dir) / "rule_set_sweep"
+    save_path.mkdir(exist_ok=True, parents=True)
+    df.to_csv(save_path / f"{rcv_obj.unique_id}.csv", index=False)
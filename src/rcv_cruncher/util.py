@@ -1,9 +1,13 @@
+import collections.abc
 import decimal
 import os
 import pathlib
 import csv
+import inspect
 import platform
 
+import numpy as np
+
 ###############################################################
 # constants
 
@@ -109,6 +113,28 @@ def decimal2float(stat, round_places=3):
         return stat
 
 
+def takes_argument(cls, arg_name):
+    """Check whether a class constructor takes a keyword argument. Constructors that only pass **kwargs on are
+    followed up to the parent class constructor.
+
+    Args:
+        cls (type): Class to check.
+        arg_name (str): Argument name.
+
+    Returns:
+        bool: True if `arg_name` can be passed to the constructor of `cls`.
+    """
+    for klass in cls.__mro__:
+        if "__init__" not in vars(klass):
+            continue
+        parameters = inspect.signature(klass.__init__).parameters
+        if arg_name in parameters:
+            return True
+        if not any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters.values()):
+            return False
+    return False
+
+
 def DL2LD(dl):
     return [dict(zip(dl, t)) for t in zip(*dl.values())]
 
@@ -118,6 +144,278 @@ def LD2DL(ld):
     return {k: [dic[k] for dic in ld] for k in ld[0]}
 
 
+class LazyList(collections.abc.Sequence):
+    """Read-only list whose items are computed on access from their position.
+    Compares equal to any other sequence with equal items and pickles as a plain list.
+    """
+
+    __slots__ = ("_n_items", "_item_func")
+
+    def __init__(self, n_items, item_func):
+        self._n_items = n_items
+        self._item_func = item_func
+
+    def __len__(self):
+        return self._n_items
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._item_func(i) for i in range(*idx.indices(self._n_items))]
+        if idx < 0:
+            idx += self._n_items
+        if not 0 <= idx < self._n_items:
+            raise IndexError("LazyList index out of range")
+        return self._item_func(idx)
+
+    def __iter__(self):
+        return map(self._item_func, range(self._n_items))
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class RoundHistory(collections.abc.Sequence):
+    """Per ballot values recorded once per round, e.g. the candidate each ballot counts towards.
+    Only the first round is stored in full, later rounds store the positions and values of the ballots whose value
+    changed. Rounds are decoded to lists on access. Values are compared by identity, so a value replaced by an
+    equal but distinct object (e.g. Decimal('1.0') and Decimal('1')) is still recorded.
+    """
+
+    def __init__(self):
+        self._first = None
+        self._current = None
+        self._current_ids = None
+        self._changes = []
+
+    def append(self, values):
+        ids = np.fromiter(map(id, values), dtype=np.int64, count=len(values))
+
+        if self._first is None:
+            self._first = np.empty(len(values), dtype=object)
+            self._first[:] = values
+            self._current = self._first.copy()
+            self._current_ids = ids
+            return
+
+        changed = np.flatnonzero(ids != self._current_ids)
+        changed_values = np.empty(len(changed), dtype=object)
+        changed_values[:] = [values[idx] for idx in changed.tolist()]
+
+        self._current[changed] = changed_values
+        self._current_ids = ids
+        self._changes.append((changed, changed_values))
+
+    def __len__(self):
+        return 0 if self._first is None else len(self._changes) + 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("RoundHistory index out of range")
+        if idx == len(self) - 1:
+            return self._current.tolist()
+        values = self._first.copy()
+        for changed, changed_values in self._changes[:idx]:
+            values[changed] = changed_values
+        return values.tolist()
+
+    def __iter__(self):
+        if self._first is None:
+            return
+        values = self._first.copy()
+        yield values.tolist()
+        for changed, changed_values in self._changes:
+            values[changed] = changed_values
+            yield values.tolist()
+
+    def head(self, n_rounds):
+        """A history of only the first `n_rounds` rounds, sharing the stored rounds of this one."""
+        head = RoundHistory()
+        if n_rounds and self._first is not None:
+            head._first = self._first
+            head._changes = self._changes[: n_rounds - 1]
+            head._current = np.empty(len(self._first), dtype=object)
+            head._current[:] = self[n_rounds - 1]
+            head._current_ids = np.fromiter(map(id, head._current), dtype=np.int64, count=len(head._current))
+        return head
+
+
+class TransferMatrix:
+    """Vote transfers out of a round, stored as a sparse from -> to matrix over integer candidate codes.
+    Codes follow the order of the candidates passed in, which is also the key order of the dicts derived from the
+    matrix. Whole number (int) totals are reported as Decimals, pairs without a transfer as int 0.
+    """
+
+    def __init__(self, candidates):
+        self.candidates = list(candidates)
+        self._codes = {cand: code for code, cand in enumerate(self.candidates)}
+        self._cells = {}
+        self._inflows = {}
+        self._outflows = {}
+
+    def add(self, from_candidate, to_candidate, weight):
+        from_code = self._codes[from_candidate]
+        to_code = self._codes[to_candidate]
+        self._cells[from_code, to_code] = self._cells.get((from_code, to_code), 0) + weight
+        self._inflows[to_code] = self._inflows.get(to_code, 0) + weight
+        self._outflows[from_code] = self._outflows.get(from_code, 0) + weight * -1
+
+    @staticmethod
+    def _count(value):
+        if isinstance(value, int) and value:
+            return decimal.Decimal(value)
+        return value
+
+    def summary_dict(self):
+        """Net transfer to (positive) or from (negative) each candidate and "exhaust"."""
+        summary = {cand: 0 for cand in self.candidates}
+        for code, weight in self._inflows.items():
+            summary[self.candidates[code]] = weight
+        for code, weight in self._outflows.items():
+            summary[self.candidates[code]] += weight
+        return {cand: self._count(weight) for cand, weight in summary.items()}
+
+    def by_candidate_dict(self):
+        """Transfers from each candidate to each other candidate or "exhaust", leaving out zero transfers."""
+        rows = {}
+        for (from_code, to_code), weight in sorted(self._cells.items()):
+            if weight != 0:
+                rows.setdefault(self.candidates[from_code], {})[self.candidates[to_code]] = self._count(weight)
+        return {from_cand: row for from_cand, row in rows.items() if sum(row.values()) != 0}
+
+    def full_matrix(self):
+        """Transfers between every pair of candidates as nested lists, rows are from and columns to candidates."""
+        matrix = [[0] * len(self.candidates) for _ in self.candidates]
+        for (from_code, to_code), weight in self._cells.items():
+            matrix[from_code][to_code] = self._count(weight)
+        return matrix
+
+
+class WeightLedger:
+    """Ballot weight allocated to candidates during tabulation, e.g. the share of a ballot kept by a winner when its
+    surplus is transferred. Stored as columns of (ballot position, candidate code, weight) rows in allocation order,
+    with a running total per candidate.
+    """
+
+    def __init__(self):
+        self.candidates = []
+        self._codes = {}
+        self.ballots = []
+        self.codes = []
+        self.weights = []
+        self.totals = {}
+
+    def add(self, ballot_idx, candidate, weight):
+        if candidate not in self._codes:
+            self._codes[candidate] = len(self.candidates)
+            self.candidates.append(candidate)
+        self.ballots.append(ballot_idx)
+        self.codes.append(self._codes[candidate])
+        self.weights.append(weight)
+        self.totals[candidate] = self.totals.get(candidate, 0) + weight
+
+    def add_many(self, ballot_idxs, candidate, weights):
+        """Allocate weight from several ballots to one candidate, the same as calling add for each ballot in turn."""
+        if candidate not in self._codes:
+            self._codes[candidate] = len(self.candidates)
+            self.candidates.append(candidate)
+        self.ballots.extend(ballot_idxs)
+        self.codes.extend([self._codes[candidate]] * len(ballot_idxs))
+        self.weights.extend(weights)
+        self.totals[candidate] = self.totals.get(candidate, 0) + sum(weights)
+
+    def ballot_allocations(self):
+        """Dict of ballot position to that ballot's (candidate, weight) allocations, in allocation order."""
+        allocations = {}
+        for ballot_idx, code, weight in zip(self.ballots, self.codes, self.weights):
+            allocations.setdefault(ballot_idx, []).append((self.candidates[code], weight))
+        return allocations
+
+
+class RankMatrix:
+    """Ballot rankings as a (ballot, rank) matrix of integer candidate codes, for tabulations that pass fractional
+    ballot weights down the rankings with numpy rather than one ballot at a time. Codes follow the order of the
+    candidates passed in, rankings shorter than the longest one are padded with `pad`, the code after the last
+    candidate. Ballot weights and per candidate values are numpy arrays indexed the same way.
+    """
+
+    def __init__(self, ranks, candidates):
+        self.candidates = list(candidates)
+        self.pad = len(self.candidates)
+        codes = {cand: code for code, cand in enumerate(self.candidates)}
+
+        lengths = np.fromiter(map(len, ranks), dtype=np.int64, count=len(ranks))
+        n_marks = int(lengths.sum())
+        flat_codes = np.fromiter((codes[mark] for marks in ranks for mark in marks), dtype=np.int64, count=n_marks)
+        rows = np.repeat(np.arange(len(ranks)), lengths)
+        cols = np.arange(n_marks) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+        self.matrix = np.full((len(ranks), max(int(lengths.max(initial=0)), 1)), self.pad, dtype=np.int64)
+        self.matrix[rows, cols] = flat_codes
+
+    def next_choices(self, positions, continuing, rows=None):
+        """Rank position and code of the first continuing candidate ranked after the given position on each ballot.
+        Ballots without one get position equal to the number of ranks and code `pad`.
+
+        :param positions: Current rank position of each ballot, -1 to search from the first rank.
+        :param continuing: Boolean array, True for each continuing candidate.
+        :param rows: Ballots to search, in the order of `positions`, defaults to all ballots.
+        """
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        n_ranks = matrix.shape[1]
+
+        hits = np.append(continuing, False)[matrix]
+        hits &= np.arange(n_ranks) > np.asarray(positions)[:, None]
+        next_positions = hits.argmax(axis=1)
+        found = hits[np.arange(len(matrix)), next_positions]
+
+        next_codes = np.where(found, matrix[np.arange(len(matrix)), next_positions], self.pad)
+        return np.where(found, next_positions, n_ranks), next_codes
+
+    def keep_tally(self, weights, keep):
+        """Pass each ballot weight down its rankings, every candidate keeping their keep factor share of the weight
+        that reaches them.
+
+        :param weights: Weight of each ballot.
+        :param keep: Keep factor of each candidate, between 0 and 1.
+        :return: Votes kept by each candidate and weight left over on each ballot after its last ranking.
+        """
+        keep = np.append(keep, 0.0)
+        remaining = np.array(weights, dtype=np.float64)
+        votes = np.zeros(self.pad + 1)
+        for rank_codes in self.matrix.T:
+            kept = remaining * keep[rank_codes]
+            votes += np.bincount(rank_codes, weights=kept, minlength=self.pad + 1)
+            remaining -= kept
+        return votes[:-1], remaining
+
+    def keep_shares(self, weights, keep):
+        """Same as keep_tally, but returns the weight kept at each rank of each ballot instead of candidate totals.
+
+        :return: (ballot, rank) matrix of kept weights and weight left over on each ballot after its last ranking.
+        """
+        keep = np.append(keep, 0.0)
+        remaining = np.array(weights, dtype=np.float64)
+        shares = np.empty(self.matrix.shape)
+        for rank, rank_codes in enumerate(self.matrix.T):
+            shares[:, rank] = remaining * keep[rank_codes]
+            remaining -= shares[:, rank]
+        return shares, remaining
+
+
 def longname(path):
     if platform.system() == "Windows":
         return pathlib.Path("\\\\?\\" + os.fspath(path.resolve()))
@@ -1,6 +1,6 @@
 import pytest
 
-from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
 
 
 def test_update_marks():
@@ -769,3 +769,73 @@ def test_apply_rules_errors():
         b = BallotMarks(["A", "B", "C"])
         b.apply_rules()
         b.apply_rules()
+
+
+def test_unchanged_ballots_are_shared():
+
+    b = BallotMarks(["A", "B", BallotMarks.SKIPPED])
+
+    assert BallotMarks.remove_mark(b, [BallotMarks.OVERVOTE]) is b
+    assert BallotMarks.combine_writein_marks(b) is b
+    assert BallotMarks.remove_duplicate_candidate_marks(b) is b
+
+    removed = BallotMarks.remove_mark(b, [BallotMarks.SKIPPED])
+    assert removed is not b
+    assert removed.get_marks() == ["A", "B"]
+    assert b.get_marks() == ["A", "B", BallotMarks.SKIPPED]
+
+    copied = b.copy()
+    assert copied.marks is b.marks
+    copied.apply_rules(exclude_skipped_marks=True)
+    assert copied.get_marks() == ["A", "B"]
+    assert b.get_marks() == ["A", "B", BallotMarks.SKIPPED]
+    assert not b.rules
+
+
+@pytest.mark.parametrize("mark", ["A", BallotMarks.WRITEIN, "writein10", "Fuwi", "UwI", "Write-In\nB", "", "uwi "])
+def test_writein_matcher_matches_check_writein_match(mark):
+
+    matcher = WriteinMatcher()
+    assert matcher(mark) == BallotMarks.check_writein_match(mark)
+    # second lookup comes from the table
+    assert matcher(mark) == BallotMarks.check_writein_match(mark)
+
+
+param_dicts = [
+    (
+        {
+            "input": {
+                "partial_match_words": ["other"],
+                "anycase_exact_match_words": ["scattered", "w.i."],
+                "marks": ["A", "Writein", "Other (B)", "SCATTERED", "w.i.", "wxi."],
+            },
+            "expected": ["A", "Writein", BallotMarks.WRITEIN, BallotMarks.WRITEIN, BallotMarks.WRITEIN, "wxi."],
+        }
+    ),
+    (
+        {
+            "input": {
+                "partial_match_words": [],
+                "anycase_exact_match_words": [],
+                "marks": ["A", "Writein", "uwi"],
+            },
+            "expected": ["A", "Writein", "uwi"],
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param_dict", param_dicts)
+def test_writein_matcher_custom_words(param_dict):
+
+    matcher = WriteinMatcher(
+        partial_match_words=param_dict["input"]["partial_match_words"],
+        anycase_exact_match_words=param_dict["input"]["anycase_exact_match_words"],
+    ).classify(param_dict["input"]["marks"])
+
+    b = BallotMarks(param_dict["input"]["marks"])
+    computed = BallotMarks.combine_writein_marks(b, matcher)
+    assert computed.get_marks() == param_dict["expected"]
+
+    b.apply_rules(combine_writein_marks=True, writein_matcher=matcher)
+    assert b.get_marks() == param_dict["expected"]
@@ -0,0 +1,248 @@
+import copy
+
+import pytest
+import pandas as pd
+
+from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import BallotMarks, WriteinMatcher
+from rcv_cruncher.matrix import BallotMatrix, CandidateCodes
+from rcv_cruncher.rcv.variants import SingleWinner
+
+
+params = [
+    (
+        {
+            "input": {
+                "ranks": [
+                    ["A", "B", BallotMarks.SKIPPED],
+                    ["C", BallotMarks.OVERVOTE, "write-in"],
+                    ["A", "B", BallotMarks.SKIPPED],
+                    [BallotMarks.WRITEIN, "A", "A"],
+                ]
+            },
+            "expected": {
+                "names": [BallotMarks.SKIPPED, BallotMarks.OVERVOTE, BallotMarks.WRITEIN, "A", "B", "C", "write-in"],
+                "n_unique": 3,
+                "dtype": "int8",
+            },
+        }
+    ),
+    (
+        {
+            "input": {"ranks": [["A"], ["A"], ["A"]]},
+            "expected": {
+                "names": [BallotMarks.SKIPPED, BallotMarks.OVERVOTE, BallotMarks.WRITEIN, "A"],
+                "n_unique": 1,
+                "dtype": "int8",
+            },
+        }
+    ),
+    (
+        {
+            "input": {"ranks": [[f"cand{i}", f"cand{i+1}"] for i in range(200)]},
+            "expected": {
+                "names": [BallotMarks.SKIPPED, BallotMarks.OVERVOTE, BallotMarks.WRITEIN]
+                + sorted(f"cand{i}" for i in range(201)),
+                "n_unique": 200,
+                "dtype": "int16",
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_from_ranks(param):
+
+    matrix = BallotMatrix.from_ranks(param["input"]["ranks"])
+
+    assert matrix.codes.names == param["expected"]["names"]
+    assert matrix.n_unique() == param["expected"]["n_unique"]
+    assert matrix.rows.dtype == param["expected"]["dtype"]
+    assert len(matrix) == len(param["input"]["ranks"])
+    assert [b.get_marks() for b in matrix.ballot_marks()] == param["input"]["ranks"]
+
+
+def test_reserved_codes():
+
+    codes = CandidateCodes(["B", "A", BallotMarks.OVERVOTE])
+
+    assert codes.encode(BallotMarks.SKIPPED) == CandidateCodes.SKIPPED_CODE
+    assert codes.encode(BallotMarks.OVERVOTE) == CandidateCodes.OVERVOTE_CODE
+    assert codes.encode(BallotMarks.WRITEIN) == CandidateCodes.WRITEIN_CODE
+    assert codes.decode(codes.encode("A")) == "A"
+
+    with pytest.raises(RuntimeError):
+        codes.encode("C")
+
+
+def test_views_are_read_only():
+
+    matrix = BallotMatrix.from_ranks([["A", "B"], ["A", "B"]])
+    ballots = matrix.ballot_marks()
+
+    # ballots with the same ranking share one view
+    assert ballots[0] is ballots[1]
+
+    with pytest.raises(RuntimeError):
+        ballots[0].apply_rules(exclude_skipped_marks=True)
+
+    copied = ballots[0].copy()
+    copied.apply_rules(exclude_skipped_marks=True)
+    assert copied.get_marks() == ["A", "B"]
+
+
+cvr_params = [
+    (
+        {
+            "parsed_cvr": {
+                "ranks": [
+                    ["A", "B", "C", "D"],
+                    ["A", BallotMarks.SKIPPED, BallotMarks.OVERVOTE, BallotMarks.WRITEIN],
+                    ["A", "C", "B", "D"],
+                    ["write-in", "A", "C", BallotMarks.OVERVOTE],
+                    ["write-in", "B", "B", BallotMarks.OVERVOTE],
+                    ["C", "A", "B", "B"],
+                    ["C", "A", "B", "B"],
+                    ["C", "D", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+                ],
+                "precinct": ["1", "2", "1", "2", "1", "2", "1", "1"],
+            },
+            "split_fields": ["precinct"],
+        }
+    ),
+    (
+        {
+            "parsed_cvr": {
+                "ranks": [
+                    ["A", "B"],
+                    ["B", "A"],
+                    ["C", BallotMarks.SKIPPED],
+                    [BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+                ],
+                "weight": [3, 2, 1, 1],
+            }
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", cvr_params)
+def test_cvr_matches_list_backend(param):
+
+    list_cvr = CastVoteRecord(**copy.deepcopy(param))
+    matrix_cvr = CastVoteRecord(**copy.deepcopy(param), ballot_matrix=True)
+
+    pd.testing.assert_frame_equal(
+        list_cvr.get_stats(add_split_stats=True)[0], matrix_cvr.get_stats(add_split_stats=True)[0]
+    )
+    pd.testing.assert_frame_equal(list_cvr.get_cvr_table(), matrix_cvr.get_cvr_table())
+    pd.testing.assert_frame_equal(
+        list_cvr.get_cvr_table(table_format="candidate"), matrix_cvr.get_cvr_table(table_format="candidate")
+    )
+
+
+@pytest.mark.parametrize("param", cvr_params)
+def test_rcv_matches_list_backend(param):
+
+    list_rcv = SingleWinner(**copy.deepcopy(param))
+    matrix_rcv = SingleWinner(**copy.deepcopy(param), ballot_matrix=True)
+
+    pd.testing.assert_frame_equal(list_rcv.get_stats()[0], matrix_rcv.get_stats()[0])
+    assert list_rcv.get_round_by_round_dict() == matrix_rcv.get_round_by_round_dict()
+
+
+rule_params = [
+    BallotMarks.new_rule_set(),
+    BallotMarks.new_rule_set(
+        combine_writein_marks=True,
+        exclude_duplicate_candidate_marks=True,
+        exclude_overvote_marks=True,
+        exclude_skipped_marks=True,
+    ),
+    BallotMarks.new_rule_set(
+        combine_writein_marks=True,
+        treat_combined_writeins_as_exhaustable_duplicates=True,
+        exhaust_on_duplicate_candidate_marks=True,
+        exhaust_on_overvote_marks=True,
+        exhaust_on_N_repeated_skipped_marks=2,
+    ),
+    BallotMarks.new_rule_set(
+        combine_writein_marks=True,
+        exclude_writein_marks=True,
+        exhaust_on_N_repeated_skipped_marks=1,
+        exclude_skipped_marks=True,
+    ),
+]
+
+
+@pytest.mark.parametrize("rule_set", rule_params)
+def test_apply_rule_set_matches_ballot_marks(rule_set):
+
+    ranks = [
+        ["A", "B", BallotMarks.SKIPPED, BallotMarks.SKIPPED, "C"],
+        ["A", BallotMarks.OVERVOTE, "B", "B", "write-in 1"],
+        ["write-in 1", "Write-In 2", "A", BallotMarks.WRITEIN, "uwi"],
+        ["A", "A", BallotMarks.SKIPPED, "B", BallotMarks.OVERVOTE],
+        [BallotMarks.SKIPPED] * 5,
+        [BallotMarks.OVERVOTE, BallotMarks.SKIPPED, BallotMarks.SKIPPED, BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+        ["A", "B", BallotMarks.SKIPPED, BallotMarks.SKIPPED, "C"],
+    ]
+
+    matrix_ballots = BallotMatrix.from_ranks(ranks).apply_rule_set(rule_set)
+
+    for ballot_ranks, matrix_ballot in zip(ranks, matrix_ballots):
+        ballot = BallotMarks(ballot_ranks)
+        ballot.apply_rules(**rule_set)
+        assert matrix_ballot.get_marks() == ballot.get_marks()
+        assert matrix_ballot.inactive_type == ballot.inactive_type
+        assert matrix_ballot.rules == ballot.rules
+        assert matrix_ballot.input_marks == ballot.input_marks
+
+
+sequence_params = [
+    ({"writein_matcher": None, "rule_sets": rule_params}),
+    ({"writein_matcher": None, "rule_sets": rule_params[::-1]}),
+    ({"writein_matcher": WriteinMatcher(), "rule_sets": rule_params}),
+    ({"writein_matcher": WriteinMatcher(), "rule_sets": rule_params[::-1]}),
+    (
+        {
+            "writein_matcher": None,
+            "rule_sets": [
+                BallotMarks.new_rule_set(
+                    combine_writein_marks=True,
+                    treat_combined_writeins_as_exhaustable_duplicates=True,
+                    exhaust_on_duplicate_candidate_marks=True,
+                ),
+                BallotMarks.new_rule_set(exhaust_on_duplicate_candidate_marks=True),
+            ],
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", sequence_params)
+def test_apply_rule_set_sequence(param):
+
+    ranks = [
+        ["writein1", "writein", "A", BallotMarks.SKIPPED],
+        ["A", "B", "A", BallotMarks.SKIPPED],
+        ["write-in 1", "Write-In 2", "A", BallotMarks.WRITEIN],
+        ["A", "A", BallotMarks.SKIPPED, "B"],
+        [BallotMarks.SKIPPED, BallotMarks.SKIPPED, BallotMarks.OVERVOTE, "C"],
+    ]
+
+    # rule steps cached by earlier rule sets must not leak into later ones
+    matrix = BallotMatrix.from_ranks(ranks)
+    for rule_set in param["rule_sets"]:
+
+        matrix_ballots = matrix.apply_rule_set(rule_set, writein_matcher=param["writein_matcher"])
+        fresh_ballots = BallotMatrix.from_ranks(ranks).apply_rule_set(
+            rule_set, writein_matcher=param["writein_matcher"]
+        )
+
+        for ballot_ranks, matrix_ballot, fresh_ballot in zip(ranks, matrix_ballots, fresh_ballots):
+            ballot = BallotMarks(ballot_ranks)
+            ballot.apply_rules(**rule_set, writein_matcher=param["writein_matcher"])
+            assert matrix_ballot.get_marks() == fresh_ballot.get_marks() == ballot.get_marks()
+            assert matrix_ballot.inactive_type == fresh_ballot.inactive_type == ballot.inactive_type
@@ -1,3 +1,4 @@
+import copy
 import pytest
 import decimal
 
@@ -482,6 +483,107 @@ def test_add_rule_set(param):
     assert candidate_set == param["expected"]["candidate_set"]
 
 
+def test_rule_memo():
+
+    cvr = {
+        "ranks": [["A", "B"], ["A", "B"], ["B", BallotMarks.SKIPPED], ["A", "B"]],
+        "precinct": ["1", "2", "1", "3"],
+    }
+    cast_vote_record = CastVoteRecord(parsed_cvr=cvr)
+
+    # three aggregated rows share one rank pattern
+    cast_vote_record.add_rule_set("first", BallotMarks.new_rule_set(exclude_skipped_marks=True))
+    first = cast_vote_record.get_cvr_dict("first", disaggregate=False)["ballot_marks"]
+    assert cast_vote_record.get_rule_memo_info() == {"hits": 2, "misses": 2, "patterns": 2}
+
+    # the same rules under another name reuse every stored result
+    cast_vote_record.add_rule_set("second", BallotMarks.new_rule_set(exclude_skipped_marks=True))
+    second = cast_vote_record.get_cvr_dict("second", disaggregate=False)["ballot_marks"]
+    assert cast_vote_record.get_rule_memo_info() == {"hits": 6, "misses": 2, "patterns": 2}
+    assert all(a is b for a, b in zip(first, second))
+    assert [b.get_marks() for b in second] == [["A", "B"], ["A", "B"], ["B"], ["A", "B"]]
+
+
+def test_rank_groups():
+
+    cvr = {
+        "ranks": [["A", "B"], ["B", "A"], ["A", "B"], ["A", "B"]],
+        "ballotID": ["1", "2", "3", "4"],
+        "weight": [1, 2, 3, 1],
+    }
+
+    # unique ballot IDs prevent aggregation, rank groups still collapse shared rankings
+    cast_vote_record = CastVoteRecord(parsed_cvr=copy.deepcopy(cvr))
+    assert cast_vote_record._get_rank_groups() == ([0, 1, 0, 0], [[0, 2, 3], [1]])
+
+    cast_vote_record = CastVoteRecord(parsed_cvr=copy.deepcopy(cvr), disable_aggregation=True)
+    assert cast_vote_record._get_rank_groups() == ([0, 1, 2, 3], [[0], [1], [2], [3]])
+
+
+params = [
+    (
+        {
+            "input": {
+                "cvr": {
+                    "ranks": [["A", "B"], ["B", "A"], ["A", "B"], ["A", "B"]],
+                    "precinct": ["1", "1", "2", "1"],
+                    "weight": [decimal.Decimal("1"), decimal.Decimal("2"), decimal.Decimal("3"), decimal.Decimal("0.5")],
+                }
+            },
+            "expected": {
+                "cvr": {
+                    "precinct": ["1", "1", "2"],
+                    "ranks": [["A", "B"], ["B", "A"], ["A", "B"]],
+                    "weight": [decimal.Decimal("1.5"), decimal.Decimal("2"), decimal.Decimal("3")],
+                },
+                "inverse": [0, 1, 2, 0],
+                "disaggregated": {
+                    "precinct": ["1", "1", "1", "2"],
+                    "weight": [decimal.Decimal("1"), decimal.Decimal("0.5"), decimal.Decimal("2"), decimal.Decimal("3")],
+                },
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "cvr": {
+                    "ranks": [["A"], ["A"], ["A"]],
+                    "precinct": [None, "1", None],
+                    "weight": [decimal.Decimal("1"), decimal.Decimal("1"), decimal.Decimal("1")],
+                }
+            },
+            "expected": {
+                "cvr": {
+                    "precinct": [None, "1"],
+                    "ranks": [["A"], ["A"]],
+                    "weight": [decimal.Decimal("2"), decimal.Decimal("1")],
+                },
+                "inverse": [0, 1, 0],
+                "disaggregated": {
+                    "precinct": [None, None, "1"],
+                    "weight": [decimal.Decimal("1"), decimal.Decimal("1"), decimal.Decimal("1")],
+                },
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_aggregate_cvr(param):
+
+    cast_vote_record = CastVoteRecord(parsed_cvr=copy.deepcopy(param["input"]["cvr"]))
+    aggregated, inverse = cast_vote_record._aggregate_cvr(copy.deepcopy(param["input"]["cvr"]))
+
+    assert aggregated == param["expected"]["cvr"]
+    assert inverse.tolist() == param["expected"]["inverse"]
+
+    disaggregated = cast_vote_record.get_cvr_dict()
+    assert disaggregated["precinct"] == param["expected"]["disaggregated"]["precinct"]
+    assert disaggregated["weight"] == param["expected"]["disaggregated"]["weight"]
+
+
 params = [
     (
         {
@@ -233,6 +233,235 @@ def test_tabulation(param):
     assert tally_dict == [{k: float(v) for k, v in d.items()} for d in param["expected"]["rounds"]]
 
 
+class DecimalWeightsSTVFractionalBallot(STVFractionalBallot):
+    def _new_fixed_point_weights(self):
+        return None
+
+
+def exact_decimals(values):
+    return [(type(v), v.as_tuple() if isinstance(v, Decimal) else v) for v in values]
+
+
+fixed_point_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", "B", "D"],
+    ["A", "D", BallotMarks.SKIPPED, "B"],
+    ["B", "A", "C", "E"],
+    ["B", "C", BallotMarks.OVERVOTE, "A"],
+    ["C", "A", "B", "D"],
+    ["C", "B", "A", "E"],
+    ["D", "A", "C", "B"],
+    ["E", "A", "B", "C"],
+    ["A", "B", "E", "D"],
+]
+
+params = [
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+                },
+                "n_winners": 3,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [3, 0.5, 1.25, 2, 1, 0.75, 1, 2.5, 1, 4],
+                },
+                "n_winners": 3,
+                "truncate_to": 6,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "multi_winner_rounds": True,
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [7, 1, 1, 2, 1, 1, 1, 1, 1, 3],
+                },
+                "n_winners": 3,
+                "truncate_to": 2,
+            },
+        }
+    ),
+    (
+        # weights large enough that the fixed point coefficients overflow part way through
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [123456789, 1, 1, 1, 1, 1, 1, 1, 1, 123456789],
+                },
+                "n_winners": 4,
+                "truncate_to": 9,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [3, 0.5, 1.25, 2, 1, 0.75, 1, 2.5, 1, 4],
+                },
+                "n_winners": 3,
+                "truncate_to": None,
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_fixed_point_weights(param):
+    rcv = STVFractionalBallot(**param["input"])
+    decimal_rcv = DecimalWeightsSTVFractionalBallot(**param["input"])
+
+    # confirm the fixed point weights match the decimal weights exactly, not just in value
+    assert exact_decimals(b["weight"] for b in rcv._contest_cvr_ld) == exact_decimals(
+        b["weight"] for b in decimal_rcv._contest_cvr_ld
+    )
+    assert [exact_decimals(w for _, w in distrib) for distrib in rcv._tabulations[0]["final_weight_distrib"]] == [
+        exact_decimals(w for _, w in distrib) for distrib in decimal_rcv._tabulations[0]["final_weight_distrib"]
+    ]
+
+    n_round = rcv.n_rounds()
+    assert n_round == decimal_rcv.n_rounds()
+    for i in range(1, n_round + 1):
+        tally_dict = rcv.get_round_tally_dict(round_num=i)
+        decimal_tally_dict = decimal_rcv.get_round_tally_dict(round_num=i)
+        assert tally_dict.keys() == decimal_tally_dict.keys()
+        assert exact_decimals(tally_dict.values()) == exact_decimals(decimal_tally_dict.values())
+
+
+class RescanSTVFractionalBallot(STVFractionalBallot):
+    _pile_tabulation = False
+
+
+params = [
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [3, 0.5, 1.25, 2, 1, 0.75, 1, 2.5, 1, 4],
+                },
+                "n_winners": 3,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "multi_winner_rounds": True,
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [7, 1, 1, 2, 1, 1, 1, 1, 1, 3],
+                },
+                "n_winners": 3,
+                "truncate_to": None,
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_pile_tabulation(param):
+    rcv = STVFractionalBallot(**param["input"])
+    rescan_rcv = RescanSTVFractionalBallot(**param["input"])
+
+    # ballot ranks are not copied during pile tabulation, ranks are derived from the active candidates
+    assert isinstance(rcv._tabulations[0]["initial_ranks"], util.LazyList)
+    assert isinstance(rcv._tabulations[0]["final_ranks"], util.LazyList)
+
+    assert rcv.get_initial_ranks() == rescan_rcv.get_initial_ranks()
+    assert rcv.get_final_ranks() == rescan_rcv.get_final_ranks()
+    assert rcv.get_final_weight_distrib() == rescan_rcv.get_final_weight_distrib()
+    assert rcv.get_candidate_outcomes() == rescan_rcv.get_candidate_outcomes()
+
+    n_round = rcv.n_rounds()
+    assert n_round == rescan_rcv.n_rounds()
+    for i in range(1, n_round + 1):
+        assert rcv.get_round_tally_dict(round_num=i) == rescan_rcv.get_round_tally_dict(round_num=i)
+    for i in range(1, n_round):
+        assert rcv.get_round_transfer_dict(round_num=i) == rescan_rcv.get_round_transfer_dict(round_num=i)
+
+
+params = [
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [3, 0.5, 1.25, 2, 1, 0.75, 1, 2.5, 1, 4],
+                },
+                "n_winners": 3,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": fixed_point_ranks,
+                    "weight": [7, 1, 1, 2, 1, 1, 1, 1, 1, 3],
+                },
+                "n_winners": 3,
+                "truncate_to": None,
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_weight_ledger(param):
+    rcv = STVFractionalBallot(**param["input"])
+    tabulation = rcv._tabulations[0]
+    weight_ledger = tabulation["weight_ledger"]
+
+    # surplus weight is only ever kept by winners
+    assert weight_ledger.ballots
+    winners = {d["name"] for d in rcv.get_candidate_outcomes() if d["round_elected"] is not None}
+    assert set(weight_ledger.candidates) <= winners
+
+    # running totals match the ledger rows
+    totals = {}
+    for code, weight in zip(weight_ledger.codes, weight_ledger.weights):
+        candidate = weight_ledger.candidates[code]
+        totals[candidate] = totals.get(candidate, 0) + weight
+    assert totals == weight_ledger.totals
+
+    # each ballot distribution accounts for its starting weight, less any truncated surplus
+    final_weight_distrib = tabulation["final_weight_distrib"]
+    initial_weights = rcv.get_initial_weights(disaggregate=False)
+    assert len(final_weight_distrib) == len(initial_weights)
+    for distrib, initial_weight in zip(final_weight_distrib, initial_weights):
+        assert sum(w for _, w in distrib) <= initial_weight
+
+    # final round tally is the ledger totals plus weight still on ballots
+    final_tally = rcv.get_round_tally_dict(round_num=rcv.n_rounds())
+    distrib_totals = {}
+    for distrib in final_weight_distrib:
+        for candidate, weight in distrib:
+            distrib_totals[candidate] = distrib_totals.get(candidate, 0) + weight
+    for candidate, votes in final_tally.items():
+        assert votes == distrib_totals.get(candidate, 0)
+
+    assert sorted(rcv.finalist_candidates()) == sorted(
+        {c for distrib in final_weight_distrib for c, _ in distrib}.difference({"exhaust"})
+    )
+
+
 params = [
     (
         {
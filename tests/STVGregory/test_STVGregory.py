@@ -0,0 +1,99 @@
+import decimal
+import random
+
+import pytest
+
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.variants import STVFractionalBallot, STVGregory
+
+gregory_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", BallotMarks.SKIPPED, "E"],
+    ["B", "F", "G", "A"],
+    ["B", BallotMarks.OVERVOTE, "C", "D"],
+    ["C", "G", "F", "E"],
+    ["C", "A", "A", "B"],
+    ["D", "E", "F", "G"],
+    ["D", "G", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+    ["E", "D", "B", "A"],
+    ["F", "G", "E", "D"],
+    ["G", "F", "write-in", "C"],
+    ["write-in", "E", "D", "A"],
+    [BallotMarks.SKIPPED, "F", "E", "C"],
+    ["A", "B", "C", "D"],
+    ["A", "B", "D", "C"],
+    ["A", "C", "B", "D"],
+]
+
+
+# ballot weights are exact Decimals, only the order of additions can differ from STVFractionalBallot
+tolerance = decimal.Decimal("1e-25")
+
+
+def assert_decimals_close(values, other_values):
+    assert len(values) == len(other_values)
+    for value, other_value in zip(values, other_values):
+        assert abs(value - other_value) <= tolerance
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": gregory_ranks, "weight": [1] * 16}, "n_winners": 2},
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {"ranks": gregory_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 5, 2, 2, 1]},
+                "exhaust_on_overvote_marks": True,
+                "exhaust_on_duplicate_candidate_marks": True,
+                "n_winners": 3,
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {"ranks": gregory_ranks, "weight": [1.5] + [1] * 15},
+                "n_winners": 4,
+                "multi_winner_rounds": True,
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_untruncated_fractional_transfer(param):
+
+    # tied round losers are picked at random, seed so both contests break ties the same way
+    random.seed(0)
+    rcv = STVGregory(**param["input"])
+    random.seed(0)
+    fractional_rcv = STVFractionalBallot(**param["input"], truncate_to=None)
+
+    assert rcv.get_candidate_outcomes() == fractional_rcv.get_candidate_outcomes()
+    assert rcv.get_win_threshold() == fractional_rcv.get_win_threshold()
+
+    n_rounds = rcv.n_rounds()
+    assert n_rounds == fractional_rcv.n_rounds()
+    for round_num in range(1, n_rounds + 1):
+        tally = rcv.get_round_tally_dict(round_num)
+        fractional_tally = fractional_rcv.get_round_tally_dict(round_num)
+        assert tally.keys() == fractional_tally.keys()
+        assert_decimals_close([tally[cand] for cand in tally], [fractional_tally[cand] for cand in tally])
+    for round_num in range(1, n_rounds):
+        transfer = rcv.get_round_transfer_dict(round_num)
+        fractional_transfer = fractional_rcv.get_round_transfer_dict(round_num)
+        assert transfer.keys() == fractional_transfer.keys()
+        assert_decimals_close([transfer[cand] for cand in transfer], [fractional_transfer[cand] for cand in transfer])
+
+    assert rcv.get_final_ranks() == fractional_rcv.get_final_ranks()
+    for distrib, fractional_distrib in zip(rcv.get_final_weight_distrib(), fractional_rcv.get_final_weight_distrib()):
+        assert [cand for cand, _ in distrib] == [cand for cand, _ in fractional_distrib]
+        assert_decimals_close([weight for _, weight in distrib], [weight for _, weight in fractional_distrib])
+
+    stats = rcv.get_stats()[0]
+    assert stats["convergence_tolerance"].item() is None
+    assert stats["convergence_iterations"].item() is None
@@ -0,0 +1,175 @@
+import decimal
+import itertools
+
+import pytest
+
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.variants import STVMeek
+
+params = [
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": [
+                        ["A", BallotMarks.SKIPPED],
+                        ["A", "B"],
+                        ["B", BallotMarks.SKIPPED],
+                        ["C", BallotMarks.SKIPPED],
+                    ],
+                    "weight": [40, 20, 18, 22],
+                },
+                "n_winners": 2,
+            },
+            "expected": {
+                # A keeps 3/7 of each ballot, the threshold falls to 180/7 as 4/7 of the A only ballots exhaust
+                "rounds": [
+                    {"A": 60, "B": 18, "C": 22},
+                    {"A": 180 / 7, "B": 18 + 80 / 7, "C": 22},
+                ],
+                "transfers": [{"A": -60 + 180 / 7, "B": 80 / 7, "C": 0, "exhaust": 160 / 7}],
+                "winners": ["A", "B"],
+                "final_weight_distrib": [
+                    [("A", 120 / 7), ("exhaust", 160 / 7)],
+                    [("A", 60 / 7), ("B", 80 / 7)],
+                    [("B", 18)],
+                    [("C", 22)],
+                ],
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": [
+                        ["A", "C"],
+                        ["B", BallotMarks.SKIPPED],
+                        ["C", BallotMarks.SKIPPED],
+                        ["D", "A"],
+                    ],
+                    "weight": [7, 3, 3, 2],
+                },
+                "n_winners": 2,
+            },
+            "expected": {
+                # threshold 5, D's ballots reach the elected A, whose keep factor falls to 13/25 as 12/25 of them
+                # exhaust and lower the threshold to 117/25
+                "rounds": [
+                    {"A": 7, "B": 3, "C": 3, "D": 2},
+                    {"A": 5, "B": 3, "C": 5, "D": 2},
+                    {"A": 117 / 25, "B": 3, "C": 159 / 25, "D": 0},
+                ],
+                "transfers": [
+                    {"A": -2, "B": 0, "C": 2, "D": 0, "exhaust": 0},
+                    {"A": -8 / 25, "B": 0, "C": 34 / 25, "D": -2, "exhaust": 24 / 25},
+                ],
+                "winners": ["A", "C"],
+            },
+        }
+    ),
+]
+
+
+def as_floats(d):
+    return {k: float(v) for k, v in d.items()}
+
+
+@pytest.mark.parametrize("param", params)
+def test_keep_factors(param):
+    rcv = STVMeek(**param["input"])
+
+    assert rcv.n_rounds() == len(param["expected"]["rounds"])
+    for round_num, expected_round in enumerate(param["expected"]["rounds"], start=1):
+        assert as_floats(rcv.get_round_tally_dict(round_num)) == pytest.approx(expected_round, abs=1e-4)
+    for round_num, expected_transfer in enumerate(param["expected"]["transfers"], start=1):
+        assert as_floats(rcv.get_round_transfer_dict(round_num)) == pytest.approx(expected_transfer, abs=1e-4)
+
+    assert rcv._all_winners() == param["expected"]["winners"]
+    assert rcv.get_win_threshold() == "dynamic"
+
+    if "final_weight_distrib" in param["expected"]:
+        final_weight_distrib = rcv.get_final_weight_distrib(disaggregate=False)
+        for distrib, expected_distrib in zip(final_weight_distrib, param["expected"]["final_weight_distrib"]):
+            assert [cand for cand, _ in distrib] == [cand for cand, _ in expected_distrib]
+            assert [float(weight) for _, weight in distrib] == pytest.approx(
+                [weight for _, weight in expected_distrib], abs=1e-4
+            )
+
+
+params = [
+    ({"convergence_tolerance": 0.1}),
+    ({"convergence_tolerance": 0.00001}),
+    ({"convergence_tolerance": 1e-9}),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_convergence_stats(param):
+    rcv = STVMeek(
+        parsed_cvr={
+            "ranks": [["A", BallotMarks.SKIPPED], ["A", "B"], ["B", "C"], ["C", "B"]],
+            "weight": [40, 20, 18, 22],
+        },
+        n_winners=2,
+        **param,
+    )
+
+    stats = rcv.get_stats()[0]
+    assert stats["convergence_tolerance"].item() == param["convergence_tolerance"]
+
+    # A is elected in the first round, the second round tally needs several keep factor updates
+    round_iterations = rcv._tabulations[0]["convergence_iterations"]
+    assert round_iterations[0] == 0
+    assert round_iterations[1] > 1
+    assert stats["convergence_iterations"].item() == sum(round_iterations)
+
+    threshold = sum(rcv.get_round_tally_dict(2).values()) / 3
+    assert abs(rcv.get_round_tally_dict(2)["A"] - threshold) <= param["convergence_tolerance"]
+
+
+# every ordering of three of five candidates, with uneven weights
+meek_ranks = [list(ranks) for ranks in itertools.permutations("ABCDE", 3)]
+meek_weights = [(idx * 7) % 11 + 1 for idx in range(len(meek_ranks))]
+
+params = [
+    ({"convergence_tolerance": 0.00001, "places": 5}),
+    ({"convergence_tolerance": 0.001, "places": 3}),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_net_transfers(param):
+    rcv = STVMeek(
+        parsed_cvr={"ranks": meek_ranks, "weight": meek_weights},
+        n_winners=3,
+        convergence_tolerance=param["convergence_tolerance"],
+    )
+    unit = decimal.Decimal(10) ** -param["places"]
+
+    # tallies are rounded to the decimal place of the tolerance
+    n_rounds = rcv.n_rounds()
+    for round_num in range(1, n_rounds + 1):
+        for tally in rcv.get_round_tally_dict(round_num).values():
+            assert tally == decimal.Decimal(tally).quantize(unit)
+
+    # transfers are the change in rounded tallies, and still balance out
+    for round_num in range(1, n_rounds):
+        tally = rcv.get_round_tally_dict(round_num)
+        next_tally = rcv.get_round_tally_dict(round_num + 1)
+        transfer = rcv.get_round_transfer_dict(round_num)
+        assert {cand: transfer[cand] for cand in tally} == {cand: next_tally[cand] - tally[cand] for cand in tally}
+        assert abs(sum(transfer.values())) <= len(transfer) * unit
+
+    # candidates elected before the final round hold the threshold to within the tolerance
+    outcomes = rcv.get_candidate_outcomes()
+    final_tally = rcv.get_round_tally_dict(n_rounds)
+    held = [final_tally[d["name"]] for d in outcomes if d["round_elected"] and d["round_elected"] < n_rounds]
+    assert len(held) == 2
+    assert abs(held[0] - held[1]) <= decimal.Decimal(repr(param["convergence_tolerance"])) + unit
+
+    # there are no flows between candidates behind the net transfers
+    with pytest.raises(RuntimeError):
+        rcv.get_round_transfer_matrix(1)
+    with pytest.raises(RuntimeError):
+        rcv.get_round_transfer_dict(1, candidate_netted=False)
@@ -0,0 +1,51 @@
+import pytest
+
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.variants import STVWholeBallot
+
+params = [
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": [["A", "B" if idx % 2 == 0 else "C"] for idx in range(10)]
+                    + [["B", "C"], ["B", "C"], ["C", "B"]]
+                },
+                "n_winners": 2,
+            },
+            "expected": {
+                # threshold 5, surplus 5 of 10 votes, so every 2nd ballot from the 2nd on transfers
+                "transfer_ballots": [1, 3, 5, 7, 9],
+                "transfers": {"A": -5, "B": 0, "C": 5, "exhaust": 0},
+            },
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": [["A", "B" if idx % 2 == 0 else "C"] for idx in range(3)]
+                    + [["A", BallotMarks.SKIPPED]]
+                    + [["A", "B" if idx % 2 == 0 else "C"] for idx in range(4, 10)]
+                    + [["B", "C"], ["B", "C"], ["C", "B"]]
+                },
+                "n_winners": 2,
+            },
+            "expected": {
+                # the 4th ballot has no continuing candidate, so the second pass starts at the 3rd ballot
+                "transfer_ballots": [1, 5, 7, 9, 2],
+                "transfers": {"A": -5, "B": 1, "C": 4, "exhaust": 0},
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_surplus_ballots(param):
+    rcv = STVWholeBallot(**param["input"])
+
+    assert rcv._surplus_selections["A"][1] == param["expected"]["transfer_ballots"]
+    assert rcv.get_round_transfer_dict(1) == param["expected"]["transfers"]
+    outcomes = {d["name"]: d for d in rcv.get_candidate_outcomes()}
+    assert outcomes["A"]["round_elected"] == 1
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from rcv_cruncher.marks import BallotMarks
@@ -2636,3 +2638,87 @@ def test_split_total_pretally_exhausted(param):
 # def test_split_total_posttally_exhausted_by_duplicate_rankings(param):
 #     rcv = Until2(**param['input'])
 #     assert rcv.stats(add_split_stats=True)[0]['split_total_posttally_exhausted_by_duplicate_rankings'].tolist() == param['expected']['stat']
+
+
+class RescanSequential(Sequential):
+    _pile_tabulation = False
+
+
+seat_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", BallotMarks.SKIPPED, "E"],
+    ["B", "F", "G", "A"],
+    ["B", BallotMarks.OVERVOTE, "C", "D"],
+    ["C", "G", "F", "E"],
+    ["C", "A", "A", "B"],
+    ["D", "E", "F", "G"],
+    ["D", "G", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+    ["E", "D", "B", "A"],
+    ["F", "G", "E", "D"],
+    ["G", "F", "write-in", "C"],
+    ["write-in", "E", "D", "A"],
+    ["Write In", BallotMarks.SKIPPED, "B", "G"],
+    [BallotMarks.SKIPPED, "F", "E", "C"],
+    ["A", "B", "C", "D"],
+    ["B", "A", "D", "C"],
+]
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": seat_ranks, "weight": [1] * 16}, "n_winners": 4},
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {"ranks": seat_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1, 5, 2]},
+                "exhaust_on_overvote_marks": True,
+                "exhaust_on_duplicate_candidate_marks": True,
+                "n_winners": 7,
+            },
+        }
+    ),
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": seat_ranks, "weight": [1.5] + [1] * 15}, "n_winners": 3},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_seat_start(param):
+
+    # tied round losers are picked at random, seed so both contests break ties the same way
+    random.seed(0)
+    rcv = Sequential(**param["input"])
+    random.seed(0)
+    rescan_rcv = RescanSequential(**param["input"])
+
+    # tabulations after the first start from the previous tabulation's piles
+    assert rcv._seat_start is not None
+
+    assert rcv.n_tabulations() == rescan_rcv.n_tabulations()
+    for tab_num in range(1, rcv.n_tabulations() + 1):
+        n_rounds = rcv.n_rounds(tabulation_num=tab_num)
+        assert n_rounds == rescan_rcv.n_rounds(tabulation_num=tab_num)
+        for round_num in range(1, n_rounds + 1):
+            assert rcv.get_round_tally_dict(round_num, tabulation_num=tab_num) == rescan_rcv.get_round_tally_dict(
+                round_num, tabulation_num=tab_num
+            )
+        for round_num in range(1, n_rounds):
+            assert rcv.get_round_transfer_dict(
+                round_num, tabulation_num=tab_num
+            ) == rescan_rcv.get_round_transfer_dict(round_num, tabulation_num=tab_num)
+        assert rcv.get_candidate_outcomes(tabulation_num=tab_num) == rescan_rcv.get_candidate_outcomes(
+            tabulation_num=tab_num
+        )
+        assert rcv.get_initial_ranks(tabulation_num=tab_num) == rescan_rcv.get_initial_ranks(tabulation_num=tab_num)
+        assert rcv.get_final_ranks(tabulation_num=tab_num) == rescan_rcv.get_final_ranks(tabulation_num=tab_num)
+        assert rcv.get_final_weight_distrib(tabulation_num=tab_num) == rescan_rcv.get_final_weight_distrib(
+            tabulation_num=tab_num
+        )
+
+    for rcv_stats, rescan_stats in zip(rcv.get_stats(), rescan_rcv.get_stats()):
+        assert rcv_stats.drop(columns="rcv_type").equals(rescan_stats.drop(columns="rcv_type"))
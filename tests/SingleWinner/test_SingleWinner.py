@@ -1,7 +1,12 @@
+import decimal
+import random
 import pytest
 
+import pandas as pd
+
+from rcv_cruncher.cvr.base import CastVoteRecord
 from rcv_cruncher.marks import BallotMarks
-from rcv_cruncher.rcv.variants import SingleWinner
+from rcv_cruncher.rcv.variants import BottomsUpThresh, SingleWinner, Sequential, STVWholeBallot, Until2
 
 # testing:
 
@@ -2901,3 +2906,388 @@ def test_split_total_posttally_exhausted_by_duplicate_rankings(param):
         rcv.get_stats(add_split_stats=True)[0]["split_total_posttally_exhausted_by_duplicate_rankings"].tolist()
         == param["expected"]["stat"]
     )
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": [["A", "B"], ["B", "A"], ["C", "B"], ["A", "C"]], "weight": [2, 1, 1, 1]}},
+            "expected": {"integer_tally": True, "first_round": {"A": 3, "B": 1, "C": 1}},
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {"ranks": [["A", "B"], ["B", "A"], ["C", "B"], ["A", "C"]], "weight": [2, 1, 1.5, 1]}
+            },
+            "expected": {"integer_tally": False, "first_round": {"A": 3, "B": 1, "C": 1.5}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_integer_weight_tally(param):
+    rcv = SingleWinner(**param["input"])
+
+    assert (rcv._contest_integer_weights is not None) == param["expected"]["integer_tally"]
+
+    # integer tallies are reported as Decimals
+    first_round = rcv.get_round_tally_dict(1)
+    assert first_round == param["expected"]["first_round"]
+    assert all(isinstance(count, decimal.Decimal) for count in first_round.values())
+    assert all(isinstance(stat, decimal.Decimal) for stat in rcv.get_stats(keep_decimal_type=True)[0]["total_ballots"])
+
+
+class RescanSingleWinner(SingleWinner):
+    _pile_tabulation = False
+
+
+class RescanSequential(Sequential):
+    _pile_tabulation = False
+
+
+pile_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", BallotMarks.SKIPPED, "E"],
+    ["B", "F", "G", "A"],
+    ["B", BallotMarks.OVERVOTE, "C", "D"],
+    ["C", "G", "F", "E"],
+    ["C", "A", "A", "B"],
+    ["D", "E", "F", "G"],
+    ["D", "G", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+    ["E", "D", "B", "A"],
+    ["F", "G", "E", "D"],
+    ["G", "F", "write-in", "C"],
+    ["write-in", "E", "D", "A"],
+    ["Write In", BallotMarks.SKIPPED, "B", "G"],
+    [BallotMarks.SKIPPED, "F", "E", "C"],
+]
+
+params = [
+    (
+        {
+            "classes": (SingleWinner, RescanSingleWinner),
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}},
+            "expected": {"piles": True},
+        }
+    ),
+    (
+        {
+            "classes": (SingleWinner, RescanSingleWinner),
+            "input": {
+                "parsed_cvr": {"ranks": pile_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1]},
+                "exhaust_on_overvote_marks": True,
+                "exhaust_on_N_repeated_skipped_marks": 2,
+            },
+            "expected": {"piles": True},
+        }
+    ),
+    (
+        {
+            "classes": (Sequential, RescanSequential),
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}, "n_winners": 3},
+            "expected": {"piles": True},
+        }
+    ),
+    (
+        {
+            "classes": (SingleWinner, RescanSingleWinner),
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1.5] + [1] * 13}},
+            "expected": {"piles": False},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_pile_tabulation(param):
+    pile_class, rescan_class = param["classes"]
+
+    # tied round losers are picked at random, seed so both tabulations break ties the same way
+    random.seed(0)
+    rcv = pile_class(**param["input"])
+    random.seed(0)
+    rescan_rcv = rescan_class(**param["input"])
+
+    assert (rcv._contest_integer_weights is not None) == param["expected"]["piles"]
+
+    assert rcv.n_tabulations() == rescan_rcv.n_tabulations()
+    for tab_num in range(1, rcv.n_tabulations() + 1):
+        n_rounds = rcv.n_rounds(tabulation_num=tab_num)
+        assert n_rounds == rescan_rcv.n_rounds(tabulation_num=tab_num)
+        for round_num in range(1, n_rounds + 1):
+            assert rcv.get_round_tally_dict(round_num, tabulation_num=tab_num) == rescan_rcv.get_round_tally_dict(
+                round_num, tabulation_num=tab_num
+            )
+        for round_num in range(1, n_rounds):
+            assert rcv.get_round_transfer_dict(
+                round_num, tabulation_num=tab_num
+            ) == rescan_rcv.get_round_transfer_dict(round_num, tabulation_num=tab_num)
+        assert rcv.get_candidate_outcomes(tabulation_num=tab_num) == rescan_rcv.get_candidate_outcomes(
+            tabulation_num=tab_num
+        )
+        assert rcv.get_final_ranks(tabulation_num=tab_num) == rescan_rcv.get_final_ranks(tabulation_num=tab_num)
+        assert rcv.get_final_weight_distrib(tabulation_num=tab_num) == rescan_rcv.get_final_weight_distrib(
+            tabulation_num=tab_num
+        )
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}},
+        }
+    ),
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1.5] + [1] * 13}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_round_history(param):
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+
+    allocation_history = rcv._tabulations[0]["ballot_round_allocation"]
+    weight_history = rcv._tabulations[0]["ballot_round_weight"]
+    assert len(allocation_history) == len(weight_history) == rcv.n_rounds()
+
+    # rounds decode the same whether indexed or iterated
+    allocations = list(allocation_history)
+    assert allocations == [allocation_history[i] for i in range(rcv.n_rounds())]
+    assert allocations[-1] == allocation_history[-1]
+    assert allocations[0] == [ranks[0] if ranks else "exhaust" for ranks in rcv.get_initial_ranks(disaggregate=False)]
+
+    # later rounds only store the ballots that moved, weights never change in single winner contests
+    for (changed, _), previous, current in zip(allocation_history._changes, allocations, allocations[1:]):
+        assert changed.tolist() == [idx for idx, (a, b) in enumerate(zip(previous, current)) if a != b]
+    assert all(len(changed) == 0 for changed, _ in weight_history._changes)
+    assert list(weight_history) == [rcv.get_initial_weights(disaggregate=False)] * rcv.n_rounds()
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_round_tally_cache(param):
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+
+    for round_num in range(1, rcv.n_rounds() + 1):
+        for only_active in [False, True]:
+            round_tuple = rcv.get_round_tally_tuple(round_num, only_round_active_candidates=only_active)
+            round_dict = rcv.get_round_tally_dict(round_num, only_round_active_candidates=only_active)
+            assert round_dict == dict(zip(*round_tuple))
+
+            # callers get their own copies of the cached tally
+            round_tuple.clear()
+            round_dict.clear()
+            assert rcv.get_round_tally_tuple(round_num, only_round_active_candidates=only_active)
+            assert rcv.get_round_tally_dict(round_num, only_round_active_candidates=only_active)
+
+    # candidates drop out of the active tally after the round they are eliminated in
+    outcomes = {d["name"]: d for d in rcv.get_candidate_outcomes()}
+    for round_num in range(1, rcv.n_rounds() + 1):
+        active = rcv.get_round_tally_dict(round_num, only_round_active_candidates=True)
+        assert set(active) == {
+            cand
+            for cand, d in outcomes.items()
+            if (d["round_eliminated"] or round_num) >= round_num and (d["round_elected"] or round_num) >= round_num
+        }
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}},
+        }
+    ),
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1.5]}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_round_transfer_matrix(param):
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+
+    for round_num in range(1, rcv.n_rounds()):
+        matrix = rcv.get_round_transfer_matrix(round_num)
+        assert matrix.columns.tolist() == matrix.index.tolist() + ["exhaust"]
+
+        # the by candidate transfers are the non-zero matrix cells
+        by_candidate = rcv.get_round_transfer_dict(round_num, candidate_netted=False)
+        assert by_candidate == {
+            from_cand: {to_cand: count for to_cand, count in row.items() if count != 0}
+            for from_cand, row in matrix.iterrows()
+            if sum(row) != 0
+        }
+
+        # netted transfers are the column sums less the row sums
+        netted = rcv.get_round_transfer_dict(round_num)
+        inflow = {cand: sum(matrix[cand]) for cand in matrix.columns}
+        outflow = {cand: sum(matrix.loc[cand]) for cand in matrix.index}
+        assert netted == {cand: inflow[cand] - outflow.get(cand, 0) for cand in netted}
+
+    final_matrix = rcv.get_round_transfer_matrix(rcv.n_rounds())
+    assert all(count.is_nan() for count in final_matrix.to_numpy().ravel())
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}, "year": "2020", "office": "mayor"},
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {"ranks": pile_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1.5]},
+                "split_fields": ["precinct"],
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_shared_cvr(param):
+    cvr_input = {k: v for k, v in param["input"].items() if k != "parsed_cvr"}
+    parsed_cvr = {**param["input"]["parsed_cvr"]}
+    if "split_fields" in cvr_input:
+        parsed_cvr["precinct"] = [f"p{idx % 3}" for idx in range(len(parsed_cvr["ranks"]))]
+
+    cvr = CastVoteRecord(parsed_cvr={k: list(v) for k, v in parsed_cvr.items()}, **cvr_input)
+
+    for rcv_class, contest_input in [
+        (SingleWinner, {}),
+        (Until2, {}),
+        (BottomsUpThresh, {"bottoms_up_threshold": 0.2}),
+    ]:
+        random.seed(0)
+        shared_rcv = rcv_class(cvr=cvr, **contest_input)
+        random.seed(0)
+        rcv = rcv_class(parsed_cvr={k: list(v) for k, v in parsed_cvr.items()}, **cvr_input, **contest_input)
+
+        # parsed and default rule set data is shared, not rebuilt
+        assert shared_rcv.unique_id == cvr.unique_id
+        assert shared_rcv.get_cvr_dict(disaggregate=False) is cvr.get_cvr_dict(disaggregate=False)
+        assert shared_rcv._get_cvr_stat_table() is cvr._get_cvr_stat_table()
+
+        assert shared_rcv.get_candidate_outcomes() == rcv.get_candidate_outcomes()
+        assert shared_rcv.get_final_ranks() == rcv.get_final_ranks()
+        assert shared_rcv.get_final_weights() == rcv.get_final_weights()
+        for round_num in range(1, rcv.n_rounds() + 1):
+            assert shared_rcv.get_round_tally_dict(round_num) == rcv.get_round_tally_dict(round_num)
+
+        pd.testing.assert_frame_equal(
+            shared_rcv.get_stats(add_split_stats=True)[0], rcv.get_stats(add_split_stats=True)[0]
+        )
+
+    # contest rule set results are looked up once and reused by every variant built from the cvr
+    assert cvr.get_rule_memo_info()["hits"] > 0
+    assert "__contest" not in cvr._rule_sets
+
+    # variants that cannot use the aggregated cvr refuse to share it
+    with pytest.raises(RuntimeError):
+        STVWholeBallot(cvr=cvr, n_winners=2)
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}},
+        }
+    ),
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1.5]}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_lazy_stats(param):
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+    random.seed(0)
+    eager_rcv = SingleWinner(**param["input"], eager_stats=True)
+
+    # nothing is computed until stats are asked for
+    assert rcv._cvr_stat_table is None
+    assert rcv._summary_cvr_stat_table is None
+    assert rcv._contest_stat_table is None
+    assert rcv._summary_contest_stat_tables is None
+    assert rcv.get_round_tally_dict(1) == eager_rcv.get_round_tally_dict(1)
+
+    # the round by round table only needs the per ballot contest table
+    pd.testing.assert_frame_equal(rcv.get_round_by_round_table(), eager_rcv.get_round_by_round_table())
+    assert rcv._summary_cvr_stat_table is None
+    assert rcv._summary_contest_stat_tables is None
+
+    assert eager_rcv._cvr_stat_table is not None
+    assert eager_rcv._summary_cvr_stat_table is not None
+    assert eager_rcv._contest_stat_table is not None
+    assert eager_rcv._summary_contest_stat_tables is not None
+
+    pd.testing.assert_frame_equal(rcv.get_stats()[0], eager_rcv.get_stats()[0])
+
+    # and kept once computed
+    summary_contest_stat_tables = rcv._summary_contest_stat_tables
+    assert summary_contest_stat_tables is not None
+    rcv.get_stats()
+    assert rcv._summary_contest_stat_tables is summary_contest_stat_tables
+
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [1] * 14}, "year": "2020", "office": "mayor"},
+        }
+    ),
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": pile_ranks, "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1.5]}},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_stats_memo(param):
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+
+    stats = rcv.get_stats()[0]
+    assert rcv.get_rank_limit() == stats["rank_limit"].item()
+    assert rcv.get_n_candidates() == stats["n_candidates"].item()
+    assert rcv.unique_id == stats["unique_id"].item()
+    assert rcv.get_total_pretally_exhausted() == rcv.get_stats(keep_decimal_type=True)[0][
+        "total_pretally_exhausted"
+    ].item()
+
+    # repeated calls reuse the stats, but callers get their own copy
+    memo = rcv._stats_memo[(False, False, True)]
+    stats["rank_limit"] = -1
+    assert rcv.get_stats()[0]["rank_limit"].item() == rcv.get_rank_limit()
+    assert rcv._stats_memo[(False, False, True)] is memo
+
+    # adding a rule set clears the memo
+    rcv.add_rule_set("no_overvotes", BallotMarks.new_rule_set(exclude_overvote_marks=True))
+    assert rcv._stats_memo == {}
+    pd.testing.assert_frame_equal(rcv.get_stats()[0], memo[0])
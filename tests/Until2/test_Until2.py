@@ -1,7 +1,10 @@
+import random
+
+import pandas as pd
 import pytest
 
 from rcv_cruncher.marks import BallotMarks
-from rcv_cruncher.rcv.variants import Until2
+from rcv_cruncher.rcv.variants import SingleWinner, Until2
 
 # tabulations
 # first_round_winner_vote
@@ -3827,3 +3830,109 @@ def test_split_total_posttally_exhausted_by_duplicate_rankings(param):
         rcv.get_stats(add_split_stats=True)[0]["split_total_posttally_exhausted_by_duplicate_rankings"].tolist()
         == param["expected"]["stat"]
     )
+
+
+shared_pass_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", BallotMarks.SKIPPED, "E"],
+    ["B", "F", "G", "A"],
+    ["B", BallotMarks.OVERVOTE, "C", "D"],
+    ["C", "G", "F", "E"],
+    ["C", "A", "A", "B"],
+    ["D", "E", "F", "G"],
+    ["D", "G", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+    ["E", "D", "B", "A"],
+    ["F", "G", "E", "D"],
+    ["G", "F", "write-in", "C"],
+    ["write-in", "E", "D", "A"],
+    ["Write In", BallotMarks.SKIPPED, "B", "G"],
+    [BallotMarks.SKIPPED, "F", "E", "C"],
+]
+
+params = [
+    (
+        {
+            "input": {"parsed_cvr": {"ranks": shared_pass_ranks, "weight": [1] * 14}},
+            "expected": {"shared": True},
+        }
+    ),
+    (
+        {
+            "input": {
+                "parsed_cvr": {
+                    "ranks": shared_pass_ranks,
+                    "weight": [3, 1, 2, 2, 1, 4, 1, 1, 2, 3, 1, 1, 2, 1.5],
+                    "precinct": ["p1", "p2"] * 7,
+                },
+                "split_fields": ["precinct"],
+                "exhaust_on_overvote_marks": True,
+                "exhaust_on_duplicate_candidate_marks": True,
+            },
+            "expected": {"shared": True},
+        }
+    ),
+    (
+        {
+            # majority in the first round
+            "input": {"parsed_cvr": {"ranks": [["A", "B"], ["A", "C"], ["B", "A"], ["C", "B"], ["A", "B"]]}},
+            "expected": {"shared": True},
+        }
+    ),
+    (
+        {
+            # the final two tie, so a single winner contest goes one round further
+            "input": {
+                "parsed_cvr": {
+                    "ranks": [
+                        ["A", BallotMarks.SKIPPED],
+                        ["A", BallotMarks.SKIPPED],
+                        ["B", BallotMarks.SKIPPED],
+                        ["B", BallotMarks.SKIPPED],
+                        ["C", BallotMarks.SKIPPED],
+                    ]
+                }
+            },
+            "expected": {"shared": False},
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_single_winner_from_until2(param):
+
+    # tied round losers are picked at random, seed so every contest breaks ties the same way
+    random.seed(0)
+    until2 = Until2(**param["input"])
+    random.seed(0)
+    shared = SingleWinner(cvr=until2, **{k: v for k, v in param["input"].items() if k != "parsed_cvr"})
+    random.seed(0)
+    rcv = SingleWinner(**param["input"])
+
+    majority_rounds = [tabulation["majority_round"] for tabulation in until2._tabulations]
+    assert (None not in majority_rounds) == param["expected"]["shared"]
+    if param["expected"]["shared"]:
+        assert shared.n_rounds() == majority_rounds[0]
+        assert shared._tabulations[0]["rounds"] == until2._tabulations[0]["rounds"][: majority_rounds[0]]
+
+    assert shared.n_tabulations() == rcv.n_tabulations()
+    for tab_num in range(1, rcv.n_tabulations() + 1):
+        n_rounds = rcv.n_rounds(tabulation_num=tab_num)
+        assert shared.n_rounds(tabulation_num=tab_num) == n_rounds
+        for round_num in range(1, n_rounds + 1):
+            assert shared.get_round_tally_dict(round_num, tabulation_num=tab_num) == rcv.get_round_tally_dict(
+                round_num, tabulation_num=tab_num
+            )
+        assert shared.get_candidate_outcomes(tabulation_num=tab_num) == rcv.get_candidate_outcomes(
+            tabulation_num=tab_num
+        )
+        assert shared.get_final_ranks(tabulation_num=tab_num) == rcv.get_final_ranks(tabulation_num=tab_num)
+        assert shared.get_final_weight_distrib(tabulation_num=tab_num) == rcv.get_final_weight_distrib(
+            tabulation_num=tab_num
+        )
+        assert shared.get_round_by_round_dict(tabulation_num=tab_num) == rcv.get_round_by_round_dict(
+            tabulation_num=tab_num
+        )
+
+    for shared_stats, rcv_stats in zip(shared.get_stats(add_split_stats=True), rcv.get_stats(add_split_stats=True)):
+        pd.testing.assert_frame_equal(shared_stats, rcv_stats)
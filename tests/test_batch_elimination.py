@@ -0,0 +1,109 @@
+import pytest
+
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.variants import BottomsUpThresh, SingleWinner, STVFractionalBallot, STVGregory, STVMeek, Until2
+
+skip = BallotMarks.SKIPPED
+single_winner_ranks = [["A", skip]] * 10 + [["B", skip]] * 7 + [["C", "B"]] * 3 + [["D", "C"]] * 2 + [["E", "B"]]
+stv_ranks = [["A", skip]] * 10 + [["B", skip]] * 6 + [["C", skip]] * 5 + [["D", "C"]] * 2 + [["E", "C"]]
+
+params = [
+    (
+        {
+            "rcv_type": SingleWinner,
+            "input": {"parsed_cvr": {"ranks": single_winner_ranks}},
+            "expected": {
+                "winner": "B",
+                "n_rounds": 4,
+                # E, D and C together hold 6 votes, fewer than B's 7
+                "batch_n_rounds": 2,
+                "batch_rounds_eliminated": {"A": 2, "C": 1, "D": 1, "E": 1},
+                "batch_transfers": {"A": 0, "B": 4, "C": -3, "D": -2, "E": -1, "exhaust": 2},
+            },
+        }
+    ),
+    (
+        {
+            "rcv_type": Until2,
+            "input": {"parsed_cvr": {"ranks": [["A", skip]] * 10 + [["B", skip]] * 2 + [["C", "B"]]}},
+            "expected": {
+                "winner": "A",
+                "n_rounds": 2,
+                # B and C together trail A, but two candidates must be left
+                "batch_n_rounds": 2,
+                "batch_rounds_eliminated": {"B": 2, "C": 1},
+                "batch_transfers": {"A": 0, "B": 1, "C": -1, "exhaust": 0},
+            },
+        }
+    ),
+    (
+        {
+            "rcv_type": STVFractionalBallot,
+            "input": {"parsed_cvr": {"ranks": stv_ranks}, "n_winners": 2},
+            "expected": {
+                "winner": "A, C",
+                "n_rounds": 5,
+                # after A is elected, E and D together hold 3 votes, fewer than C's 5. B is left as the single loser
+                # of the next round, leaving as many candidates as seats.
+                "batch_n_rounds": 4,
+                "batch_rounds_eliminated": {"B": 3, "D": 2, "E": 2},
+                "batch_transfers": {"A": 0, "B": 0, "C": 3, "D": -2, "E": -1, "exhaust": 0},
+            },
+        }
+    ),
+    (
+        {
+            "rcv_type": STVGregory,
+            "input": {"parsed_cvr": {"ranks": stv_ranks}, "n_winners": 2},
+            "expected": {
+                "winner": "A, C",
+                "n_rounds": 5,
+                "batch_n_rounds": 4,
+                "batch_rounds_eliminated": {"B": 3, "D": 2, "E": 2},
+                "batch_transfers": {"A": 0, "B": 0, "C": 3, "D": -2, "E": -1, "exhaust": 0},
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_batch_elimination(param):
+
+    rcv = param["rcv_type"](**param["input"])
+    stats = rcv.get_stats()[0]
+    assert stats["winner"].item() == param["expected"]["winner"]
+    assert stats["n_rounds"].item() == param["expected"]["n_rounds"]
+    assert not stats["batch_elimination"].item()
+
+    batch_rcv = param["rcv_type"](**param["input"], batch_elimination=True)
+    batch_stats = batch_rcv.get_stats()[0]
+    assert batch_stats["winner"].item() == param["expected"]["winner"]
+    assert batch_stats["n_rounds"].item() == param["expected"]["batch_n_rounds"]
+    assert batch_stats["batch_elimination"].item()
+
+    rounds_eliminated = {
+        d["name"]: d["round_eliminated"] for d in batch_rcv.get_candidate_outcomes() if d["round_eliminated"]
+    }
+    assert rounds_eliminated == param["expected"]["batch_rounds_eliminated"]
+
+    transfers = batch_rcv.get_round_transfer_dict(min(rounds_eliminated.values()))
+    assert transfers == pytest.approx(param["expected"]["batch_transfers"])
+
+
+def test_batch_elimination_meek():
+
+    rcv = STVMeek(parsed_cvr={"ranks": stv_ranks}, n_winners=2, batch_elimination=True)
+    outcomes = {d["name"]: d for d in rcv.get_candidate_outcomes()}
+
+    assert outcomes["D"]["round_eliminated"] == outcomes["E"]["round_eliminated"]
+    assert {cand for cand, d in outcomes.items() if d["round_elected"]} == {"A", "C"}
+    assert rcv.get_round_transfer_dict(outcomes["D"]["round_eliminated"]) == pytest.approx(
+        {"A": 0, "B": 0, "C": 3, "D": -2, "E": -1, "exhaust": 0}
+    )
+
+
+def test_batch_elimination_bottoms_up():
+
+    with pytest.raises(RuntimeError):
+        BottomsUpThresh(parsed_cvr={"ranks": stv_ranks}, n_winners=2, bottoms_up_threshold=0.1, batch_elimination=True)
@@ -0,0 +1,188 @@
+import random
+
+import pandas as pd
+import pytest
+
+from rcv_cruncher.cvr.base import CastVoteRecord
+from rcv_cruncher.marks import BallotMarks
+from rcv_cruncher.rcv.base import RCV
+from rcv_cruncher.rcv.variants import SingleWinner, STVFractionalBallot, STVMeek, STVWholeBallot
+import rcv_cruncher.sweep
+from rcv_cruncher.sweep import rule_set_grid, sweep_rule_sets, write_rule_set_sweep
+
+sweep_ranks = [
+    ["A", "B", "C", "D"],
+    ["A", "C", BallotMarks.SKIPPED, "E"],
+    ["B", "F", "G", "A"],
+    ["B", BallotMarks.OVERVOTE, "C", "D"],
+    ["C", "G", "F", "E"],
+    ["C", "A", "A", "B"],
+    ["D", "E", "F", "G"],
+    ["D", "G", BallotMarks.SKIPPED, BallotMarks.SKIPPED],
+    ["E", "D", "B", "A"],
+    ["F", "G", "E", "D"],
+    ["G", "F", "write-in", "C"],
+    ["write-in", "E", "D", "A"],
+    ["Write In", BallotMarks.SKIPPED, "B", "G"],
+    [BallotMarks.SKIPPED, "F", "E", "C"],
+    [BallotMarks.OVERVOTE, "A", "B", "C"],
+    ["A", "A", BallotMarks.SKIPPED, "G"],
+]
+
+params = [
+    (
+        {
+            "rcv_type": SingleWinner,
+            "contest_args": {},
+            "options": {
+                "exhaust_on_overvote_marks": [False, True],
+                "exhaust_on_N_repeated_skipped_marks": [0, 1],
+                "exhaust_on_duplicate_candidate_marks": [False, True],
+            },
+        }
+    ),
+    (
+        {
+            "rcv_type": SingleWinner,
+            "contest_args": {},
+            "options": {
+                "combine_writein_marks": [False, True],
+                "treat_combined_writeins_as_exhaustable_duplicates": [False, True],
+                "exhaust_on_duplicate_candidate_marks": [True],
+            },
+        }
+    ),
+    (
+        {
+            "rcv_type": STVFractionalBallot,
+            "contest_args": {"n_winners": 3},
+            "options": {
+                "exhaust_on_overvote_marks": [False, True],
+                "exhaust_on_N_repeated_skipped_marks": [0, 1],
+            },
+        }
+    ),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_sweep_rule_sets(param):
+
+    cvr = CastVoteRecord(parsed_cvr={"ranks": sweep_ranks, "weight": [1] * len(sweep_ranks)})
+    rule_sets = rule_set_grid(**param["options"])
+
+    n_combinations = 1
+    for values in param["options"].values():
+        n_combinations *= len(values)
+    assert len(rule_sets) == n_combinations
+
+    df = sweep_rule_sets(
+        cvr, rule_sets, rcv_type=param["rcv_type"], contest_args=param["contest_args"], random_seed=0
+    )
+    assert df["rule_set_num"].tolist() == list(range(1, len(rule_sets) + 1))
+
+    # each row matches the same rule set tabulated on its own
+    for rule_set_num, rule_set in enumerate(rule_sets, start=1):
+
+        random.seed(rule_set_num)
+        rcv = param["rcv_type"](
+            parsed_cvr={"ranks": sweep_ranks, "weight": [1] * len(sweep_ranks)},
+            **param["contest_args"],
+            **rule_set,
+        )
+        stats = rcv.get_stats()[0]
+        row = df.loc[df["rule_set_num"] == rule_set_num].iloc[0]
+
+        for option, value in rule_set.items():
+            assert row[option] == value
+        assert row["winner"] == stats["winner"].item()
+        assert row["n_rounds"] == stats["n_rounds"].item()
+        for col in [col for col in df.columns if col.startswith("total_")]:
+            assert row[col] == stats[col].item()
+
+    # spreading the rule sets over processes does not change the results
+    pool_df = sweep_rule_sets(
+        cvr, rule_sets, rcv_type=param["rcv_type"], contest_args=param["contest_args"], random_seed=0, n_processes=2
+    )
+    pd.testing.assert_frame_equal(df, pool_df)
+
+
+params = [
+    ({"rule_set": {"exclude_overvote_marks": False}}),
+    ({"rule_set": {"exhaust_on_overvote": True}}),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_sweep_rule_sets_invalid(param):
+
+    cvr = CastVoteRecord(parsed_cvr={"ranks": sweep_ranks})
+    with pytest.raises(RuntimeError):
+        sweep_rule_sets(cvr, [{}, param["rule_set"]])
+
+
+def test_write_rule_set_sweep(tmp_path):
+
+    random.seed(0)
+    rcv = SingleWinner(parsed_cvr={"ranks": sweep_ranks}, jurisdiction="city", date="11/03/2020", office="mayor")
+    write_rule_set_sweep(rcv, tmp_path, {"exhaust_on_overvote_marks": [False, True]})
+
+    df = pd.read_csv(tmp_path / "rule_set_sweep" / f"{rcv.unique_id}.csv")
+    assert df["exhaust_on_overvote_marks"].tolist() == [False, True]
+
+
+class UnaggregatedSingleWinner(SingleWinner):
+    """SingleWinner that takes disable_aggregation as an argument."""
+
+    def __init__(self, disable_aggregation: bool = False, **kwargs) -> None:
+        RCV.__init__(self, disable_aggregation=disable_aggregation, **kwargs)
+
+
+params = [
+    ({"rcv_type": SingleWinner, "contest_args": {"combine_writein_marks": False}}),
+    (
+        {
+            "rcv_type": SingleWinner,
+            "contest_args": {"exhaust_on_duplicate_candidate_marks": True, "exhaust_on_N_repeated_skipped_marks": 1},
+        }
+    ),
+    ({"rcv_type": STVWholeBallot, "contest_args": {"n_winners": 2, "combine_writein_marks": False}}),
+    ({"rcv_type": UnaggregatedSingleWinner, "contest_args": {"disable_aggregation": True}}),
+    ({"rcv_type": STVMeek, "contest_args": {"n_winners": 2, "convergence_tolerance": 0.001}}),
+]
+
+
+@pytest.mark.parametrize("param", params)
+def test_write_rule_set_sweep_contest_rules(param, tmp_path, monkeypatch):
+
+    # record the contest arguments every rule set is tabulated with
+    sweep_contest_args = []
+
+    def recorded_sweep_rule_sets(*args, **kwargs):
+        sweep_contest_args.append(kwargs["contest_args"])
+        return sweep_rule_sets(*args, **kwargs)
+
+    monkeypatch.setattr(rcv_cruncher.sweep, "sweep_rule_sets", recorded_sweep_rule_sets)
+
+    random.seed(0)
+    rcv = param["rcv_type"](
+        parsed_cvr={"ranks": sweep_ranks},
+        jurisdiction="city",
+        date="11/03/2020",
+        office="mayor",
+        **param["contest_args"],
+    )
+    write_rule_set_sweep(rcv, tmp_path, {"exhaust_on_overvote_marks": [True]})
+
+    # options that are not swept keep the contest's own rules
+    df = pd.read_csv(tmp_path / "rule_set_sweep" / f"{rcv.unique_id}.csv")
+    contest_rules = rcv._rule_sets[rcv._contest_rule_set_name]
+    kept_options = ["combine_writein_marks", "exhaust_on_duplicate_candidate_marks", "exhaust_on_N_repeated_skipped_marks"]
+    for option in kept_options:
+        assert df[option].tolist() == [contest_rules[option]]
+    assert df["exhaust_on_overvote_marks"].tolist() == [True]
+
+    # variant specific arguments are passed on
+    for arg_name in ["disable_aggregation", "convergence_tolerance"]:
+        if arg_name in param["contest_args"]:
+            assert sweep_contest_args[0][arg_name] == param["contest_args"][arg_name]